@@ -1,21 +1,19 @@
-import os
 import pandas as pd
 from datetime import datetime, timezone
-from supabase import create_client, Client
-from dotenv import load_dotenv
-from pathlib import Path
 
-# --- 환경 변수 로드 ---
-env_path = Path(__file__).resolve().parent.parent / ".env"
-load_dotenv(env_path)
-
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")  # .env 파일의 키 이름에 맞춤
+from cycle_chunks import (
+    CHUNK_DIR,
+    load_chunk_rows,
+    merge_chunk_rows,
+    publish_cycle_chunks,
+    rows_summary,
+)
+from cycle_cube import CycleCube
+from cycle_loader import get_cache_key, load_cycle_cube
+from cycle_peaks import detect_cycles, open_cycle_peak
+from cycle_storage import CycleStorage, get_storage
 
 # --- 설정 ---
-OHLCV_TABLE_NAME = "ohlcv_1day"
-CYCLE_TABLE_NAME = "bitcoin_cycle_data"
-
 ONE_DAY_MS = 86400000
 SEVEN_DAYS_MS = 7 * ONE_DAY_MS
 THREE_YEARS_MS = int(3 * 365.25 * 24 * 60 * 60 * 1000)
@@ -28,16 +26,10 @@ KNOWN_PEAK_DATES = {
     1: "2013/12/04",  # $1,237
     2: "2017/12/15",  # $19,783
     3: "2021/11/08",  # $67,525
-    # 4: 자동 탐지
+    # 4~: 자동 탐지 (cycle_peaks.detect_cycles)
 }
 
 
-def get_supabase_client() -> Client:
-    if not SUPABASE_URL or not SUPABASE_KEY:
-        raise ValueError("SUPABASE_URL과 SUPABASE_KEY 환경변수를 설정하세요")
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
-
-
 def ms_to_date(timestamp_ms):
     return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).strftime(
         "%Y/%m/%d"
@@ -49,23 +41,20 @@ def date_to_ms(date_str):
     return int(dt.timestamp() * 1000)
 
 
-def normalize_timestamp(ts):
-    return ts * 1000 if ts < 10000000000 else ts
+def get_current_cycle(storage: CycleStorage):
+    """진행 중인(마지막) 사이클 번호와 마지막 저장된 timestamp 조회"""
+    summary = storage.get_cycle_summary()
+    if not summary:
+        return None, None
+    row = max(summary, key=lambda r: r["cycle_number"])
+    return row["cycle_number"], row["last_timestamp"]
 
 
-def get_last_saved_info(supabase: Client):
-    """Cycle 4의 마지막 저장된 timestamp 조회"""
-    response = (
-        supabase.table(CYCLE_TABLE_NAME)
-        .select("timestamp")
-        .eq("cycle_number", 4)
-        .order("days_since_peak", desc=True)
-        .limit(1)
-        .execute()
-    )
+def get_last_saved_info(storage: CycleStorage):
+    """진행 중인 사이클의 마지막 저장된 timestamp 조회"""
+    _, timestamp_str = get_current_cycle(storage)
 
-    if response.data and len(response.data) > 0:
-        timestamp_str = response.data[0]["timestamp"]
+    if timestamp_str:
         try:
             return date_to_ms(timestamp_str), timestamp_str
         except:
@@ -73,18 +62,11 @@ def get_last_saved_info(supabase: Client):
     return None, None
 
 
-def get_cycle4_peak_info(supabase: Client):
-    """Cycle 4의 Peak 정보 조회"""
-    response = (
-        supabase.table(CYCLE_TABLE_NAME)
-        .select("timestamp, close_price")
-        .eq("cycle_number", 4)
-        .eq("days_since_peak", 0)
-        .execute()
-    )
+def get_cycle_peak_info(storage: CycleStorage, cycle_num):
+    """사이클의 Peak 정보 조회"""
+    row = storage.get_cycle_peak_row(cycle_num)
 
-    if response.data and len(response.data) > 0:
-        row = response.data[0]
+    if row:
         try:
             return date_to_ms(row["timestamp"]), row["close_price"]
         except:
@@ -92,56 +74,11 @@ def get_cycle4_peak_info(supabase: Client):
     return None, None
 
 
-def get_ohlcv_data(supabase: Client, from_timestamp_ms=None):
-    """OHLCV 데이터 조회"""
-    query = supabase.table(OHLCV_TABLE_NAME).select("timestamp, close, low, high")
-
-    if from_timestamp_ms:
-        query = query.gte("timestamp", from_timestamp_ms)
-
-    # Supabase는 기본 1000개 제한이 있으므로 페이지네이션 필요
-    all_data = []
-    offset = 0
-    batch_size = 1000
-
-    while True:
-        response = (
-            query.order("timestamp", desc=False)
-            .range(offset, offset + batch_size - 1)
-            .execute()
-        )
-
-        if not response.data:
-            break
-
-        all_data.extend(response.data)
-
-        if len(response.data) < batch_size:
-            break
-
-        offset += batch_size
-
-    if not all_data:
-        return pd.DataFrame()
-
-    df = pd.DataFrame(all_data)
-    df["timestamp"] = df["timestamp"].apply(normalize_timestamp)
-    return df
-
-
-def find_peak(df, start_ts, end_ts=None):
-    """특정 기간 내 Peak 찾기"""
-    mask = df["timestamp"] >= start_ts
-    if end_ts:
-        mask &= df["timestamp"] <= end_ts
-    period_df = df[mask]
-
-    if period_df.empty:
-        return None, None
-
-    max_close = period_df["close"].astype(float).max()
-    peak_row = period_df[period_df["close"] == max_close].iloc[0]
-    return peak_row["timestamp"], peak_row["close"]
+def get_cycle_name(cycle_num, peak_date=None):
+    """사이클 이름 (CYCLE_NAMES에 없으면 Peak 연도로 생성)"""
+    if cycle_num in CYCLE_NAMES:
+        return CYCLE_NAMES[cycle_num]
+    return f"{str(peak_date)[:4]} Cycle" if peak_date else f"Cycle {cycle_num}"
 
 
 def calculate_cycle_data(df, peak_ts, peak_close, cycle_num, end_ts=None):
@@ -178,39 +115,73 @@ def calculate_cycle_data(df, peak_ts, peak_close, cycle_num, end_ts=None):
     ]
 
 
+def build_cycle_rows(df, peak_ts, peak_close, cycle_num, cycle_name):
+    """OHLCV -> 사이클 Long format 행 계산 (벡터 연산, Peak 이전 행 제외)"""
+    df = df[df["timestamp"] >= peak_ts]
+    close = df["close"].astype(float)
+    low = df["low"].astype(float)
+    high = df["high"].astype(float)
+
+    return pd.DataFrame(
+        {
+            "cycle_number": cycle_num,
+            "cycle_name": cycle_name,
+            "days_since_peak": ((df["timestamp"] - peak_ts) // ONE_DAY_MS).astype(int),
+            "timestamp": pd.to_datetime(df["timestamp"], unit="ms", utc=True).dt.strftime(
+                "%Y/%m/%d"
+            ),
+            "close_price": close,
+            "low_price": low,
+            "high_price": high,
+            "close_rate": close / peak_close * 100,
+            "low_rate": low / peak_close * 100,
+            "high_rate": high / peak_close * 100,
+        }
+    ).reset_index(drop=True)
+
+
 def find_all_peaks(df):
-    """모든 사이클의 Peak 찾기 (알려진 날짜 사용)"""
-    peaks = []
+    """
+    모든 사이클의 Peak 찾기 (알려진 날짜 고정 + 이후 사이클 자동 탐지) -> [(사이클 번호, Peak ts, 종가)]
+    - 사이클 번호는 KNOWN_PEAK_DATES 키 기준 (데이터가 첫 Peak 이후에 시작하면 데이터가 있는 첫 Peak 번호부터)
+    - 데이터 범위 안의 알려진 Peak 날짜에 데이터가 없으면 번호를 정할 수 없으므로 중단
+    """
+    first_ts = int(df["timestamp"].min())
+    last_ts = int(df["timestamp"].max())
+    pinned = {}
+    for cycle_num, peak_date in sorted(KNOWN_PEAK_DATES.items()):
+        peak_ts = date_to_ms(peak_date)
+        if (df["timestamp"] == peak_ts).any():
+            pinned[cycle_num] = peak_ts
+        elif peak_ts < first_ts:
+            print(f"[INFO] Cycle {cycle_num} Peak({peak_date})는 데이터 시작 이전 → 건너뜀")
+        elif peak_ts > last_ts:
+            print(f"[INFO] Cycle {cycle_num} Peak({peak_date})는 데이터 끝 이후 → 건너뜀")
+        else:
+            raise ValueError(f"Cycle {cycle_num} Peak 날짜({peak_date})에 데이터 없음")
+    if not pinned:
+        raise ValueError("데이터 범위에 알려진 Peak 날짜가 없어 사이클 번호를 정할 수 없음")
+
+    cycles = detect_cycles(
+        df["timestamp"].to_numpy(),
+        df["close"].astype(float).to_numpy(),
+        list(pinned.values()),
+        THREE_YEARS_MS,
+        first_cycle_number=min(pinned),
+    )
 
-    # Cycle 1-3: 알려진 Peak 날짜 사용
-    for cycle_num in [1, 2, 3]:
-        if cycle_num in KNOWN_PEAK_DATES:
-            peak_date = KNOWN_PEAK_DATES[cycle_num]
-            peak_ts = date_to_ms(peak_date)
-            # 해당 날짜의 close 가격 찾기
-            peak_row = df[df["timestamp"] == peak_ts]
-            if not peak_row.empty:
-                peak_close = float(peak_row["close"].iloc[0])
-                peaks.append((peak_ts, peak_close))
-                print(
-                    f"[INFO] Cycle {cycle_num} Peak: {peak_date} @ ${peak_close:,.2f}"
-                )
-            else:
-                print(f"[WARN] Cycle {cycle_num} Peak 날짜({peak_date})에 데이터 없음")
-
-    # Cycle 4: 2021 Peak 이후 3년 뒤부터 자동 탐지
-    if len(peaks) >= 3:
-        cycle3_peak_ts = peaks[2][0]
-        search_start = cycle3_peak_ts + THREE_YEARS_MS
-        max_ts = df["timestamp"].max()
-
-        if search_start < max_ts:
-            peak_ts, peak_close = find_peak(df, search_start, max_ts)
-            if peak_ts:
-                peaks.append((peak_ts, peak_close))
-                print(
-                    f"[INFO] Cycle 4 Peak: {ms_to_date(peak_ts)} @ ${peak_close:,.2f}"
-                )
+    detected = {cycle["cycle_number"]: cycle["peak_ts"] for cycle in cycles}
+    for cycle_num, peak_ts in pinned.items():
+        if detected.get(cycle_num) != peak_ts:
+            raise ValueError(f"Cycle {cycle_num} Peak가 탐지 결과의 사이클 번호와 맞지 않음")
+
+    peaks = []
+    for cycle in cycles:
+        peaks.append((cycle["cycle_number"], cycle["peak_ts"], cycle["peak_close"]))
+        print(
+            f"[INFO] Cycle {cycle['cycle_number']} Peak: {ms_to_date(cycle['peak_ts'])} "
+            f"@ ${cycle['peak_close']:,.2f}"
+        )
 
     return peaks
 
@@ -218,11 +189,22 @@ def find_all_peaks(df):
 def convert_to_long_format(result_df):
     """Wide format -> Long format 변환"""
     long_data = []
+    cycle_nums = sorted(
+        int(col.split("_")[0]) for col in result_df.columns if col.endswith("_timestamp")
+    )
+    peak_row = result_df[result_df["Days_Since_Peak"] == 0]
+    cycle_names = {
+        cycle_num: get_cycle_name(
+            cycle_num,
+            peak_row[f"{cycle_num}_timestamp"].iloc[0] if not peak_row.empty else None,
+        )
+        for cycle_num in cycle_nums
+    }
 
     for _, row in result_df.iterrows():
         days_since_peak = row["Days_Since_Peak"]
 
-        for cycle_num in [1, 2, 3, 4]:
+        for cycle_num in cycle_nums:
             ts_col = f"{cycle_num}_timestamp"
             close_col = f"{cycle_num}_close"
             if (
@@ -235,7 +217,7 @@ def convert_to_long_format(result_df):
                 long_data.append(
                     {
                         "cycle_number": cycle_num,
-                        "cycle_name": CYCLE_NAMES[cycle_num],
+                        "cycle_name": cycle_names[cycle_num],
                         "days_since_peak": days_since_peak,
                         "timestamp": str(row[ts_col]).strip(),
                         "close_price": row.get(f"{cycle_num}_close"),
@@ -250,64 +232,64 @@ def convert_to_long_format(result_df):
     return pd.DataFrame(long_data)
 
 
-def save_full_data(supabase: Client, result_df):
-    """전체 데이터 저장 (기존 데이터 삭제 후 저장)"""
+def save_full_data(storage: CycleStorage, result_df):
+    """전체 데이터 저장 (기존 데이터 삭제 후 저장) -> 저장한 Long format 행"""
     long_df = convert_to_long_format(result_df)
     if long_df.empty:
-        return
+        return None
 
-    # 기존 데이터 삭제
-    for cycle_num in [1, 2, 3, 4]:
-        supabase.table(CYCLE_TABLE_NAME).delete().eq(
-            "cycle_number", cycle_num
-        ).execute()
+    # 데이터 시작 이전 사이클(첫 번호 미만)은 이 데이터로 다시 만들 수 없으므로 유지
+    first_cycle = long_df["cycle_number"].min()
+    cycle_nums = sorted(
+        set(long_df["cycle_number"].unique().tolist())
+        | {
+            row["cycle_number"]
+            for row in storage.get_cycle_summary()
+            if row["cycle_number"] >= first_cycle
+        }
+    )
 
-    # 배치로 저장 (Supabase는 한 번에 너무 많은 데이터 삽입 시 문제 발생 가능)
-    batch_size = 500
-    records = long_df.to_dict("records")
+    # 기존 데이터 삭제
+    for cycle_num in cycle_nums:
+        storage.delete_cycle_rows(cycle_num)
 
-    for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
-        supabase.table(CYCLE_TABLE_NAME).upsert(batch).execute()
+    storage.upsert_cycle_rows(long_df.to_dict("records"))
 
     print(f"총 {len(long_df)}개 레코드 저장")
-    for cycle_num in [1, 2, 3, 4]:
+    for cycle_num in cycle_nums:
         count = len(long_df[long_df["cycle_number"] == cycle_num])
         if count > 0:
             print(f"  - Cycle {cycle_num}: {count}개")
+    return long_df
 
 
-def save_incremental_data(supabase: Client, df):
+def save_incremental_data(storage: CycleStorage, df):
     """증분 데이터 저장"""
     if df is None or df.empty:
         return 0
 
-    records = df.to_dict("records")
-    supabase.table(CYCLE_TABLE_NAME).upsert(records).execute()
-
-    return len(records)
+    return storage.upsert_cycle_rows(df.to_dict("records"))
 
 
-def run_full_analysis(supabase: Client):
-    """전체 분석 실행"""
+def run_full_analysis(storage: CycleStorage):
+    """전체 분석 실행 -> 저장한 행 (없으면 None)"""
     print("\n=== 전체 분석 모드 ===")
 
-    df = get_ohlcv_data(supabase)
+    df = storage.fetch_ohlcv()
     if df.empty:
         print("데이터 없음")
-        return False
+        return None
 
     print(f"총 {len(df)}개 데이터 로드")
 
     peaks = find_all_peaks(df)
     if not peaks:
         print("[ERROR] Peak 없음")
-        return False
+        return None
 
     final_df = None
-    for i, (peak_ts, peak_close) in enumerate(peaks):
-        cycle_num = i + 1
-        end_ts = peaks[i + 1][0] - ONE_DAY_MS if i < len(peaks) - 1 else None
+    for i, (cycle_num, peak_ts, peak_close) in enumerate(peaks):
+        end_ts = peaks[i + 1][1] - ONE_DAY_MS if i < len(peaks) - 1 else None
         cycle_df = calculate_cycle_data(df, peak_ts, peak_close, cycle_num, end_ts)
 
         if final_df is None:
@@ -324,122 +306,162 @@ def run_full_analysis(supabase: Client):
     else:
         final_df["Days_Since_Peak"] = range(len(final_df))
 
-    save_full_data(supabase, final_df)
-    return True
+    return save_full_data(storage, final_df)
+
+
+def find_new_peak(df, peak_ts, peak_close):
+    """Peak 이후 기존 Peak 종가를 넘는 최고 종가 (없으면 None) - 전체 분석과 같은 open_cycle_peak 규칙"""
+    after_peak = df[df["timestamp"] > peak_ts]
+    if after_peak.empty:
+        return None
+
+    closes = after_peak["close"].astype(float).to_numpy()
+    idx = open_cycle_peak(closes)
+    if closes[idx] <= peak_close:
+        return None
+
+    row = after_peak.iloc[idx]
+    return int(row["timestamp"]), float(row["close"])
+
+
+def rescale_current_cycle(
+    storage: CycleStorage, cycle_num, old_peak_ts, new_peak_ts, new_peak_close
+):
+    """
+    Peak 변경 시 진행 중인 사이클 재계산 -> 저장한 행
+    - 새 Peak 기준으로 days_since_peak / rate 컬럼 재계산 후 해당 사이클만 삭제·일괄 저장
+    - 기존 Peak ~ 새 Peak 전날은 전체 분석과 같이 이전 사이클 끝에 추가
+      (이전 사이클의 기존 행은 그대로 - 뒤에 날짜만 붙음)
+    """
+    print(
+        f"[INFO] Cycle {cycle_num} Peak 변경: {ms_to_date(old_peak_ts)} → "
+        f"{ms_to_date(new_peak_ts)} @ ${new_peak_close:,.2f}"
+    )
+
+    df = storage.fetch_ohlcv(old_peak_ts)
+    cycle_rows = build_cycle_rows(
+        df,
+        new_peak_ts,
+        new_peak_close,
+        cycle_num,
+        get_cycle_name(cycle_num, ms_to_date(new_peak_ts)),
+    )
+
+    prev_peak_ts, prev_peak_close = get_cycle_peak_info(storage, cycle_num - 1)
+    if prev_peak_ts is not None:
+        moved_rows = build_cycle_rows(
+            df[df["timestamp"] < new_peak_ts],
+            prev_peak_ts,
+            prev_peak_close,
+            cycle_num - 1,
+            get_cycle_name(cycle_num - 1, ms_to_date(prev_peak_ts)),
+        )
+        moved = f"Cycle {cycle_num - 1}에 {len(moved_rows)}일 추가"
+    else:
+        # 첫 사이클이면 전체 분석과 같이 첫 Peak 이전 구간은 어느 사이클에도 속하지 않음
+        moved_rows = cycle_rows.iloc[:0]
+        moved = "이전 사이클 없음"
 
+    storage.delete_cycle_rows(cycle_num)
+    saved_rows = pd.concat([moved_rows, cycle_rows], ignore_index=True)
+    storage.upsert_cycle_rows(saved_rows.to_dict("records"))
+    print(f"  - Cycle {cycle_num}: {len(cycle_rows)}개 재계산 (이전 Peak 이후 구간: {moved})")
+    return saved_rows
 
-def run_incremental_update(supabase: Client, last_timestamp_ms):
-    """증분 업데이트 실행"""
+
+def run_incremental_update(storage: CycleStorage, last_timestamp_ms):
+    """증분 업데이트 실행 -> 저장한 행 (없으면 None)"""
     print("\n=== 증분 업데이트 모드 ===")
     print(f"마지막 저장: {ms_to_date(last_timestamp_ms)}")
 
-    peak_ts, peak_close = get_cycle4_peak_info(supabase)
+    cycle_num, _ = get_current_cycle(storage)
+    peak_ts, peak_close = get_cycle_peak_info(storage, cycle_num)
     if peak_ts is None:
-        print("[WARN] Cycle 4 Peak 없음 → 전체 분석")
-        return run_full_analysis(supabase)
+        print(f"[WARN] Cycle {cycle_num} Peak 없음 → 전체 분석")
+        return run_full_analysis(storage)
 
-    print(f"Cycle 4 Peak: {ms_to_date(peak_ts)} @ ${peak_close:,.2f}")
+    print(f"Cycle {cycle_num} Peak: {ms_to_date(peak_ts)} @ ${peak_close:,.2f}")
 
     from_ts = last_timestamp_ms - SEVEN_DAYS_MS
     from_date = ms_to_date(from_ts)
     print(f"재계산 시작: {from_date}")
 
-    # 기존 데이터 삭제 (해당 기간)
-    supabase.table(CYCLE_TABLE_NAME).delete().eq("cycle_number", 4).gte(
-        "timestamp", from_date
-    ).execute()
-
-    df = get_ohlcv_data(supabase, from_ts)
+    df = storage.fetch_ohlcv(from_ts)
     print(f"조회 데이터: {len(df)}개")
 
     if df.empty:
-        return True
-
-    result_data = []
-    for _, row in df.iterrows():
-        ts = row["timestamp"]
-        days_since_peak = int((ts - peak_ts) / ONE_DAY_MS)
-        if days_since_peak < 0:
-            continue
-
-        result_data.append(
-            {
-                "cycle_number": 4,
-                "cycle_name": CYCLE_NAMES[4],
-                "days_since_peak": days_since_peak,
-                "timestamp": ms_to_date(ts),
-                "close_price": float(row["close"]),
-                "low_price": float(row["low"]),
-                "high_price": float(row["high"]),
-                "close_rate": (float(row["close"]) / peak_close) * 100,
-                "low_rate": (float(row["low"]) / peak_close) * 100,
-                "high_rate": (float(row["high"]) / peak_close) * 100,
-            }
-        )
+        return None
 
-    saved = save_incremental_data(supabase, pd.DataFrame(result_data))
-    print(f"저장: {saved}개")
-    return True
+    # Peak + 3년 이후 데이터가 생기면 새 사이클 경계 → 전체 분석
+    if df["timestamp"].max() >= peak_ts + THREE_YEARS_MS:
+        print("[INFO] 새 사이클 탐지 구간 진입 → 전체 분석")
+        return run_full_analysis(storage)
 
+    new_peak = find_new_peak(df, peak_ts, peak_close)
+    if new_peak:
+        return rescale_current_cycle(storage, cycle_num, peak_ts, *new_peak)
 
-def print_summary(supabase: Client):
-    """사이클별 요약 출력"""
-    print("\n사이클별 요약:")
+    # 기존 데이터 삭제 (해당 기간)
+    storage.delete_cycle_rows(cycle_num, from_date)
 
-    for cycle_num in [1, 2, 3, 4]:
-        # 카운트
-        count_response = (
-            supabase.table(CYCLE_TABLE_NAME)
-            .select("*", count="exact")
-            .eq("cycle_number", cycle_num)
-            .execute()
-        )
+    result_df = build_cycle_rows(
+        df, peak_ts, peak_close, cycle_num, get_cycle_name(cycle_num, ms_to_date(peak_ts))
+    )
+    saved = save_incremental_data(storage, result_df)
+    print(f"저장: {saved}개")
+    return result_df
+
+
+def update_cycle_chunks(storage: CycleStorage, rows):
+    """
+    프론트엔드용 정적 청크 갱신 (CYCLE_CHUNK_DIR 지정 시)
+    - 기존 청크 + 이번에 저장한 행으로 만들고, 저장소 요약과 다를 때만(첫 실행 / 건너뛴 날) 전체 조회
+    """
+    existing = load_chunk_rows(CHUNK_DIR)
+    merged = merge_chunk_rows(existing, rows) if existing is not None else None
+    if merged is not None and rows_summary(merged) == get_cache_key(storage)[1:]:
+        cube = CycleCube.from_long(merged)
+    else:
+        print("[INFO] 기존 청크가 없거나 저장소와 다름 → 사이클 데이터 전체 조회")
+        cube = load_cycle_cube(storage)
+    publish_cycle_chunks(cube, CHUNK_DIR)
 
-        # 최소/최대 timestamp
-        min_response = (
-            supabase.table(CYCLE_TABLE_NAME)
-            .select("timestamp")
-            .eq("cycle_number", cycle_num)
-            .order("days_since_peak", desc=False)
-            .limit(1)
-            .execute()
-        )
 
-        max_response = (
-            supabase.table(CYCLE_TABLE_NAME)
-            .select("timestamp")
-            .eq("cycle_number", cycle_num)
-            .order("days_since_peak", desc=True)
-            .limit(1)
-            .execute()
-        )
+def print_summary(storage: CycleStorage):
+    """사이클별 요약 출력"""
+    print("\n사이클별 요약:")
 
-        count = count_response.count or 0
+    for row in storage.get_cycle_summary():
+        count = row["row_count"] or 0
         if count > 0:
-            min_ts = min_response.data[0]["timestamp"] if min_response.data else "N/A"
-            max_ts = max_response.data[0]["timestamp"] if max_response.data else "N/A"
-            print(f"  Cycle {cycle_num}: {count}개 ({min_ts} ~ {max_ts})")
+            min_ts = row["first_timestamp"] or "N/A"
+            max_ts = row["last_timestamp"] or "N/A"
+            print(f"  Cycle {row['cycle_number']}: {count}개 ({min_ts} ~ {max_ts})")
 
 
 def main():
-    print("=== Bitcoin 4년 주기 분석 (Supabase) ===\n")
+    print("=== Bitcoin 4년 주기 분석 ===\n")
 
     try:
-        supabase = get_supabase_client()
-        print("Supabase 연결 성공")
+        storage = get_storage()
+        print(f"저장소 연결 성공 ({storage.name})")
     except Exception as e:
-        print(f"[ERROR] Supabase 연결 실패: {e}")
+        print(f"[ERROR] 저장소 연결 실패: {e}")
         return
 
     try:
-        last_ts, _ = get_last_saved_info(supabase)
+        last_ts, _ = get_last_saved_info(storage)
 
         if last_ts is None:
-            run_full_analysis(supabase)
+            rows = run_full_analysis(storage)
         else:
-            run_incremental_update(supabase, last_ts)
+            rows = run_incremental_update(storage, last_ts)
+
+        print_summary(storage)
 
-        print_summary(supabase)
+        # 프론트엔드용 정적 청크 (끝난 사이클은 해시 이름으로 고정, 진행 중인 사이클은 tail만 갱신)
+        if CHUNK_DIR and rows is not None:
+            update_cycle_chunks(storage, rows)
         print("\n완료")
 
     except Exception as e:
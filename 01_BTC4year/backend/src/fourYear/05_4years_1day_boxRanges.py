@@ -0,0 +1,136 @@
+"""
+하락장 반등 박스 + 상승장 조정 박스 통합 분석 (일일 작업용)
+- 사이클 데이터를 한 번만 로드하고 사이클마다 box_engine.find_cycle_boxes로 한 번에 탐지
+- 결과는 bitcoin_box_ranges 테이블에 side별로 저장 (프론트엔드가 조회)
+- TIMEFRAME을 "4h" / "1h"로 바꾸면 SQLite 시간봉 캔들(intraday_cycle)로 탐지
+  (일봉에서 보이지 않는 장중 이탈 반영, param_set에 points_per_day가 추가되어 일봉 결과와 별도 저장)
+- box_config.REFINE_TIMEFRAME을 지정하면 일봉으로 탐지한 뒤 박스 이벤트 날짜의 시간봉만 조회하여
+  시작 / 극값 / 이탈 시각과 비율을 보정 (box_refine) - param_set에 refine=<timeframe>이 붙어 일봉 결과와 별도 저장
+- 차트(HTML)가 필요하면 03(bear) / 04(bull) 스크립트를 개별 실행
+"""
+
+import sqlite3
+import time
+
+from box_config import BOX_CONFIG, REFINE_TIMEFRAME
+from box_engine import find_cycle_boxes
+from box_publish import publish_boxes
+from box_refine import refine_boxes
+from box_table import BoxTable
+from cycle_loader import load_cycle_cube
+from cycle_storage import get_storage
+from intraday_cycle import TIMEFRAMES, build_intraday_cycles, get_cycle_peaks
+
+# ==================== 설정 ====================
+TIMEFRAME = "1d"  # "1d" / "4h" / "1h"
+
+
+def timeframe_config(config, timeframe):
+    """시간봉이면 side별 params에 points_per_day 추가 (기간 기준을 캔들 개수로 환산)"""
+    points_per_day = TIMEFRAMES[timeframe]["points_per_day"]
+    if points_per_day == 1:
+        return config
+    return {
+        side: {
+            **side_config,
+            "params": {**side_config["params"], "points_per_day": points_per_day},
+        }
+        for side, side_config in config.items()
+    }
+
+
+def load_cycle_arrays(cube, timeframe):
+    """사이클별 탐지 입력 배열 ({cycle_number: {days, dates, low_rate, high_rate}})"""
+    if TIMEFRAMES[timeframe]["table"] is None:
+        return {
+            int(cycle_num): cube.cycle_slice(cycle_num, ["low_rate", "high_rate"])
+            for cycle_num in cube.cycles
+        }
+    return build_intraday_cycles(cube, timeframe)
+
+
+def find_box_ranges(
+    arrays, cycle_num, config=BOX_CONFIG, refine_timeframe=None, peak_close=None
+):
+    """사이클 하나의 박스 탐지 -> {side: BoxTable} (Box_ID는 side별 1부터)
+
+    refine_timeframe: 지정하면 박스 이벤트 날짜의 시간봉만 조회하여 보정 (peak_close 필요)
+    """
+    raw_boxes = find_cycle_boxes(
+        arrays["days"], arrays["low_rate"], arrays["high_rate"], config
+    )
+
+    boxes = {
+        side: BoxTable.from_engine(
+            side,
+            cycle_num,
+            arrays["days"],
+            arrays["dates"],
+            arrays["low_rate"],
+            arrays["high_rate"],
+            [box for box in raw_boxes if box["side"] == side],
+        )
+        for side in config
+    }
+
+    if refine_timeframe:
+        for side, table in boxes.items():
+            boxes[side], candle_count = refine_boxes(
+                table,
+                refine_timeframe,
+                peak_close,
+                config[side]["params"]["break_threshold"],
+            )
+            if len(table):
+                print(f"   🔍 {side}: {refine_timeframe} 보정 (캔들 {candle_count}개 조회)")
+    return boxes
+
+
+def main():
+    print("=" * 60)
+    print("비트코인 사이클 박스권 통합 분석 (하락장 반등 + 상승장 조정)")
+    print("=" * 60)
+
+    try:
+        storage = get_storage()
+    except Exception as e:
+        print(f"[ERROR] 저장소 연결 실패: {e}")
+        return
+
+    cube = load_cycle_cube(storage)
+    if cube is None:
+        return
+    print(f"감지된 사이클: {cube.cycles.tolist()}")
+
+    start_time = time.time()
+    try:
+        cycle_arrays = load_cycle_arrays(cube, TIMEFRAME)
+    except (ValueError, sqlite3.Error) as e:
+        print(f"[ERROR] {TIMEFRAME} 캔들 로드 실패: {e}")
+        return
+    config = timeframe_config(BOX_CONFIG, TIMEFRAME)
+
+    refine_timeframe = REFINE_TIMEFRAME if TIMEFRAME == "1d" else None
+    peak_closes = {}
+    if refine_timeframe:
+        peak_closes = {
+            peak["cycle_number"]: peak["peak_close"] for peak in get_cycle_peaks(cube)
+        }
+
+    totals = {side: 0 for side in config}
+    for cycle_num, arrays in cycle_arrays.items():
+        print(f"\n📈 Cycle {cycle_num} 분석... ({TIMEFRAME}, {len(arrays['days'])}개)")
+        peak_close = peak_closes.get(cycle_num)
+        cycle_refine = refine_timeframe if peak_close else None
+        boxes = find_box_ranges(arrays, cycle_num, config, cycle_refine, peak_close)
+        for side, table in boxes.items():
+            print(f"   ✅ {side}: {len(table)}개 박스권 발견")
+            publish_boxes(storage, config[side]["params"], cycle_num, table, cycle_refine)
+            totals[side] += len(table)
+
+    summary = ", ".join(f"{side} {count}개" for side, count in totals.items())
+    print(f"\n✅ 총 {summary} ({time.time() - start_time:.2f}초)")
+
+
+if __name__ == "__main__":
+    main()
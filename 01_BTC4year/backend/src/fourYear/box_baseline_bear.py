@@ -0,0 +1,261 @@
+"""
+하락장 반등 박스 기준 구현 (golden 생성용, 수정 금지)
+- 배열 엔진(box_engine) 도입 전 03_4years_1day_boxRanges_bear.py의 iloc 기반 find_box_ranges를 그대로 옮긴 것
+  (커밋 e1fbe1365e28d3ac9697cf41840dc865bc2a8f3e, Supabase 조회 / 차트 코드는 제외)
+- box_goldens가 이 구현으로 goldens/box_bear_baseline.json을 생성
+"""
+
+# ==================== 설정 ====================
+RISE_THRESHOLD = 5.0  # 박스 인식을 위한 최소 상승률 (%)
+BREAK_THRESHOLD = 2.0  # 박스 이탈 기준 (%)
+MIN_DURATION_DAYS = 1  # 최소 박스 기간 (일)
+MAX_DURATION_DAYS = 420  # 최대 분석 기간 (일)
+MIN_DROP_FROM_PREV_HIGH = 3.0  # 이전 고점 대비 최소 하락률 (%) - 새 저점 인정 기준
+
+
+def get_column_names(cycle_num):
+    return {
+        "rate": f"{cycle_num}_rate",
+        "low_rate": f"{cycle_num}_low_rate",
+        "high_rate": f"{cycle_num}_high_rate",
+        "timestamp": f"{cycle_num}_timestamp",
+        "low": f"{cycle_num}_low",
+        "high": f"{cycle_num}_high",
+    }
+
+
+def validate_columns(cycle_data, cols, rate_col):
+    low_rate_col = (
+        cols["low_rate"] if cols["low_rate"] in cycle_data.columns else rate_col
+    )
+    high_rate_col = (
+        cols["high_rate"] if cols["high_rate"] in cycle_data.columns else rate_col
+    )
+    return low_rate_col, high_rate_col
+
+
+def find_rise_peak(cycle_data, start_idx, local_low, high_rate_col):
+    """저점 이후 5% 상승하는 고점 찾기"""
+    j = start_idx + 1
+    temp_max = local_low
+    temp_max_idx = start_idx
+
+    while j < len(cycle_data):
+        current_high = cycle_data.iloc[j][high_rate_col]
+        if current_high > temp_max:
+            temp_max = current_high
+            temp_max_idx = j
+        if temp_max - local_low >= RISE_THRESHOLD:
+            return True, temp_max, temp_max_idx
+        j += 1
+    return False, temp_max, temp_max_idx
+
+
+def find_box_end(
+    cycle_data,
+    local_low_idx,
+    local_low,
+    start_search_idx,
+    temp_max,
+    temp_max_idx,
+    low_rate_col,
+    high_rate_col,
+):
+    """박스 종료 지점 찾기 (저점 이탈 시)"""
+    break_threshold = local_low - (local_low * BREAK_THRESHOLD / 100)
+    max_search_idx = min(len(cycle_data), local_low_idx + MAX_DURATION_DAYS)
+
+    k = start_search_idx + 1
+    box_end_idx = start_search_idx
+    box_broken = False
+    max_high = temp_max
+    max_idx = temp_max_idx
+
+    while k < max_search_idx:
+        check_low = cycle_data.iloc[k][low_rate_col]
+        current_high = cycle_data.iloc[k][high_rate_col]
+
+        if check_low <= break_threshold:
+            box_end_idx = k
+            box_broken = True
+            break
+
+        if current_high > max_high:
+            max_high = current_high
+            max_idx = k
+        k += 1
+
+    if not box_broken:
+        box_end_idx = max_search_idx - 1 if k >= max_search_idx else len(cycle_data) - 1
+        box_broken = k >= max_search_idx
+
+    return box_end_idx, box_broken, max_high, max_idx
+
+
+def create_box_info(
+    box_id,
+    cycle_num,
+    cycle_data,
+    local_low_idx,
+    local_low,
+    max_idx,
+    max_high,
+    box_end_idx,
+    box_broken,
+    cols,
+):
+    rise_pct = max_high - local_low
+    return {
+        "Cycle": cycle_num,
+        "Box_ID": box_id,
+        "Start_Day": int(cycle_data.iloc[local_low_idx]["Days_Since_Peak"]),
+        "Start_Timestamp": cycle_data.iloc[local_low_idx][cols["timestamp"]],
+        "Start_Rate": round(local_low, 2),
+        "Peak_Day": int(cycle_data.iloc[max_idx]["Days_Since_Peak"]),
+        "Peak_Timestamp": cycle_data.iloc[max_idx][cols["timestamp"]],
+        "Peak_Rate": round(max_high, 2),
+        "End_Day": int(cycle_data.iloc[box_end_idx]["Days_Since_Peak"]),
+        "End_Timestamp": cycle_data.iloc[box_end_idx][cols["timestamp"]],
+        "End_Rate": round(cycle_data.iloc[box_end_idx][cols["low_rate"]], 2),
+        "Rise_Percent": round(rise_pct, 2),
+        "Duration_Days": int(
+            cycle_data.iloc[box_end_idx]["Days_Since_Peak"]
+            - cycle_data.iloc[local_low_idx]["Days_Since_Peak"]
+        ),
+        "Box_Broken": box_broken,
+    }
+
+
+def find_true_low_before_rise(cycle_data, start_idx, low_rate_col, high_rate_col):
+    """
+    5% 상승이 발생하기 전까지의 '진짜 최저점'을 찾는다.
+
+    핵심 로직:
+    1. start_idx부터 순회하면서 최저점을 계속 갱신
+    2. 최저점 이후의 날짜에서 5% 상승이 확인되면 그 최저점을 반환
+    3. 새로운 더 낮은 저점이 나오면 최저점을 갱신하고, 5% 상승 체크 리셋
+    """
+    if start_idx >= len(cycle_data):
+        return None, None
+
+    min_low = cycle_data.iloc[start_idx][low_rate_col]
+    min_low_idx = start_idx
+
+    j = start_idx
+    while j < len(cycle_data):
+        current_low = cycle_data.iloc[j][low_rate_col]
+        current_high = cycle_data.iloc[j][high_rate_col]
+
+        # 더 낮은 저점 발견 → 최저점 갱신
+        if current_low < min_low:
+            min_low = current_low
+            min_low_idx = j
+
+        # 최저점 이후의 날짜에서만 5% 상승 체크
+        # (최저점 당일은 체크하지 않음 - 같은 날 고점이 5% 높아도 그건 같은 캔들)
+        if j > min_low_idx:
+            if current_high - min_low >= RISE_THRESHOLD:
+                # 5% 상승 확인! 현재 최저점이 진짜 저점
+                return min_low, min_low_idx
+
+        j += 1
+
+    # 끝까지 갔는데 5% 상승이 없음
+    return None, None
+
+
+def find_box_ranges(cycle_data, cycle_num, rate_col):
+    """박스권 탐지 메인 함수"""
+    # 420일까지만 사용
+    cycle_data = cycle_data[cycle_data["Days_Since_Peak"] <= MAX_DURATION_DAYS].copy()
+
+    if len(cycle_data) < 50:
+        return []
+
+    cycle_data = cycle_data.reset_index(drop=True).copy()
+    cols = get_column_names(cycle_num)
+    low_rate_col, high_rate_col = validate_columns(cycle_data, cols, rate_col)
+
+    boxes = []
+    box_id = 0
+    i = 1
+    prev_box_high = 100  # 이전 박스의 고점 (첫 박스는 100%에서 시작)
+
+    while i < len(cycle_data):
+        # 1. 진짜 최저점 찾기 (5% 상승 전까지의 최저점)
+        local_low, local_low_idx = find_true_low_before_rise(
+            cycle_data, i, low_rate_col, high_rate_col
+        )
+
+        # 더 이상 유효한 저점 없음
+        if local_low is None:
+            break
+
+        # 2. 이전 고점 대비 충분히 하락했는지 체크
+        drop_from_prev_high = prev_box_high - local_low
+        if drop_from_prev_high < MIN_DROP_FROM_PREV_HIGH:
+            # 이전 고점에서 충분히 하락하지 않음 → 저점 이후부터 다시 탐색
+            i = local_low_idx + 1
+            continue
+
+        # 3. 5% 상승 고점 찾기
+        rise_achieved, temp_max, temp_max_idx = find_rise_peak(
+            cycle_data, local_low_idx, local_low, high_rate_col
+        )
+        if not rise_achieved:
+            i = local_low_idx + 1
+            continue
+
+        # 4. 박스 종료 지점 찾기
+        box_end_idx, box_broken, max_high, max_idx = find_box_end(
+            cycle_data,
+            local_low_idx,
+            local_low,
+            temp_max_idx,
+            temp_max,
+            temp_max_idx,
+            low_rate_col,
+            high_rate_col,
+        )
+
+        # 고점 인덱스 보정
+        if max_idx > box_end_idx:
+            max_high = cycle_data.iloc[local_low_idx : box_end_idx + 1][
+                high_rate_col
+            ].max()
+            max_idx = cycle_data.iloc[local_low_idx : box_end_idx + 1][
+                high_rate_col
+            ].idxmax()
+
+        # 5. 최소 기간 체크
+        box_duration = (
+            cycle_data.iloc[box_end_idx]["Days_Since_Peak"]
+            - cycle_data.iloc[local_low_idx]["Days_Since_Peak"]
+        )
+        if box_duration < MIN_DURATION_DAYS:
+            i = box_end_idx + 1
+            continue
+
+        # 6. 박스 저장
+        box_id += 1
+        boxes.append(
+            create_box_info(
+                box_id,
+                cycle_num,
+                cycle_data,
+                local_low_idx,
+                local_low,
+                max_idx,
+                max_high,
+                box_end_idx,
+                box_broken,
+                {**cols, "low_rate": low_rate_col},
+            )
+        )
+
+        # 다음 박스 탐색을 위해 현재 박스의 고점 저장
+        prev_box_high = max_high
+        i = box_end_idx + 1
+
+    print(f"   ✅ {len(boxes)}개 박스권 발견")
+    return boxes
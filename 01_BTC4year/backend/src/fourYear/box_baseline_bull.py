@@ -0,0 +1,219 @@
+"""
+상승장 조정 박스 기준 구현 (golden 생성용, 수정 금지)
+- 배열 엔진(box_engine) 도입 전 04_4years_1day_boxRanges_bull.py의 iloc 기반 find_box_ranges를 그대로 옮긴 것
+  (커밋 e1fbe1365e28d3ac9697cf41840dc865bc2a8f3e, Supabase 조회 / 차트 코드는 제외)
+- box_goldens가 이 구현으로 goldens/box_bull_baseline.json을 생성
+"""
+
+# ==================== 설정 ====================
+MIN_DAYS_FROM_PEAK = 420  # 420일부터 상승장 분석
+DROP_THRESHOLD = 5.0  # 하락률 5% 이상
+BREAK_THRESHOLD = 2.0  # 고점에서 2% 이상 상승 시 박스 종료
+MIN_DURATION_DAYS = 1
+LOOKBACK_DAYS = 10  # N일 범위에서 최고점일 때만 고점으로 인정
+
+
+def get_column_names(cycle_num):
+    return {
+        "rate": f"{cycle_num}_rate",
+        "low_rate": f"{cycle_num}_low_rate",
+        "high_rate": f"{cycle_num}_high_rate",
+        "timestamp": f"{cycle_num}_timestamp",
+        "low": f"{cycle_num}_low",
+        "high": f"{cycle_num}_high",
+    }
+
+
+def validate_columns(cycle_data, cols, rate_col):
+    low_rate_col = (
+        cols["low_rate"] if cols["low_rate"] in cycle_data.columns else rate_col
+    )
+    high_rate_col = (
+        cols["high_rate"] if cols["high_rate"] in cycle_data.columns else rate_col
+    )
+    return low_rate_col, high_rate_col
+
+
+def is_significant_high(cycle_data, idx, high_rate_col, lookback=LOOKBACK_DAYS):
+    """N일 범위에서 최고점인지 확인 (더 의미 있는 고점만 탐지)"""
+    if idx < lookback:
+        return False
+
+    current = cycle_data.iloc[idx][high_rate_col]
+
+    # 과거 N일 + 미래 N일 범위에서 최고점인지 확인
+    start = max(0, idx - lookback)
+    end = min(len(cycle_data), idx + lookback + 1)
+
+    range_max = cycle_data.iloc[start:end][high_rate_col].max()
+    return current >= range_max
+
+
+def find_drop_low(cycle_data, start_idx, local_high, low_rate_col):
+    """고점에서 5% 이상 하락하는 저점 탐지"""
+    j = start_idx + 1
+    temp_min = local_high
+    temp_min_idx = start_idx
+
+    while j < len(cycle_data):
+        current_low = cycle_data.iloc[j][low_rate_col]
+        if current_low < temp_min:
+            temp_min = current_low
+            temp_min_idx = j
+        if local_high - temp_min >= DROP_THRESHOLD:
+            return True, temp_min, temp_min_idx
+        j += 1
+    return False, temp_min, temp_min_idx
+
+
+def find_box_end(
+    cycle_data,
+    local_high_idx,
+    local_high,
+    start_search_idx,
+    temp_min,
+    temp_min_idx,
+    low_rate_col,
+    high_rate_col,
+):
+    """박스 종료 지점 찾기: 고점 재돌파(2% 이상) 시 종료"""
+    break_threshold = local_high + (local_high * BREAK_THRESHOLD / 100)
+    max_search_idx = len(cycle_data)  # 사이클 끝까지
+
+    k = start_search_idx + 1
+    box_end_idx = start_search_idx
+    box_broken = False
+    min_low = temp_min
+    min_idx = temp_min_idx
+
+    while k < max_search_idx:
+        check_high = cycle_data.iloc[k][high_rate_col]
+        current_low = cycle_data.iloc[k][low_rate_col]
+
+        if check_high >= break_threshold:
+            box_end_idx = k
+            box_broken = True
+            break
+
+        if current_low < min_low:
+            min_low = current_low
+            min_idx = k
+        k += 1
+
+    if not box_broken:
+        box_end_idx = len(cycle_data) - 1
+        box_broken = k >= max_search_idx
+
+    return box_end_idx, box_broken, min_low, min_idx
+
+
+def create_box_info(
+    box_id,
+    cycle_num,
+    cycle_data,
+    local_high_idx,
+    local_high,
+    min_idx,
+    min_low,
+    box_end_idx,
+    box_broken,
+    cols,
+):
+    drop_pct = local_high - min_low
+    return {
+        "Cycle": cycle_num,
+        "Box_ID": box_id,
+        "Start_Day": int(cycle_data.iloc[local_high_idx]["Days_Since_Peak"]),
+        "Start_Timestamp": cycle_data.iloc[local_high_idx][cols["timestamp"]],
+        "Start_Rate": round(local_high, 2),
+        "Low_Day": int(cycle_data.iloc[min_idx]["Days_Since_Peak"]),
+        "Low_Timestamp": cycle_data.iloc[min_idx][cols["timestamp"]],
+        "Low_Rate": round(min_low, 2),
+        "End_Day": int(cycle_data.iloc[box_end_idx]["Days_Since_Peak"]),
+        "End_Timestamp": cycle_data.iloc[box_end_idx][cols["timestamp"]],
+        "End_Rate": round(cycle_data.iloc[box_end_idx][cols["high_rate"]], 2),
+        "Drop_Percent": round(drop_pct, 2),
+        "Duration_Days": int(
+            cycle_data.iloc[box_end_idx]["Days_Since_Peak"]
+            - cycle_data.iloc[local_high_idx]["Days_Since_Peak"]
+        ),
+        "Box_Broken": box_broken,
+    }
+
+
+def find_box_ranges(cycle_data, cycle_num, rate_col):
+    # 420일 이후 데이터만 사용
+    cycle_data = cycle_data[cycle_data["Days_Since_Peak"] >= MIN_DAYS_FROM_PEAK].copy()
+
+    if len(cycle_data) < 20:
+        return []
+
+    cycle_data = cycle_data.reset_index(drop=True).copy()
+    cols = get_column_names(cycle_num)
+    low_rate_col, high_rate_col = validate_columns(cycle_data, cols, rate_col)
+
+    boxes = []
+    box_id = 0
+    i = LOOKBACK_DAYS  # N일 이후부터 탐색 시작
+
+    while i < len(cycle_data):
+        if not is_significant_high(cycle_data, i, high_rate_col):
+            i += 1
+            continue
+
+        local_high = cycle_data.iloc[i][high_rate_col]
+        local_high_idx = i
+
+        drop_achieved, temp_min, temp_min_idx = find_drop_low(
+            cycle_data, i, local_high, low_rate_col
+        )
+        if not drop_achieved:
+            i += 1
+            continue
+
+        box_end_idx, box_broken, min_low, min_idx = find_box_end(
+            cycle_data,
+            local_high_idx,
+            local_high,
+            temp_min_idx,
+            temp_min,
+            temp_min_idx,
+            low_rate_col,
+            high_rate_col,
+        )
+
+        if min_idx > box_end_idx:
+            min_low = cycle_data.iloc[local_high_idx : box_end_idx + 1][
+                low_rate_col
+            ].min()
+            min_idx = cycle_data.iloc[local_high_idx : box_end_idx + 1][
+                low_rate_col
+            ].idxmin()
+
+        box_duration = (
+            cycle_data.iloc[box_end_idx]["Days_Since_Peak"]
+            - cycle_data.iloc[local_high_idx]["Days_Since_Peak"]
+        )
+        if box_duration < MIN_DURATION_DAYS:
+            i = box_end_idx + 1
+            continue
+
+        box_id += 1
+        boxes.append(
+            create_box_info(
+                box_id,
+                cycle_num,
+                cycle_data,
+                local_high_idx,
+                local_high,
+                min_idx,
+                min_low,
+                box_end_idx,
+                box_broken,
+                {**cols, "high_rate": high_rate_col},
+            )
+        )
+        i = box_end_idx + 1
+
+    print(f"   ✅ {len(boxes)}개 조정 박스권 발견")
+    return boxes
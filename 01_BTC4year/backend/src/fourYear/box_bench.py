@@ -0,0 +1,227 @@
+"""
+박스권 엔진 회귀 / 벤치마크 하네스
+- golden: 기준 구현(iloc 기반 03 / 04)으로 만들어 커밋한 goldens/box_<side>_baseline.json (box_goldens)
+- check: ENGINES에 등록된 모든 엔진 결과가 golden과 완전히 같은지 확인 (다르면 AssertionError)
+- bench: 420일 / 1만 / 100만 포인트 합성 시계열에서 엔진별 실행 시간 측정
+- 결과는 커밋별 JSON(bench_results/<commit>.json)으로 저장하고 직전 결과 파일과 실행 시간 비교
+"""
+
+import json
+import multiprocessing
+import platform
+import queue
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from box_config import BEAR_PARAMS, BULL_PARAMS
+from box_engine import find_bear_boxes, find_bull_boxes, find_cycle_boxes
+from box_goldens import golden_cases, golden_records, load_goldens, synthetic_cycle
+from box_stream import BoxStream, data_digest
+
+# ==================== 설정 ====================
+BASE_DIR = Path(__file__).resolve().parent
+RESULT_DIR = BASE_DIR / "bench_results"
+
+BENCH_SIZES = [420, 10_000, 1_000_000]  # 벤치마크 포인트 수
+BENCH_ENGINES = ["box_engine", "box_stream"]
+BENCH_REPEAT = 3  # 1만 포인트 이하는 N번 중 최소 시간
+BENCH_TIMEOUT = 300  # 측정 1건 제한 시간 (초) - 초과하면 seconds=None으로 기록
+
+PARAMS = {"bear": BEAR_PARAMS, "bull": BULL_PARAMS}  # box_config (03 / 04 / 05와 같은 값)
+
+
+# ==================== 엔진 ====================
+def run_box_engine(mode, days, low, high, params):
+    find_boxes = find_bear_boxes if mode == "bear" else find_bull_boxes
+    return find_boxes(days, low, high, **params)
+
+
+def run_box_stream(mode, days, low, high, params):
+    """증분 경로: 1/4씩 늘어나는 시계열로 sync (마지막 결과)"""
+    stream = BoxStream(mode, params)
+    boxes = []
+    for end in np.linspace(0, len(low), 5).astype(int)[1:]:
+        boxes = stream.sync(days[:end], low[:end], high[:end])
+    return boxes
+
+
+def run_find_cycle_boxes(mode, days, low, high, params):
+    """통합 엔진: 입력 전체를 해당 side 구간으로 지정"""
+    if mode == "bear":
+        side_config = {"max_days": days[-1], "min_rows": 0, "params": params}
+    else:
+        side_config = {"min_days": days[0], "min_rows": 0, "params": params}
+    boxes = find_cycle_boxes(days, low, high, {mode: side_config})
+    return [{key: value for key, value in box.items() if key != "side"} for box in boxes]
+
+
+ENGINES = {
+    "box_engine": run_box_engine,
+    "box_stream": run_box_stream,
+    "find_cycle_boxes": run_find_cycle_boxes,
+}
+
+
+# ==================== golden / check ====================
+def check_engines(engines=ENGINES):
+    """엔진별 golden 비교 결과 ({engine: {passed, failed}}) - golden은 기준 구현의 임계값으로 실행"""
+    goldens = {mode: load_goldens(mode) for mode in ("bear", "bull")}
+    cases = {
+        name: (mode, arrays) for mode in goldens for name, arrays in golden_cases(mode).items()
+    }
+    report = {}
+    for engine_name, run in engines.items():
+        passed = 0
+        failed = []
+        for name, (mode, arrays) in cases.items():
+            golden = goldens[mode]["cases"][name]
+            # 합성 입력이 golden을 만들 때와 다르면 비교 자체가 무의미하므로 실패로 처리
+            if data_digest(*arrays) != golden["digest"]:
+                failed.append(name)
+                continue
+            boxes = run(mode, *arrays, goldens[mode]["params"])
+            if golden_records(mode, *arrays, boxes) == golden["boxes"]:
+                passed += 1
+            else:
+                failed.append(name)
+        report[engine_name] = {"passed": passed, "failed": failed}
+        print(f"   {'✅' if not failed else '❌'} {engine_name}: 통과 {passed}, 실패 {len(failed)}")
+    return report
+
+
+# ==================== bench ====================
+def bench_worker(result_queue, engine_name, mode, n, repeat):
+    """자식 프로세스: 합성 시계열에서 repeat번 실행 후 (최소 시간, 박스 수) 전달"""
+    arrays = synthetic_cycle(0, n)
+    elapsed = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        boxes = ENGINES[engine_name](mode, *arrays, PARAMS[mode])
+        elapsed.append(time.perf_counter() - start_time)
+    result_queue.put((min(elapsed), len(boxes)))
+
+
+def bench_one(engine_name, mode, n, repeat, timeout=BENCH_TIMEOUT):
+    """측정 1건을 자식 프로세스에서 실행 (제한 시간 초과 시 (None, None))"""
+    result_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=bench_worker, args=(result_queue, engine_name, mode, n, repeat)
+    )
+    process.start()
+    try:
+        return result_queue.get(timeout=timeout)
+    except queue.Empty:
+        return None, None
+    finally:
+        process.terminate()
+        process.join()
+
+
+def run_benchmarks(sizes=BENCH_SIZES, engine_names=BENCH_ENGINES):
+    """포인트 수별 엔진 실행 시간 (합성 시계열, 시드 0)"""
+    results = []
+    for n in sizes:
+        repeat = BENCH_REPEAT if n <= 10_000 else 1
+        for engine_name in engine_names:
+            for mode in ("bear", "bull"):
+                seconds, box_count = bench_one(engine_name, mode, n, repeat, BENCH_TIMEOUT)
+                results.append(
+                    {
+                        "engine": engine_name,
+                        "mode": mode,
+                        "points": n,
+                        "seconds": None if seconds is None else round(seconds, 6),
+                        "boxes": box_count,
+                    }
+                )
+                label = f"   ⏱️ {engine_name:<12} {mode} {n:>9,}개: "
+                if seconds is None:
+                    print(label + f"{BENCH_TIMEOUT}초 초과")
+                else:
+                    print(label + f"{seconds:.4f}초 (박스 {box_count}개)")
+    return results
+
+
+def get_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def write_results(report, bench, result_dir=RESULT_DIR):
+    """커밋별 결과 JSON 저장"""
+    result_dir.mkdir(parents=True, exist_ok=True)
+    commit = get_commit()
+    result = {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "check": report,
+        "bench": bench,
+    }
+    path = result_dir / f"{commit}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=1)
+    print(f"   📄 결과 저장: {path}")
+    return path
+
+
+def print_comparison(path, result_dir=RESULT_DIR):
+    """직전 결과 파일(다른 커밋)과 실행 시간 비교"""
+    previous = sorted(
+        (p for p in result_dir.glob("*.json") if p != path),
+        key=lambda p: p.stat().st_mtime,
+    )
+    if not previous:
+        return
+    with open(previous[-1], "r", encoding="utf-8") as f:
+        old = {
+            (r["engine"], r["mode"], r["points"]): r["seconds"]
+            for r in json.load(f)["bench"]
+        }
+    with open(path, "r", encoding="utf-8") as f:
+        new = json.load(f)["bench"]
+
+    print(f"\n📊 {previous[-1].stem} 대비")
+    for r in new:
+        old_seconds = old.get((r["engine"], r["mode"], r["points"]))
+        if old_seconds and r["seconds"] is not None:
+            print(
+                f"   {r['engine']:<12} {r['mode']} {r['points']:>9,}개: "
+                f"{old_seconds:.4f}초 -> {r['seconds']:.4f}초 "
+                f"(x{old_seconds / max(r['seconds'], 1e-9):.2f})"
+            )
+
+
+def main():
+    print("=" * 60)
+    print("박스권 엔진 회귀 / 벤치마크")
+    print("=" * 60)
+
+    print("\n🔍 golden 비교 (기준 구현)")
+    report = check_engines()
+
+    print("\n⏱️ 벤치마크")
+    bench = run_benchmarks(BENCH_SIZES, BENCH_ENGINES)
+
+    path = write_results(report, bench, RESULT_DIR)
+    print_comparison(path, RESULT_DIR)
+
+    failures = {name: r["failed"] for name, r in report.items() if r["failed"]}
+    assert not failures, f"golden과 다른 엔진 결과: {failures}"
+
+
+if __name__ == "__main__":
+    main()
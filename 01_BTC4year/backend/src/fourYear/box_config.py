@@ -0,0 +1,37 @@
+"""
+박스권 탐지 공통 설정 (03 / 04 / 05, box_sweep, box_bench가 함께 사용)
+- 임계값이 bitcoin_box_ranges의 param_set 키가 되므로 여기서 한 번만 정의
+- 프론트엔드(chartData.js)의 BEAR_CONFIG / BULL_CONFIG / BOX_REFINE_TIMEFRAME도 같은 값이어야
+  param_set으로 조회 가능 (tests/test_box_config.py에서 확인)
+"""
+
+# ==================== 하락장 반등 박스 ====================
+BEAR_MAX_DAYS = 420  # 최대 분석 기간 (일)
+BEAR_MIN_ROWS = 50  # 데이터가 이보다 적은 사이클은 건너뜀
+BEAR_PARAMS = dict(
+    rise_threshold=5.0,  # 박스 인식을 위한 최소 상승률 (%)
+    break_threshold=2.0,  # 박스 이탈 기준 (%)
+    min_duration_days=1,  # 최소 박스 기간 (일)
+    max_duration_days=BEAR_MAX_DAYS,
+    min_drop_from_prev_high=3.0,  # 이전 고점 대비 최소 하락률 (%) - 새 저점 인정 기준
+)
+
+# ==================== 상승장 조정 박스 ====================
+BULL_MIN_DAYS = 420  # 420일부터 상승장 분석
+BULL_MIN_ROWS = 20
+BULL_PARAMS = dict(
+    drop_threshold=5.0,  # 하락률 5% 이상
+    break_threshold=2.0,  # 고점에서 2% 이상 상승 시 박스 종료
+    min_duration_days=1,
+    lookback=10,  # N일 범위에서 최고점일 때만 고점으로 인정
+)
+
+# 05: 일봉 탐지 후 이벤트 날짜만 시간봉으로 보정 ("1h" / "4h", None이면 보정 안 함)
+# 보정 결과는 param_set 끝에 refine=<timeframe>을 붙여 저장 (프론트엔드 BOX_REFINE_TIMEFRAME과 같은 값)
+REFINE_TIMEFRAME = None
+
+# find_cycle_boxes 설정 (05)
+BOX_CONFIG = {
+    "bear": {"max_days": BEAR_MAX_DAYS, "min_rows": BEAR_MIN_ROWS, "params": BEAR_PARAMS},
+    "bull": {"min_days": BULL_MIN_DAYS, "min_rows": BULL_MIN_ROWS, "params": BULL_PARAMS},
+}
@@ -0,0 +1,464 @@
+"""
+박스권 탐지 엔진 (NumPy 배열 기반)
+- 입력: 경과일(days), 저가 비율(low), 고가 비율(high) 배열 - DataFrame / iloc 사용 없음
+- 출력: 박스별 인덱스와 비율 (start/peak/end) - 타임스탬프 등 표시용 정보는 호출 측에서 추가
+- 스칼라 순회 대신 구간 단위 누적 최소/최대와 첫 조건 위치 탐색으로 처리하여
+  시간봉(hourly)처럼 긴 시계열에서도 사용 가능
+- 상승장 엔진은 사이클마다 한 번 만든 sparse table(RangeExtremum)로
+  구간 최대/최소와 첫 돌파 위치를 조회
+- find_cycle_boxes(): 설정 하나로 하락장 반등 박스 + 상승장 조정 박스를 한 번에 탐지
+- 시간봉(4h / 1h)은 points_per_day로 일 단위 기간(최대 기간, lookback)을 캔들 개수로 환산
+  (days는 소수 일 단위 경과일, 최소 기간 비교는 계속 일 단위)
+"""
+
+import numpy as np
+
+SCAN_WINDOW = 64  # 앞에서부터 조건 위치를 찾는 검사의 첫 구간 크기 (못 찾으면 두 배씩)
+
+
+def shift_box(box, offset):
+    """부분 배열 기준 인덱스 -> 원래 시계열 기준 인덱스"""
+    return {
+        key: value + offset if key.endswith("_idx") else value
+        for key, value in box.items()
+    }
+
+
+def first_true(mask):
+    """mask에서 처음 True인 위치 (없으면 -1)"""
+    idx = int(np.argmax(mask)) if len(mask) else 0
+    return idx if len(mask) and mask[idx] else -1
+
+
+class RangeExtremum:
+    """구간 최대/최소 인덱스 sparse table (O(n log n) 구축, 구간 조회 O(1))"""
+
+    def __init__(self, values, mode="max"):
+        self.values = np.asarray(values, dtype=float)
+        self.better = np.greater if mode == "max" else np.less
+
+        n = len(self.values)
+        self.levels = [np.arange(n)]
+        size = 1
+        while size * 2 <= n:
+            prev = self.levels[-1]
+            left = prev[: n - 2 * size + 1]
+            right = prev[size : n - size + 1]
+            # 같은 값이면 앞쪽 인덱스 유지 (idxmax / idxmin과 동일)
+            self.levels.append(
+                np.where(self.better(self.values[right], self.values[left]), right, left)
+            )
+            size *= 2
+
+    def index(self, lo, hi):
+        """[lo, hi] 구간의 최대(최소)값 첫 위치 - lo, hi는 스칼라 또는 배열"""
+        lo = np.asarray(lo)
+        hi = np.asarray(hi)
+        level = np.floor(np.log2(hi - lo + 1)).astype(int)
+        if level.ndim == 0:
+            table = self.levels[int(level)]
+            a = table[lo]
+            b = table[hi - (1 << int(level)) + 1]
+            return int(b if self.better(self.values[b], self.values[a]) else a)
+
+        a = np.empty(len(lo), dtype=int)
+        b = np.empty(len(lo), dtype=int)
+        for lv in np.unique(level):
+            sel = level == lv
+            a[sel] = self.levels[lv][lo[sel]]
+            b[sel] = self.levels[lv][hi[sel] - (1 << int(lv)) + 1]
+        return np.where(self.better(self.values[b], self.values[a]), b, a)
+
+    def value(self, lo, hi):
+        return self.values[self.index(lo, hi)]
+
+    def first_index(self, lo, hi, hit):
+        """[lo, hi]에서 hit(값)이 처음 참인 위치 (없으면 -1)
+
+        hit는 구간 최대(최소)값에 대해 참이면 구간 안에 참인 원소가 있는
+        단조 조건이어야 함 (예: 최소값 <= 기준, 최대값 >= 기준)
+        """
+        pos = lo
+        for level in range(len(self.levels) - 1, -1, -1):
+            size = 1 << level
+            if pos + size - 1 <= hi and not hit(self.value(pos, pos + size - 1)):
+                pos += size
+        return pos if pos <= hi and hit(self.values[pos]) else -1
+
+
+def find_true_low_before_rise(low, high, start_idx, rise_threshold):
+    """
+    start_idx 이후 rise_threshold 상승이 나오기 전까지의 '진짜 최저점'
+    -> (최저점, 최저점 인덱스, 상승 확인 인덱스), 없으면 (None, None, None)
+    - 최저점은 더 낮은 저점이 나올 때마다 갱신
+    - 상승 체크는 최저점 이후의 날짜에서만 (최저점 당일 고가는 제외)
+    - 앞쪽 SCAN_WINDOW개부터 두 배씩 늘려가며 검사 (비용이 조건 위치까지의 거리에 비례)
+    """
+    n = len(low)
+    if start_idx >= n:
+        return None, None, None
+
+    size = SCAN_WINDOW
+    while True:
+        end = min(n, start_idx + size)
+        seg_low = low[start_idx:end]
+        run_min = np.minimum.accumulate(seg_low)
+
+        # 최저점 위치: 직전 누적 최저값보다 작아진(strict) 마지막 위치
+        positions = np.arange(len(seg_low))
+        is_new_low = np.empty(len(seg_low), dtype=bool)
+        is_new_low[0] = True
+        is_new_low[1:] = seg_low[1:] < run_min[:-1]
+        min_pos = np.maximum.accumulate(np.where(is_new_low, positions, 0))
+
+        hit = first_true(
+            (positions > min_pos) & (high[start_idx:end] - run_min >= rise_threshold)
+        )
+        if hit >= 0:
+            return float(run_min[hit]), start_idx + int(min_pos[hit]), start_idx + hit
+        if end == n:
+            return None, None, None
+        size *= 2
+
+
+def find_rise_peak(high, start_idx, local_low, rise_threshold):
+    """저점 이후 rise_threshold 상승하는 고점 (달성 여부, 고점, 고점 인덱스)"""
+    n = len(high)
+    if start_idx + 1 >= n:
+        return False, local_low, start_idx
+
+    # 앞쪽 구간부터 두 배씩 늘려가며 검사 (없으면 마지막에 전체 구간)
+    size = SCAN_WINDOW
+    while True:
+        end = min(n, start_idx + 1 + size)
+        seg_high = high[start_idx + 1 : end]
+        run_max = np.maximum.accumulate(np.maximum(seg_high, local_low))
+        hit = first_true(run_max - local_low >= rise_threshold)
+        if hit >= 0 or end == n:
+            break
+        size *= 2
+    end = hit if hit >= 0 else len(seg_high) - 1
+
+    # 최초 최고값 위치 (local_low보다 클 때만 갱신)
+    if run_max[end] > local_low:
+        peak_idx = start_idx + 1 + int(np.argmax(seg_high[: end + 1]))
+    else:
+        peak_idx = start_idx
+    return hit >= 0, float(run_max[end]), peak_idx
+
+
+def find_box_end(
+    low,
+    high,
+    local_low_idx,
+    local_low,
+    start_search_idx,
+    temp_max,
+    temp_max_idx,
+    break_threshold,
+    max_duration,
+):
+    """박스 종료 지점 (저점 대비 break_threshold % 이탈 또는 max_duration(캔들 개수) 도달)"""
+    break_level = local_low - (local_low * break_threshold / 100)
+    max_search_idx = min(len(low), local_low_idx + max_duration)
+
+    start = start_search_idx + 1
+    hit = first_true(low[start:max_search_idx] <= break_level)
+
+    if hit >= 0:
+        box_end_idx = start + hit
+        scan_end = box_end_idx
+    else:
+        box_end_idx = max_search_idx - 1
+        scan_end = max_search_idx
+    # 최대 기간 도달도 이탈과 같이 종료(Box_Broken)로 처리
+    box_broken = True
+
+    max_high = temp_max
+    max_idx = temp_max_idx
+    seg_high = high[start:scan_end]
+    if len(seg_high):
+        seg_idx = int(np.argmax(seg_high))
+        if seg_high[seg_idx] > max_high:
+            max_high = float(seg_high[seg_idx])
+            max_idx = start + seg_idx
+
+    return box_end_idx, box_broken, max_high, max_idx
+
+
+def bear_step(
+    days,
+    low,
+    high,
+    i,
+    prev_box_high,
+    rise_threshold=5.0,
+    break_threshold=2.0,
+    min_duration_days=1,
+    max_duration_days=420,
+    min_drop_from_prev_high=3.0,
+    points_per_day=1,
+):
+    """
+    하락장 탐지 루프 한 단계 (i부터 다음 박스 1개 또는 건너뛰기)
+
+    Returns:
+        (box 또는 None, 다음 i 또는 None(종료), settled)
+        settled: 결과가 확정이면 판정에 쓴 데이터의 끝 위치(exclusive) - 그 이전 데이터가 그대로면
+                 뒤 데이터가 추가 / 수정되어도 결과가 바뀌지 않음, 확정이 아니면 None
+    """
+    n = len(low)
+    max_points = max_duration_days * points_per_day
+
+    # 1. 진짜 최저점 찾기 (상승 전까지의 최저점)
+    local_low, local_low_idx, rise_idx = find_true_low_before_rise(
+        low, high, i, rise_threshold
+    )
+    if local_low is None:
+        return None, None, None
+
+    # 2. 이전 고점 대비 충분히 하락했는지 체크
+    if prev_box_high - local_low < min_drop_from_prev_high:
+        return None, local_low_idx + 1, rise_idx + 1
+
+    # 3. 상승 고점 찾기
+    rise_achieved, temp_max, temp_max_idx = find_rise_peak(
+        high, local_low_idx, local_low, rise_threshold
+    )
+    if not rise_achieved:
+        return None, local_low_idx + 1, None
+
+    # 4. 박스 종료 지점 찾기
+    box_end_idx, box_broken, max_high, max_idx = find_box_end(
+        low,
+        high,
+        local_low_idx,
+        local_low,
+        temp_max_idx,
+        temp_max,
+        temp_max_idx,
+        break_threshold,
+        max_points,
+    )
+    # 저점 이탈이 나왔거나 최대 기간을 모두 봤으면 확정
+    break_level = local_low - (local_low * break_threshold / 100)
+    final = local_low_idx + max_points <= n or low[box_end_idx] <= break_level
+    settled = max(rise_idx, box_end_idx) + 1 if final else None
+
+    # 고점 인덱스 보정
+    if max_idx > box_end_idx:
+        seg_idx = int(np.argmax(high[local_low_idx : box_end_idx + 1]))
+        max_idx = local_low_idx + seg_idx
+        max_high = float(high[max_idx])
+
+    # 5. 최소 기간 체크
+    if days[box_end_idx] - days[local_low_idx] < min_duration_days:
+        return None, box_end_idx + 1, settled
+
+    box = {
+        "start_idx": local_low_idx,
+        "start_rate": local_low,
+        "peak_idx": max_idx,
+        "peak_rate": max_high,
+        "end_idx": box_end_idx,
+        "broken": box_broken,
+    }
+    return box, box_end_idx + 1, settled
+
+
+def find_bear_boxes(days, low, high, start_high=100.0, **params):
+    """
+    하락장 박스권 탐지
+
+    Args:
+        days: 경과일 배열 (정렬됨)
+        low / high: 저가 / 고가 비율(%) 배열
+        params: bear_step 임계값 (rise_threshold, break_threshold, ...)
+
+    Returns:
+        list[dict]: start_idx, start_rate, peak_idx, peak_rate, end_idx, broken
+    """
+    days = np.asarray(days)
+    low = np.asarray(low, dtype=float)
+    high = np.asarray(high, dtype=float)
+
+    boxes = []
+    i = 1
+    prev_box_high = start_high  # 이전 박스의 고점 (첫 박스는 100%에서 시작)
+
+    while i is not None and i < len(low):
+        box, i, _ = bear_step(days, low, high, i, prev_box_high, **params)
+        if box:
+            boxes.append(box)
+            prev_box_high = box["peak_rate"]
+
+    return boxes
+
+
+def significant_highs(high_max, lookback, offset=0):
+    """과거 N개 + 미래 N개 범위에서 최고점인 위치 (앞쪽 N개는 제외)
+
+    offset: 배열이 원래 시계열의 offset 위치부터 시작할 때 (앞쪽 N개 판정용)
+    """
+    n = len(high_max.values)
+    idx = np.arange(n)
+    window_max = high_max.value(
+        np.maximum(0, idx - lookback), np.minimum(n - 1, idx + lookback)
+    )
+    return (idx + offset >= lookback) & (high_max.values >= window_max)
+
+
+def bull_step(
+    days,
+    low_min,
+    high_max,
+    candidates,
+    i,
+    drop_threshold=5.0,
+    break_threshold=2.0,
+    min_duration_days=1,
+    lookback=10,
+    points_per_day=1,
+):
+    """
+    상승장 탐지 루프 한 단계 (i 이후 다음 유의미한 고점에서 박스 1개 또는 건너뛰기)
+
+    Returns:
+        (box 또는 None, 다음 i 또는 None(종료), settled)
+        settled: bear_step과 같음 (확정이면 판정에 쓴 데이터의 끝 위치, 아니면 None)
+    """
+    low = low_min.values
+    high = high_max.values
+    n = len(low)
+
+    # 1. 다음 유의미한 고점으로 이동
+    pos = int(np.searchsorted(candidates, i))
+    if pos >= len(candidates):
+        return None, None, None
+    i = int(candidates[pos])
+    local_high = float(high[i])
+    # 미래 N개가 모두 있어야 고점 판정 확정 (아닌 위치는 데이터가 늘어도 계속 아님)
+    high_end = i + lookback * points_per_day
+    final = high_end <= n - 1
+
+    # 2. 고점 대비 drop_threshold 이상 하락하는 첫 저점
+    temp_min_idx = low_min.first_index(
+        i + 1, n - 1, lambda m: local_high - m >= drop_threshold
+    )
+    if temp_min_idx < 0:
+        return None, i + 1, None
+    min_low = float(low[temp_min_idx])
+    min_idx = temp_min_idx
+
+    # 3. 박스 종료: 고점 대비 break_threshold % 이상 재돌파 (없으면 사이클 끝)
+    break_level = local_high + (local_high * break_threshold / 100)
+    box_end_idx = high_max.first_index(temp_min_idx + 1, n - 1, lambda m: m >= break_level)
+    scan_end = box_end_idx - 1 if box_end_idx >= 0 else n - 1
+    if box_end_idx < 0:
+        box_end_idx = n - 1
+        final = False
+    # 사이클 끝 도달도 종료(Box_Broken)로 처리
+    box_broken = True
+
+    if scan_end > temp_min_idx:
+        k = low_min.index(temp_min_idx + 1, scan_end)
+        if low[k] < min_low:
+            min_low = float(low[k])
+            min_idx = k
+
+    # 저점 인덱스 보정
+    if min_idx > box_end_idx:
+        min_idx = low_min.index(i, box_end_idx)
+        min_low = float(low[min_idx])
+
+    settled = max(high_end, box_end_idx) + 1 if final else None
+
+    # 4. 최소 기간 체크
+    if days[box_end_idx] - days[i] < min_duration_days:
+        return None, box_end_idx + 1, settled
+
+    box = {
+        "start_idx": i,
+        "start_rate": local_high,
+        "low_idx": min_idx,
+        "low_rate": min_low,
+        "end_idx": box_end_idx,
+        "broken": box_broken,
+    }
+    return box, box_end_idx + 1, settled
+
+
+def find_bull_boxes(days, low, high, **params):
+    """
+    상승장 조정 박스권 탐지
+
+    Args:
+        days: 경과일 배열 (정렬됨)
+        low / high: 저가 / 고가 비율(%) 배열
+        params: bull_step 임계값 (drop_threshold, break_threshold, lookback, ...)
+
+    Returns:
+        list[dict]: start_idx, start_rate, low_idx, low_rate, end_idx, broken
+    """
+    days = np.asarray(days)
+    low_min = RangeExtremum(low, "min")
+    high_max = RangeExtremum(high, "max")
+    lookback = params.get("lookback", 10) * params.get("points_per_day", 1)
+    candidates = np.flatnonzero(significant_highs(high_max, lookback))
+
+    boxes = []
+    i = lookback  # N일(캔들 N * points_per_day개) 이후부터 탐색 시작
+
+    while i is not None and i < len(days):
+        box, i, _ = bull_step(days, low_min, high_max, candidates, i, **params)
+        if box:
+            boxes.append(box)
+
+    return boxes
+
+
+def find_cycle_boxes(days, low, high, config):
+    """
+    사이클 하나의 하락장 반등 박스 + 상승장 조정 박스 탐지 (배열 1회 순회)
+    - 하락장은 max_days까지, 상승장은 min_days부터의 구간 (같은 배열의 view)
+
+    Args:
+        days: 경과일 배열 (정렬됨)
+        low / high: 저가 / 고가 비율(%) 배열
+        config: {"bear": {"max_days", "min_rows", "params"},
+                 "bull": {"min_days", "min_rows", "params"}} - 없는 side는 건너뜀
+                min_rows는 일 단위 (params의 points_per_day로 캔들 개수 환산)
+
+    Returns:
+        list[dict]: side("bear" / "bull") + 각 엔진 결과, 인덱스는 전체 배열 기준 (start_idx 순)
+    """
+    days = np.asarray(days)
+    low = np.asarray(low, dtype=float)
+    high = np.asarray(high, dtype=float)
+    boxes = []
+
+    bear = config.get("bear")
+    if bear:
+        # max_days일(마지막 날의 시간봉 포함)까지
+        end = int(np.searchsorted(days, bear["max_days"] + 1, "left"))
+        if end >= bear["min_rows"] * bear["params"].get("points_per_day", 1):
+            boxes.extend(
+                {"side": "bear", **box}
+                for box in find_bear_boxes(
+                    days[:end], low[:end], high[:end], **bear["params"]
+                )
+            )
+
+    bull = config.get("bull")
+    if bull:
+        start = int(np.searchsorted(days, bull["min_days"], "left"))
+        if len(days) - start >= bull["min_rows"] * bull["params"].get("points_per_day", 1):
+            boxes.extend(
+                {"side": "bull", **shift_box(box, start)}
+                for box in find_bull_boxes(
+                    days[start:], low[start:], high[start:], **bull["params"]
+                )
+            )
+
+    boxes.sort(key=lambda box: box["start_idx"])
+    return boxes
@@ -0,0 +1,245 @@
+"""
+박스권 엔진 golden (기준 구현 결과)
+- 기준 구현: 배열 엔진 도입 전 03 / 04 스크립트의 iloc 기반 find_box_ranges
+  (box_baseline_bear.py / box_baseline_bull.py에 그대로 옮겨 둠 - git 기록 없이 재생성 가능)
+- 입력: 시드 고정 합성 사이클 + 실제 사이클 데이터 중 끝난 사이클 (goldens/cycle_closed.json)
+  -> 끝난 사이클은 다시 계산되지 않으므로 입력을 그대로 커밋해 두고 비교
+- 기준 구현 결과를 goldens/box_<side>_baseline.json으로 커밋
+  (임계값도 기준 구현의 상수를 그대로 저장 - box_config가 바뀌어도 golden은 그대로)
+- 엔진 결과는 기준 구현과 같은 형식(경과일, 소수 둘째 자리 비율)으로 바꿔서 비교
+- python box_goldens.py: golden 다시 생성
+  (REFRESH_REAL_INPUTS = True면 저장소(CYCLE_STORAGE)에서 끝난 사이클 입력도 다시 저장)
+"""
+
+import contextlib
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import box_baseline_bear
+import box_baseline_bull
+from box_stream import data_digest
+
+# ==================== 설정 ====================
+BASE_DIR = Path(__file__).resolve().parent
+GOLDEN_DIR = BASE_DIR / "goldens"
+# 기준 구현을 옮겨 온 커밋 (box_baseline_*.py 출처 기록용)
+BASELINE_COMMIT = "e1fbe1365e28d3ac9697cf41840dc865bc2a8f3e"
+BASELINE = {"bear": box_baseline_bear, "bull": box_baseline_bull}
+REAL_INPUT_PATH = GOLDEN_DIR / "cycle_closed.json"
+REFRESH_REAL_INPUTS = False  # True: 저장소의 끝난 사이클 데이터로 REAL_INPUT_PATH 다시 저장
+
+SYNTHETIC_SEEDS = range(20)
+SYNTHETIC_VOLATILITY = [0.01, 0.02, 0.03, 0.05]  # 일 변동성 (시드 순서대로 돌아가며 - 긴 박스 / 잦은 이탈 모두 포함)
+SYNTHETIC_DAYS = {"bear": 421, "bull": 1000}  # 합성 사이클 길이 (일)
+SYNTHETIC_START_DAY = {"bear": 0, "bull": 420}  # 기준 구현의 분석 구간(0~420일 / 420일~) 안에서 시작
+# 박스 극값 키 (bear: 반등 고점, bull: 조정 저점)
+EXTREME_KEY = {"bear": "peak", "bull": "low"}
+
+
+def golden_path(mode):
+    return GOLDEN_DIR / f"box_{mode}_baseline.json"
+
+
+# ==================== 입력 데이터 ====================
+def synthetic_cycle(seed, n, start_day=0, volatility=0.03):
+    """시드 고정 합성 사이클 (경과일, 저가 / 고가 비율) - 100%에서 시작하는 랜덤워크
+
+    비율은 소수 넷째 자리로 반올림 (플랫폼별 exp 오차로 입력 digest가 달라지지 않도록)
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, volatility, n)))
+    low = np.round(close * (1 - 0.03 * rng.random(n)), 4)
+    high = np.round(close * (1 + 0.03 * rng.random(n)), 4)
+    return np.arange(start_day, start_day + n, dtype=float), low, high
+
+
+def load_real_inputs(path=REAL_INPUT_PATH):
+    """끝난 사이클 입력 {사이클 번호: (days, low, high)} (파일이 없으면 빈 dict)"""
+    if not Path(path).exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        int(cycle_num): tuple(
+            np.asarray(cycle[key], dtype=float) for key in ("days", "low", "high")
+        )
+        for cycle_num, cycle in data["cycles"].items()
+    }
+
+
+def capture_real_inputs(storage=None, path=REAL_INPUT_PATH, source=None):
+    """저장소의 사이클 데이터 중 끝난 사이클(마지막 사이클 이전)의 저가 / 고가 비율 저장
+
+    source: 입력 출처 기록 (없으면 저장소 이름)
+    """
+    from cycle_loader import load_cycle_cube
+    from cycle_storage import get_storage
+
+    storage = storage or get_storage()
+    cube = load_cycle_cube(storage, use_cache=False)
+    current = int(cube.cycles.max())
+    cycles = {}
+    for cycle_num in cube.cycles.tolist():
+        if cycle_num >= current:
+            continue  # 진행 중인 사이클은 매일 바뀌므로 제외
+        arrays = cube.cycle_slice(cycle_num, ["low_rate", "high_rate"])
+        cycles[str(cycle_num)] = {
+            "first_timestamp": str(arrays["dates"][0]),
+            "last_timestamp": str(arrays["dates"][-1]),
+            "days": arrays["days"].tolist(),
+            "low": arrays["low_rate"].tolist(),
+            "high": arrays["high_rate"].tolist(),
+        }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"source": source or storage.name, "cycles": cycles}, f)
+        f.write("\n")
+    print(f"   💾 끝난 사이클 입력: {', '.join(cycles) or '없음'} ({storage.name}) -> {path}")
+
+
+def real_window(mode, days, low, high):
+    """실제 사이클 -> 기준 구현(03 / 04)의 분석 구간 (bear: 420일까지, bull: 420일부터)"""
+    module = BASELINE[mode]
+    if mode == "bear":
+        keep = days <= module.MAX_DURATION_DAYS
+    else:
+        keep = days >= module.MIN_DAYS_FROM_PEAK
+    return days[keep], low[keep], high[keep]
+
+
+def golden_cases(mode):
+    """{케이스 이름: (days, low, high)} - 합성 사이클 + 끝난 실제 사이클"""
+    cases = {
+        f"synthetic_{mode}_seed{seed}": synthetic_cycle(
+            seed,
+            SYNTHETIC_DAYS[mode],
+            SYNTHETIC_START_DAY[mode],
+            SYNTHETIC_VOLATILITY[seed % len(SYNTHETIC_VOLATILITY)],
+        )
+        for seed in SYNTHETIC_SEEDS
+    }
+    for cycle_num, arrays in sorted(load_real_inputs().items()):
+        cases[f"real_{mode}_cycle{cycle_num}"] = real_window(mode, *arrays)
+    return cases
+
+
+# ==================== 비교 형식 ====================
+def _rate(value):
+    """기준 구현과 같은 반올림 (numpy float64 round)"""
+    return float(np.round(value, 2))
+
+
+def golden_records(mode, days, low, high, boxes):
+    """엔진 결과(인덱스 기준) -> golden 형식 (경과일 / 비율, 종료 비율은 bear 저가 / bull 고가)"""
+    extreme = EXTREME_KEY[mode]
+    end_rates = low if mode == "bear" else high
+    return [
+        {
+            "start_day": int(days[box["start_idx"]]),
+            "start_rate": _rate(box["start_rate"]),
+            f"{extreme}_day": int(days[box[f"{extreme}_idx"]]),
+            f"{extreme}_rate": _rate(box[f"{extreme}_rate"]),
+            "end_day": int(days[box["end_idx"]]),
+            "end_rate": _rate(end_rates[box["end_idx"]]),
+            "broken": bool(box["broken"]),
+        }
+        for box in boxes
+    ]
+
+
+# ==================== 기준 구현 ====================
+def baseline_params(mode, module):
+    """기준 구현의 상수 -> box_engine 임계값"""
+    if mode == "bear":
+        return dict(
+            rise_threshold=module.RISE_THRESHOLD,
+            break_threshold=module.BREAK_THRESHOLD,
+            min_duration_days=module.MIN_DURATION_DAYS,
+            max_duration_days=module.MAX_DURATION_DAYS,
+            min_drop_from_prev_high=module.MIN_DROP_FROM_PREV_HIGH,
+        )
+    return dict(
+        drop_threshold=module.DROP_THRESHOLD,
+        break_threshold=module.BREAK_THRESHOLD,
+        min_duration_days=module.MIN_DURATION_DAYS,
+        lookback=module.LOOKBACK_DAYS,
+    )
+
+
+def baseline_records(mode, module, days, low, high):
+    """기준 구현 find_box_ranges 실행 (사이클 1개 wide format) -> golden 형식"""
+    cycle_data = pd.DataFrame(
+        {
+            "Days_Since_Peak": days.astype(int),
+            "1_rate": (low + high) / 2,
+            "1_low_rate": low,
+            "1_high_rate": high,
+            "1_timestamp": [f"day{int(day)}" for day in days],
+        }
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        boxes = module.find_box_ranges(cycle_data, 1, "1_rate")
+
+    extreme = EXTREME_KEY[mode]
+    column = extreme.capitalize()  # Peak_Day / Low_Day ...
+    return [
+        {
+            "start_day": int(box["Start_Day"]),
+            "start_rate": float(box["Start_Rate"]),
+            f"{extreme}_day": int(box[f"{column}_Day"]),
+            f"{extreme}_rate": float(box[f"{column}_Rate"]),
+            "end_day": int(box["End_Day"]),
+            "end_rate": float(box["End_Rate"]),
+            "broken": bool(box["Box_Broken"]),
+        }
+        for box in boxes
+    ]
+
+
+def capture_goldens(mode):
+    """기준 구현 결과를 golden 파일로 저장"""
+    module = BASELINE[mode]
+    goldens = {
+        "baseline": f"{module.__name__}.py ({BASELINE_COMMIT[:12]})",
+        "params": baseline_params(mode, module),
+        "cases": {
+            name: {
+                "digest": data_digest(*arrays),
+                "boxes": baseline_records(mode, module, *arrays),
+            }
+            for name, arrays in golden_cases(mode).items()
+        },
+    }
+    path = golden_path(mode)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(goldens, f, indent=1)
+        f.write("\n")
+    box_count = sum(len(case["boxes"]) for case in goldens["cases"].values())
+    print(f"   💾 {mode} golden: {len(goldens['cases'])}개 케이스, 박스 {box_count}개 -> {path}")
+    return goldens
+
+
+def load_goldens(mode):
+    with open(golden_path(mode), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    print("=" * 60)
+    print(f"박스권 golden 생성 (기준 구현 {BASELINE_COMMIT[:12]})")
+    print("=" * 60)
+    if REFRESH_REAL_INPUTS:
+        capture_real_inputs()
+    for mode in BASELINE:
+        capture_goldens(mode)
+
+
+if __name__ == "__main__":
+    main()
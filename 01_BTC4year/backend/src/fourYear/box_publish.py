@@ -0,0 +1,32 @@
+"""
+박스권 탐지 결과 저장 (bitcoin_box_ranges)
+- 03(bear) / 04(bull) 스크립트의 박스 목록을 사이클 / side / 파라미터 조합 단위로 교체 저장
+- 프론트엔드(frontend/utils/chartData.js fetchBoxRanges)는 이 테이블을 조회하고,
+  행이 없을 때만 브라우저에서 직접 계산
+- 행 변환은 BoxTable.to_rows (box_table)
+"""
+
+
+def params_key(params, refine_timeframe=None):
+    """파라미터 조합 키 (예: rise_threshold=5|break_threshold=2|...)
+
+    frontend/utils/chartData.js 의 boxParamsKey와 같은 형식 (입력 순서 유지)
+    refine_timeframe: 시간봉으로 보정한 결과면 끝에 refine=<timeframe> (일봉 결과를 덮어쓰지 않도록)
+    """
+    key = "|".join(f"{key}={value:g}" for key, value in params.items())
+    if refine_timeframe:
+        key += f"|refine={refine_timeframe}"
+    return key
+
+
+def publish_boxes(storage, params, cycle_num, table, refine_timeframe=None):
+    """사이클 하나의 박스 목록(BoxTable) 저장 (기존 행은 교체) - 실패해도 분석은 계속"""
+    param_set = params_key(params, refine_timeframe)
+    records = table.to_rows(param_set)
+    try:
+        saved = storage.replace_box_rows(int(cycle_num), table.side, param_set, records)
+        print(f"   💾 박스권 저장: {saved}개 ({table.side}, {param_set})")
+        return saved
+    except Exception as e:
+        print(f"   [WARN] 박스권 저장 실패: {e}")
+        return 0
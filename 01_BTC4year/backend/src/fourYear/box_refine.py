@@ -0,0 +1,135 @@
+"""
+박스 이벤트 시간봉 보정 (coarse-to-fine)
+- 박스는 일봉 배열로 먼저 탐지하고, 각 박스의 시작 / 극값 / 종료(이탈) 날짜의 시간봉만 SQLite에서 조회
+- 시작 / 극값: 그날 시간봉 중 일봉 저가(고가)를 만든 캔들의 시각과 비율
+- 종료: 그날 처음 이탈 기준(break level)을 넘은 캔들의 시각과 비율 (이탈이 없으면 일봉 그대로)
+- 조회량은 박스당 이벤트 날짜 3일치로 사이클 전체 시간봉의 일부
+"""
+
+from dataclasses import replace
+
+import numpy as np
+
+from box_table import BoxTable
+from intraday_cycle import (
+    ONE_DAY_MS,
+    connect_store,
+    date_to_ms,
+    format_timestamps,
+    query_candles,
+)
+
+
+def load_event_days(conn, timeframe, table):
+    """박스 이벤트 날짜의 시간봉만 조회 ({날짜: (timestamp, low, high)})"""
+    dates = set()
+    for name in ("start_timestamp", "extreme_timestamp", "end_timestamp"):
+        dates.update(str(ts)[:10] for ts in table.columns[name])
+
+    candles = {}
+    for date in sorted(dates):
+        day_ts = date_to_ms(date)
+        candles[date] = query_candles(conn, timeframe, day_ts, day_ts + ONE_DAY_MS)
+    return candles
+
+
+def pick_candle(day_candles, values, mode, level=None, after_ts=None, before_ts=None):
+    """하루 시간봉 중 최저/최고(mode) 또는 처음 level을 넘은 캔들 (timestamp, 값) - 없으면 None"""
+    timestamps = day_candles[0]
+    valid = np.ones(len(timestamps), dtype=bool)
+    if after_ts is not None:
+        valid &= timestamps >= after_ts
+    if before_ts is not None:
+        valid &= timestamps < before_ts
+
+    if level is None:
+        if not valid.any():
+            return None
+        masked = np.where(valid, values, np.inf if mode == "min" else -np.inf)
+        idx = int(np.argmin(masked) if mode == "min" else np.argmax(masked))
+    else:
+        hit = valid & (values <= level if mode == "min" else values >= level)
+        if not hit.any():
+            return None
+        idx = int(np.argmax(hit))
+    return int(timestamps[idx]), float(values[idx])
+
+
+def refine_box(record, candles, peak_close, break_threshold):
+    """박스 하나(BoxRecord)의 시작 / 극값 / 종료 시각과 비율을 시간봉 기준으로 보정"""
+    # bear: 저점 -> 고점 -> 저점 이탈, bull: 고점 -> 저점 -> 고점 돌파
+    start_mode, extreme_mode = ("min", "max") if record.side == "bear" else ("max", "min")
+    metric = {"min": 1, "max": 2}  # (timestamp, low, high) 위치
+
+    def day_of(timestamp):
+        day_candles = candles.get(str(timestamp)[:10])
+        return day_candles if day_candles is not None and len(day_candles[0]) else None
+
+    changes = {}
+    start_rate = record.start_rate
+    start_ts = None
+
+    day_candles = day_of(record.start_timestamp)
+    if day_candles:
+        start_ts, price = pick_candle(
+            day_candles, day_candles[metric[start_mode]], start_mode
+        )
+        start_rate = price / peak_close * 100
+        changes["start"] = (start_ts, start_rate)
+
+    end_ts = None
+    day_candles = day_of(record.end_timestamp)
+    if day_candles:
+        sign = -1 if record.side == "bear" else 1
+        level = (start_rate + sign * start_rate * break_threshold / 100) * peak_close / 100
+        # 이탈 방향은 시작점과 같음 (bear: 저가 <= level, bull: 고가 >= level)
+        hit = pick_candle(
+            day_candles,
+            day_candles[metric[start_mode]],
+            start_mode,
+            level=level,
+            after_ts=start_ts,
+        )
+        if hit:
+            end_ts, price = hit
+            changes["end"] = (end_ts, price / peak_close * 100)
+
+    extreme_rate = record.extreme_rate
+    day_candles = day_of(record.extreme_timestamp)
+    if day_candles:
+        hit = pick_candle(
+            day_candles,
+            day_candles[metric[extreme_mode]],
+            extreme_mode,
+            after_ts=start_ts,
+            before_ts=end_ts,
+        )
+        if hit:
+            extreme_ts, price = hit
+            extreme_rate = price / peak_close * 100
+            changes["extreme"] = (extreme_ts, extreme_rate)
+
+    fields = {}
+    for prefix, (ts, rate) in changes.items():
+        fields[f"{prefix}_timestamp"] = format_timestamps(np.array([ts]))[0]
+        fields[f"{prefix}_rate"] = round(rate, 2)
+    fields["move_percent"] = round(abs(extreme_rate - start_rate), 2)
+    return replace(record, **fields)
+
+
+def refine_boxes(table, timeframe, peak_close, break_threshold, db_path=None):
+    """일봉 박스 테이블 -> 이벤트 날짜만 시간봉으로 보정한 테이블 (조회 캔들 수 포함)"""
+    if not len(table):
+        return table, 0
+
+    conn = connect_store(db_path)
+    try:
+        candles = load_event_days(conn, timeframe, table)
+    finally:
+        conn.close()
+
+    records = [
+        refine_box(record, candles, peak_close, break_threshold) for record in table
+    ]
+    candle_count = sum(len(day_candles[0]) for day_candles in candles.values())
+    return BoxTable.from_records(table.side, records), candle_count
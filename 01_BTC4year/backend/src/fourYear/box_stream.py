@@ -0,0 +1,247 @@
+"""
+박스권 증분 탐지 상태 (일봉이 추가될 때 열린 박스만 다시 계산)
+- box_engine의 bear_step / bull_step을 그대로 사용하므로 전체 재계산(find_*_boxes)과 결과 동일
+- 상태: 확정된 박스, 마지막 확정 지점(checkpoint), 확정 판정에 쓴 구간 끝(settled)과 그 digest,
+  이전 박스 고점, checkpoint 이후 데이터(tail)
+- feed(): 새로 추가된 날짜만 받아 checkpoint부터 다시 탐색 (열린 박스 구간만)
+- sync(): 전체 시계열을 받아 확정 구간(settled 이전)만 digest로 비교
+  -> 그대로면 tail을 새 데이터로 교체해 checkpoint부터 다시 탐색 (01이 매일 다시 쓰는 최근 며칠은 tail)
+  -> 확정 구간이 바뀌었으면(사이클 재계산 등) 처음부터 다시 계산
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from box_engine import (
+    RangeExtremum,
+    bear_step,
+    bull_step,
+    shift_box,
+    significant_highs,
+)
+
+STATE_VERSION = 3
+REWRITE_DAYS = 7  # 01이 매일 다시 쓰는 최근 기간 (일) - 이 구간 데이터에 걸친 판정은 확정하지 않음
+
+
+def data_digest(days, low, high):
+    """확정 구간 비교용 digest"""
+    h = hashlib.sha1()
+    for values in (days, low, high):
+        h.update(np.asarray(values, dtype=float).tobytes())
+    return h.hexdigest()
+
+
+class BoxStream:
+    """하락장(bear) / 상승장(bull) 박스 탐지 재개 가능한 상태"""
+
+    def __init__(self, mode, params=None):
+        if mode not in ("bear", "bull"):
+            raise ValueError(f"알 수 없는 mode: {mode}")
+        self.mode = mode
+        self.params = dict(params or {})
+        self.reset()
+
+    def reset(self):
+        self.n = 0  # 지금까지 받은 데이터 개수
+        self.base = 0  # tail 시작 위치 (원래 시계열 기준)
+        self.days = np.empty(0)
+        self.low = np.empty(0)
+        self.high = np.empty(0)
+        self.checkpoint = 1 if self.mode == "bear" else self.lookback
+        self.settled = 0  # 확정 판정에 쓴 데이터 끝 (이 이전 데이터가 바뀌면 처음부터 다시 계산)
+        self.prev_box_high = 100.0  # 하락장: 이전 박스의 고점 (첫 박스는 100%)
+        self.final_boxes = []
+        self.open_boxes = []  # 데이터가 추가되면 바뀔 수 있는 박스
+        self.digest = None
+
+    @property
+    def lookback(self):
+        """상승장 고점 판정 범위 (캔들 개수 - find_bull_boxes와 같이 points_per_day로 환산)"""
+        return self.params.get("lookback", 10) * self.params.get("points_per_day", 1)
+
+    @property
+    def mutable_points(self):
+        """끝에서부터 다시 쓰일 수 있는 데이터 개수"""
+        return REWRITE_DAYS * self.params.get("points_per_day", 1)
+
+    def matches(self, mode, params):
+        return self.mode == mode and self.params == dict(params)
+
+    def boxes(self):
+        """확정 박스 + 열린 박스 (같은 데이터의 find_*_boxes 결과와 동일)"""
+        return [dict(box) for box in self.final_boxes + self.open_boxes]
+
+    def feed(self, days, low, high):
+        """새로 추가된 날짜 반영"""
+        self.days = np.concatenate([self.days, np.asarray(days, dtype=float)])
+        self.low = np.concatenate([self.low, np.asarray(low, dtype=float)])
+        self.high = np.concatenate([self.high, np.asarray(high, dtype=float)])
+        self.n += len(low)
+        self.digest = None  # 앞쪽 데이터는 없으므로 다음 sync에서 확정 구간 비교 불가 (처음부터 계산)
+        self._advance()
+        return self.boxes()
+
+    def sync(self, days, low, high):
+        """전체 시계열로 동기화 (확정 구간이 그대로면 tail만 교체해 다시 탐색)"""
+        days = np.asarray(days, dtype=float)
+        low = np.asarray(low, dtype=float)
+        high = np.asarray(high, dtype=float)
+
+        settled = self.settled
+        if settled > len(low) or (
+            settled and self.digest != data_digest(days[:settled], low[:settled], high[:settled])
+        ):
+            self.reset()
+
+        # tail(base 이후)은 수정되었을 수 있으므로 항상 새 데이터로 교체
+        self.days = days[self.base :]
+        self.low = low[self.base :]
+        self.high = high[self.base :]
+        self.n = len(low)
+        self._advance()
+        self.digest = data_digest(
+            days[: self.settled], low[: self.settled], high[: self.settled]
+        )
+        return self.boxes()
+
+    def _advance(self):
+        if self.mode == "bear":
+            self._advance_bear()
+        else:
+            self._advance_bull()
+        self._trim()
+
+    def _record(self, box, next_i, settled, confirmed):
+        """한 단계 결과 반영 - 앞 단계가 모두 확정일 때만 checkpoint / settled 이동
+
+        판정에 쓴 데이터가 다시 쓰일 수 있는 최근 구간에 걸치면 아직 확정하지 않음
+        """
+        if box:
+            box = shift_box(box, self.base)
+        if settled is not None and settled + self.base > self.n - self.mutable_points:
+            settled = None
+        if confirmed and settled is not None:
+            if box:
+                self.final_boxes.append(box)
+            self.checkpoint = next_i + self.base
+            self.settled = max(self.settled, settled + self.base)
+            return True
+        if box:
+            self.open_boxes.append(box)
+        return False
+
+    def _advance_bear(self):
+        self.open_boxes = []
+        i = self.checkpoint - self.base
+        prev_box_high = self.prev_box_high
+        confirmed = True
+
+        while i is not None and i < len(self.low):
+            box, next_i, settled = bear_step(
+                self.days, self.low, self.high, i, prev_box_high, **self.params
+            )
+            confirmed = self._record(box, next_i, settled, confirmed)
+            if box:
+                prev_box_high = box["peak_rate"]
+                if confirmed:
+                    self.prev_box_high = prev_box_high
+            i = next_i
+
+    def _advance_bull(self):
+        self.open_boxes = []
+        low_min = RangeExtremum(self.low, "min")
+        high_max = RangeExtremum(self.high, "max")
+        candidates = np.flatnonzero(significant_highs(high_max, self.lookback, self.base))
+        i = self.checkpoint - self.base
+        confirmed = True
+
+        while i is not None and i < len(self.low):
+            box, next_i, settled = bull_step(
+                self.days, low_min, high_max, candidates, i, **self.params
+            )
+            confirmed = self._record(box, next_i, settled, confirmed)
+            i = next_i
+
+    def _trim(self):
+        """checkpoint 이전 데이터 제거 (상승장은 고점 판정용 앞쪽 N개 유지)"""
+        keep_before = self.lookback if self.mode == "bull" else 0
+        new_base = max(self.base, min(self.checkpoint, self.n) - keep_before)
+        cut = new_base - self.base
+        if cut > 0:
+            self.days = self.days[cut:]
+            self.low = self.low[cut:]
+            self.high = self.high[cut:]
+            self.base = new_base
+
+    def to_dict(self):
+        return {
+            "version": STATE_VERSION,
+            "mode": self.mode,
+            "params": self.params,
+            "n": self.n,
+            "base": self.base,
+            "checkpoint": self.checkpoint,
+            "settled": self.settled,
+            "prev_box_high": self.prev_box_high,
+            "days": self.days.tolist(),
+            "low": self.low.tolist(),
+            "high": self.high.tolist(),
+            "final_boxes": self.final_boxes,
+            "open_boxes": self.open_boxes,
+            "digest": self.digest,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stream = cls(data["mode"], data["params"])
+        stream.n = data["n"]
+        stream.base = data["base"]
+        stream.checkpoint = data["checkpoint"]
+        stream.settled = data["settled"]
+        stream.prev_box_high = data["prev_box_high"]
+        stream.days = np.asarray(data["days"], dtype=float)
+        stream.low = np.asarray(data["low"], dtype=float)
+        stream.high = np.asarray(data["high"], dtype=float)
+        stream.final_boxes = data["final_boxes"]
+        stream.open_boxes = data["open_boxes"]
+        stream.digest = data["digest"]
+        return stream
+
+
+def load_stream_states(path):
+    """상태 파일 로드 ({key: BoxStream}, 없거나 버전이 다르면 빈 dict)"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {
+        key: BoxStream.from_dict(value)
+        for key, value in data.items()
+        if value.get("version") == STATE_VERSION
+    }
+
+
+def save_stream_states(path, streams):
+    path = Path(path)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({key: stream.to_dict() for key, stream in streams.items()}, f)
+    os.replace(tmp_path, path)
+
+
+def get_stream(streams, key, mode, params):
+    """저장된 상태가 같은 mode / 파라미터면 재사용, 아니면 새로 생성"""
+    stream = streams.get(key)
+    if stream is None or not stream.matches(mode, params):
+        stream = BoxStream(mode, params)
+        streams[key] = stream
+    return stream
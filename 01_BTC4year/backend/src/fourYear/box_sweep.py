@@ -0,0 +1,234 @@
+"""
+박스권 탐지 임계값 파라미터 스윕 (하락장 / 상승장)
+- box_config의 임계값(rise_threshold, drop_threshold, lookback ...) 중 일부를
+  격자(grid)로 바꿔가며 모든 사이클에 대해 box_engine을 실행
+- 사이클 데이터(저가/고가 비율)는 shared memory에 한 번 올리고 프로세스 풀에서 공유
+- 결과: 파라미터 조합 x 사이클별 박스 개수 / 기간 / 상승·하락폭 표(CSV) + 히트맵(HTML)
+"""
+
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from box_config import (
+    BEAR_MAX_DAYS,
+    BEAR_MIN_ROWS,
+    BEAR_PARAMS,
+    BULL_MIN_DAYS,
+    BULL_MIN_ROWS,
+    BULL_PARAMS,
+)
+from box_engine import find_bear_boxes, find_bull_boxes
+from cycle_cube import METRIC_INDEX
+from cycle_loader import load_cycle_cube
+
+# ==================== 설정 ====================
+OUTPUT_DIR = "././public/charts"
+RESULT_CSV_FILE = f"{OUTPUT_DIR}/box_sweep_results.csv"
+HEATMAP_HTML_FILE = f"{OUTPUT_DIR}/box_sweep_heatmap.html"
+SWEEP_WORKERS = None  # None이면 CPU 개수만큼
+
+# 격자에 없는 임계값과 분석 구간은 box_config(03 / 04 / 05와 같은 값) 사용
+BEAR_GRID = {
+    "rise_threshold": [3.0, 4.0, 5.0, 6.0, 7.0],
+    "break_threshold": [1.0, 2.0, 3.0],
+    "min_drop_from_prev_high": [2.0, 3.0, 4.0],
+}
+BULL_GRID = {
+    "drop_threshold": [3.0, 4.0, 5.0, 6.0, 7.0],
+    "break_threshold": [1.0, 2.0, 3.0],
+    "lookback": [5, 10, 20],
+}
+
+# 워커 프로세스에서 shared memory를 가리키는 배열
+_shared = {}
+
+
+def expand_grid(grid):
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+
+def params_label(params):
+    return ", ".join(f"{key}={value:g}" for key, value in params.items())
+
+
+def init_worker(shm_name, shape, days, cycles):
+    """워커 초기화: shared memory의 (저가/고가, 사이클, 경과일) 배열 연결"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _shared["shm"] = shm
+    _shared["rates"] = np.ndarray(shape, dtype=float, buffer=shm.buf)
+    _shared["days"] = days
+    _shared["cycles"] = cycles
+
+
+def summarize(mode, params, cycle_num, days, boxes, start_key, extreme_key):
+    durations = [int(days[box["end_idx"]] - days[box["start_idx"]]) for box in boxes]
+    moves = [abs(box[extreme_key] - box[start_key]) for box in boxes]
+    return {
+        "mode": mode,
+        "params": params_label(params),
+        **params,
+        "cycle": int(cycle_num),
+        "box_count": len(boxes),
+        "avg_duration": round(float(np.mean(durations)), 2) if boxes else 0.0,
+        "max_duration": max(durations, default=0),
+        "avg_move": round(float(np.mean(moves)), 2) if boxes else 0.0,
+        "max_move": round(max(moves, default=0.0), 2),
+    }
+
+
+def run_params(mode, params):
+    """파라미터 조합 하나를 모든 사이클에 적용 (워커에서 실행)"""
+    rates = _shared["rates"]
+    days = _shared["days"]
+    rows = []
+
+    for c, cycle_num in enumerate(_shared["cycles"]):
+        low = rates[0, c]
+        high = rates[1, c]
+        valid = ~np.isnan(low)
+
+        if mode == "bear":
+            valid &= days <= BEAR_MAX_DAYS
+            if valid.sum() < BEAR_MIN_ROWS:
+                boxes = []
+            else:
+                boxes = find_bear_boxes(
+                    days[valid], low[valid], high[valid], **{**BEAR_PARAMS, **params}
+                )
+            rows.append(
+                summarize(mode, params, cycle_num, days[valid], boxes, "start_rate", "peak_rate")
+            )
+        else:
+            valid &= days >= BULL_MIN_DAYS
+            if valid.sum() < BULL_MIN_ROWS:
+                boxes = []
+            else:
+                boxes = find_bull_boxes(
+                    days[valid], low[valid], high[valid], **{**BULL_PARAMS, **params}
+                )
+            rows.append(
+                summarize(mode, params, cycle_num, days[valid], boxes, "start_rate", "low_rate")
+            )
+
+    return rows
+
+
+def run_sweep(cube, workers=SWEEP_WORKERS):
+    """BEAR_GRID / BULL_GRID 전체 조합을 프로세스 풀에서 실행"""
+    jobs = [("bear", p) for p in expand_grid(BEAR_GRID)] + [
+        ("bull", p) for p in expand_grid(BULL_GRID)
+    ]
+    rates = cube.values[[METRIC_INDEX["low_rate"], METRIC_INDEX["high_rate"]]]
+
+    shm = shared_memory.SharedMemory(create=True, size=rates.nbytes)
+    try:
+        np.ndarray(rates.shape, dtype=float, buffer=shm.buf)[:] = rates
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(shm.name, rates.shape, cube.days, cube.cycles),
+        ) as executor:
+            results = executor.map(run_params, *zip(*jobs), chunksize=4)
+            rows = [row for job_rows in results for row in job_rows]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return pd.DataFrame(rows)
+
+
+def create_heatmap_html(result_df):
+    """모드별 (파라미터 조합 x 사이클) 박스 개수 히트맵"""
+    charts = []
+    for mode in ["bear", "bull"]:
+        mode_df = result_df[result_df["mode"] == mode]
+        if mode_df.empty:
+            continue
+        pivot = mode_df.pivot(index="params", columns="cycle", values="box_count")
+        pivot = pivot.loc[mode_df["params"].drop_duplicates()]
+        series = [
+            {
+                "name": label,
+                "data": [{"x": f"Cycle {c}", "y": int(v)} for c, v in row.items()],
+            }
+            for label, row in pivot.iterrows()
+        ]
+        charts.append((mode, series, len(series)))
+
+    chart_divs = "\n".join(
+        f'<div class="chart-wrapper"><h2>{mode.upper()} - 박스 개수</h2><div id="chart_{mode}"></div></div>'
+        for mode, _, _ in charts
+    )
+    chart_scripts = "\n".join(
+        f"""new ApexCharts(document.querySelector('#chart_{mode}'), {{
+            chart: {{ type: 'heatmap', height: {max(300, rows * 18)}, background: 'transparent', toolbar: {{ show: false }} }},
+            series: {json.dumps(series, ensure_ascii=False)},
+            dataLabels: {{ enabled: true }},
+            colors: ['{"#EF4444" if mode == "bear" else "#10B981"}'],
+            theme: {{ mode: 'dark' }},
+            xaxis: {{ labels: {{ style: {{ colors: '#94A3B8' }} }} }},
+            yaxis: {{ labels: {{ style: {{ colors: '#94A3B8', fontSize: '10px' }}, maxWidth: 360 }} }}
+        }}).render();"""
+        for mode, series, rows in charts
+    )
+
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Box Range Parameter Sweep</title>
+    <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+    <style>
+        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        body {{ font-family: 'Inter', sans-serif; background: linear-gradient(180deg, #020617 0%, #0F172A 100%); min-height: 100vh; padding: 20px; }}
+        .chart-wrapper {{ max-width: 1400px; margin: 0 auto 20px; background: linear-gradient(135deg, #0F172A 0%, #1E293B 50%, #0F172A 100%); border-radius: 16px; padding: 20px; border: 1px solid rgba(255,255,255,0.05); }}
+        h2 {{ font-size: 18px; font-weight: 700; color: #F8FAFC; margin-bottom: 12px; }}
+    </style>
+</head>
+<body>
+{chart_divs}
+<script>
+{chart_scripts}
+</script>
+</body>
+</html>"""
+
+
+def main():
+    print("=" * 60)
+    print("박스권 임계값 파라미터 스윕")
+    print("=" * 60)
+
+    cube = load_cycle_cube()
+    if cube is None:
+        return
+
+    start_time = time.time()
+    result_df = run_sweep(cube)
+    print(
+        f"파라미터 조합 {result_df['params'].nunique()}개 x 사이클 {len(cube.cycles)}개 "
+        f"({time.time() - start_time:.2f}초)"
+    )
+
+    if OUTPUT_DIR and not os.path.exists(OUTPUT_DIR):
+        os.makedirs(OUTPUT_DIR)
+
+    result_df.to_csv(RESULT_CSV_FILE, index=False)
+    print(f"   📄 결과 저장: {RESULT_CSV_FILE}")
+
+    with open(HEATMAP_HTML_FILE, "w", encoding="utf-8") as f:
+        f.write(create_heatmap_html(result_df))
+    print(f"   📊 히트맵 저장: {HEATMAP_HTML_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+박스권 결과 레코드 / 컬럼형 테이블
+- BoxRecord: 박스 1개 (slots dataclass, 필드 타입 고정)
+- BoxTable: 한 사이클 / side의 박스들을 필드별 NumPy 배열로 보관 (박스마다 dict를 만들지 않음)
+- to_json_list(): HTML 템플릿 / 프론트엔드가 쓰는 기존 키(Start_Day, Peak_Rate ...) 형식
+  (컬럼별 tolist() 한 번 + zip으로 바로 생성, 중간 레코드 객체 없음)
+- to_rows(): bitcoin_box_ranges 행 (box_publish)
+- 경과일 컬럼은 일봉이면 int64, 시간봉(points_per_day > 1)처럼 소수 경과일이 있으면 float64
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# side별 박스 정보 키 (bear: 저점 -> 고점, bull: 고점 -> 저점)
+EXTREME_KEYS = {"bear": "Peak", "bull": "Low"}
+MOVE_KEYS = {"bear": "Rise_Percent", "bull": "Drop_Percent"}
+
+# (필드, dtype) - 순서가 곧 JSON 키 순서
+FIELDS = [
+    ("cycle", np.int64),
+    ("box_id", np.int64),
+    ("start_day", np.int64),
+    ("start_timestamp", object),
+    ("start_rate", np.float64),
+    ("extreme_day", np.int64),
+    ("extreme_timestamp", object),
+    ("extreme_rate", np.float64),
+    ("end_day", np.int64),
+    ("end_timestamp", object),
+    ("end_rate", np.float64),
+    ("move_percent", np.float64),
+    ("duration_days", np.int64),
+    ("box_broken", np.bool_),
+]
+FIELD_NAMES = [name for name, _ in FIELDS]
+
+# 경과일 컬럼 (시간봉이면 소수 - 정수로 자르면 같은 날 박스가 겹치고 기간이 틀어짐)
+DAY_FIELDS = ("start_day", "extreme_day", "end_day", "duration_days")
+
+
+def day_dtype(columns):
+    """경과일 컬럼 dtype (하나라도 소수면 float64, 아니면 int64)"""
+    for name in DAY_FIELDS:
+        values = np.asarray(columns[name], dtype=np.float64)
+        if np.any(values != np.round(values)):
+            return np.float64
+    return np.int64
+
+
+def json_keys(side):
+    """필드 -> 기존 박스 정보 키 (03 / 04 create_box_info와 같은 이름)"""
+    extreme = EXTREME_KEYS[side]
+    return {
+        "cycle": "Cycle",
+        "box_id": "Box_ID",
+        "start_day": "Start_Day",
+        "start_timestamp": "Start_Timestamp",
+        "start_rate": "Start_Rate",
+        "extreme_day": f"{extreme}_Day",
+        "extreme_timestamp": f"{extreme}_Timestamp",
+        "extreme_rate": f"{extreme}_Rate",
+        "end_day": "End_Day",
+        "end_timestamp": "End_Timestamp",
+        "end_rate": "End_Rate",
+        "move_percent": MOVE_KEYS[side],
+        "duration_days": "Duration_Days",
+        "box_broken": "Box_Broken",
+    }
+
+
+@dataclass(slots=True)
+class BoxRecord:
+    """박스 1개"""
+
+    side: str
+    cycle: int
+    box_id: int
+    start_day: int | float
+    start_timestamp: str
+    start_rate: float
+    extreme_day: int | float
+    extreme_timestamp: str
+    extreme_rate: float
+    end_day: int | float
+    end_timestamp: str
+    end_rate: float
+    move_percent: float
+    duration_days: int | float
+    box_broken: bool
+
+    def to_info(self):
+        """기존 박스 정보 dict (Start_Day, Peak_Rate ...)"""
+        keys = json_keys(self.side)
+        return {keys[name]: getattr(self, name) for name in FIELD_NAMES}
+
+
+class BoxTable:
+    """한 사이클 / side의 박스 목록 (필드별 병렬 배열)"""
+
+    def __init__(self, side, columns):
+        if side not in EXTREME_KEYS:
+            raise ValueError(f"알 수 없는 side: {side}")
+        self.side = side
+        days_dtype = day_dtype(columns)
+        self.columns = {
+            name: np.asarray(
+                columns[name], dtype=days_dtype if name in DAY_FIELDS else dtype
+            )
+            for name, dtype in FIELDS
+        }
+
+    @classmethod
+    def empty(cls, side):
+        return cls(side, {name: [] for name in FIELD_NAMES})
+
+    @classmethod
+    def from_engine(cls, side, cycle_num, days, dates, low, high, raw_boxes):
+        """box_engine 결과(인덱스 / 비율) -> 테이블 (날짜 / 비율은 인덱스로 한 번에 조회)
+
+        종료 비율은 bear면 저가, bull이면 고가 배열에서 가져옴
+        """
+        if not raw_boxes:
+            return cls.empty(side)
+
+        key = EXTREME_KEYS[side].lower()
+        days = np.asarray(days)
+        dates = np.asarray(dates, dtype=object)
+        start_idx = np.array([box["start_idx"] for box in raw_boxes])
+        extreme_idx = np.array([box[f"{key}_idx"] for box in raw_boxes])
+        end_idx = np.array([box["end_idx"] for box in raw_boxes])
+        start_rate = np.array([box["start_rate"] for box in raw_boxes], dtype=float)
+        extreme_rate = np.array([box[f"{key}_rate"] for box in raw_boxes], dtype=float)
+        end_rates = np.asarray(low if side == "bear" else high, dtype=float)
+
+        return cls(
+            side,
+            {
+                "cycle": np.full(len(raw_boxes), int(cycle_num)),
+                "box_id": np.arange(1, len(raw_boxes) + 1),
+                "start_day": days[start_idx],
+                "start_timestamp": dates[start_idx],
+                "start_rate": np.round(start_rate, 2),
+                "extreme_day": days[extreme_idx],
+                "extreme_timestamp": dates[extreme_idx],
+                "extreme_rate": np.round(extreme_rate, 2),
+                "end_day": days[end_idx],
+                "end_timestamp": dates[end_idx],
+                "end_rate": np.round(end_rates[end_idx], 2),
+                "move_percent": np.round(np.abs(extreme_rate - start_rate), 2),
+                "duration_days": days[end_idx] - days[start_idx],
+                "box_broken": [box["broken"] for box in raw_boxes],
+            },
+        )
+
+    @classmethod
+    def from_records(cls, side, records):
+        return cls(
+            side,
+            {name: [getattr(record, name) for record in records] for name in FIELD_NAMES},
+        )
+
+    def __len__(self):
+        return len(self.columns["box_id"])
+
+    def __getitem__(self, i):
+        values = (self.columns[name][i] for name in FIELD_NAMES)
+        return BoxRecord(
+            self.side,
+            *(value.item() if isinstance(value, np.generic) else value for value in values),
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+    def to_json_list(self, colors=None):
+        """기존 박스 정보 dict 목록 (HTML 템플릿용, colors를 주면 순서대로 color 키 추가)"""
+        keys = json_keys(self.side)
+        names = [keys[name] for name in FIELD_NAMES]
+        values = [self.columns[name].tolist() for name in FIELD_NAMES]
+        boxes = [dict(zip(names, row)) for row in zip(*values)]
+        if colors:
+            for i, box in enumerate(boxes):
+                box["color"] = colors[i % len(colors)]
+        return boxes
+
+    def to_rows(self, param_set):
+        """bitcoin_box_ranges 행 목록 (cycle_number, side, param_set, box_id, ...)"""
+        names = FIELD_NAMES[1:]
+        values = [self.columns[name].tolist() for name in names]
+        return [
+            {
+                "cycle_number": cycle,
+                "side": self.side,
+                "param_set": param_set,
+                **dict(zip(names, row)),
+            }
+            for cycle, *row in zip(self.columns["cycle"].tolist(), *values)
+        ]
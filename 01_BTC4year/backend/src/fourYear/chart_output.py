@@ -0,0 +1,197 @@
+"""
+차트 HTML 출력 (입력이 바뀐 경우에만 재생성)
+- 입력(사이클 데이터 / 박스 / 설정값)과 템플릿 버전(생성 스크립트 + 페이로드 / 런타임 소스)의
+  fingerprint를 출력 폴더의 manifest(chart_manifest.json)와 비교
+- 같고 파일도 있으면 렌더링 / 쓰기를 건너뜀 (CDN 캐시 / 저장소 변경 최소화)
+- 쓰기는 임시 파일에 쓴 뒤 os.replace로 교체 (중간에 실패해도 기존 파일 유지)
+- 병렬 워커(cycle_pool)는 manifest를 읽기만 하고, 갱신 항목은 부모가 모아서 한 번에 저장
+- HTML / JSON / 런타임 파일마다 최고 압축 수준의 .gz(brotli 모듈이 있으면 .br도) 사본을 미리 생성
+  (정적 호스팅이 압축본을 그대로 전송, 원본보다 오래된 사본만 스레드 풀에서 병렬로 다시 압축)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+MANIFEST_NAME = "chart_manifest.json"
+COMPRESS_SUFFIXES = (".html", ".json", ".js", ".css")  # 압축 사본을 만들 파일
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def _update_hash(h, value):
+    """값 종류별로 해시에 반영 (DataFrame / ndarray는 내용 바이트, dict는 키 순서 고정)"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        names = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+        h.update(repr(list(names)).encode())
+        h.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        if value.dtype == object:
+            h.update(repr(value.tolist()).encode())
+        else:
+            h.update(f"{value.dtype}{value.shape}".encode())
+            h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value):
+            h.update(repr(key).encode())
+            _update_hash(h, value[key])
+    elif isinstance(value, (list, tuple)):
+        h.update(f"[{len(value)}]".encode())
+        for item in value:
+            _update_hash(h, item)
+    else:
+        h.update(repr(value).encode())
+    h.update(b"|")
+
+
+def fingerprint(*parts):
+    """입력값들의 sha256 (DataFrame / ndarray / dict / list / 스칼라)"""
+    h = hashlib.sha256()
+    for part in parts:
+        _update_hash(h, part)
+    return h.hexdigest()
+
+
+TEMPLATE_SOURCES = (
+    "chart_payload.py",
+    "chart_runtime.py",
+    "static/chart_runtime.js",
+    "static/chart_runtime.css",
+)
+
+
+def template_version(script_file):
+    """생성 스크립트 + 페이로드 / 런타임 소스 해시 (템플릿 / 런타임을 고치면 자동으로 재생성)"""
+    base = Path(__file__).resolve().parent
+    h = hashlib.sha256()
+    for path in (Path(script_file), *(base / name for name in TEMPLATE_SOURCES)):
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def load_manifest(output_dir):
+    """{파일명: fingerprint} (없거나 읽기 실패 시 빈 dict)"""
+    path = Path(output_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def atomic_write(path, content):
+    """임시 파일에 쓴 뒤 교체 (content: str이면 UTF-8 텍스트, bytes면 그대로)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    if isinstance(content, bytes):
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+    os.replace(tmp_path, path)
+
+
+def update_manifest(output_dir, entries):
+    """재생성한 항목({파일명: fingerprint})을 현재 manifest에 합쳐서 저장"""
+    if not entries:
+        return
+    manifest = load_manifest(output_dir)
+    manifest.update(entries)
+    atomic_write(
+        Path(output_dir) / MANIFEST_NAME, json.dumps(manifest, indent=2, sort_keys=True)
+    )
+
+
+def is_current(path, chart_fingerprint, manifest):
+    """manifest의 fingerprint가 같고 파일이 있으면 True (재생성 불필요)"""
+    path = Path(path)
+    return manifest.get(path.name) == chart_fingerprint and path.exists()
+
+
+def print_summary(results):
+    """results: [(파일명, fingerprint, 재생성 여부)]"""
+    regenerated = sum(1 for _, _, written in results if written)
+    print(f"📄 차트 재생성 {regenerated}개, 변경 없음(건너뜀) {len(results) - regenerated}개")
+
+
+def _load_brotli():
+    """brotli 모듈 (설치되어 있지 않으면 None)"""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _is_stale(source, sibling):
+    return not sibling.exists() or sibling.stat().st_mtime < source.stat().st_mtime
+
+
+def _compress_file(path, brotli):
+    """파일 하나의 .gz / .br 사본 생성 -> (원본, gzip, brotli) 바이트 수 (brotli 없으면 None)"""
+    data = path.read_bytes()
+    # mtime=0: 내용이 같으면 .gz도 바이트 단위로 같음
+    gz = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    atomic_write(path.with_name(f"{path.name}.gz"), gz)
+    br_size = None
+    if brotli is not None:
+        br = brotli.compress(data, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+        atomic_write(path.with_name(f"{path.name}.br"), br)
+        br_size = len(br)
+    return len(data), len(gz), br_size
+
+
+def precompress(output_dir, workers=None):
+    """
+    출력 폴더(하위 폴더 포함)의 HTML / JSON / JS / CSS 압축 사본 갱신
+    - 사본이 없거나 원본보다 오래된 파일만 병렬 압축 -> [(경로, 원본, gzip, brotli 바이트 수)]
+    - brotli 모듈이 없으면 .gz만 만들고, 원본보다 오래된 .br은 삭제 (낡은 압축본 전송 방지)
+    - manifest(MANIFEST_NAME)는 빌드 내부용이라 압축하지 않음 (이전에 만든 사본은 삭제)
+    """
+    brotli = _load_brotli()
+    targets = []
+    for path in sorted(Path(output_dir).rglob("*")):
+        if path.suffix not in COMPRESS_SUFFIXES or not path.is_file():
+            continue
+        if path.name == MANIFEST_NAME:
+            for suffix in (".gz", ".br"):
+                path.with_name(f"{path.name}{suffix}").unlink(missing_ok=True)
+            continue
+        gz_path = path.with_name(f"{path.name}.gz")
+        br_path = path.with_name(f"{path.name}.br")
+        if brotli is None and br_path.exists() and _is_stale(path, br_path):
+            br_path.unlink()
+        if _is_stale(path, gz_path) or (brotli is not None and _is_stale(path, br_path)):
+            targets.append(path)
+
+    if not targets:
+        return []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        sizes = executor.map(lambda path: _compress_file(path, brotli), targets)
+        return [(str(path), *size) for path, size in zip(targets, sizes)]
+
+
+def print_compression(results):
+    """results: precompress 결과 -> 압축 전 / 후 바이트 합계"""
+    if not results:
+        print("🗜️ 압축 사본 최신 (건너뜀)")
+        return
+    raw = sum(r[1] for r in results)
+    gz = sum(r[2] for r in results)
+    summary = f"gzip {gz:,} bytes ({gz / raw:.1%})"
+    if results[0][3] is not None:
+        br = sum(r[3] for r in results)
+        summary += f", brotli {br:,} bytes ({br / raw:.1%})"
+    else:
+        summary += ", brotli 모듈 없음 - .br 생략"
+    print(f"🗜️ 압축 사본 {len(results)}개: 원본 {raw:,} bytes -> {summary}")
@@ -0,0 +1,97 @@
+"""
+ApexCharts HTML용 컬럼형 시리즈 페이로드
+- 점마다 {"x": .., "y": ..} 객체를 만들지 않고 병렬 배열 {"x": [...], "y": [...]}로 직렬화
+  (키 반복이 없어 HTML 크기 / JSON.parse 시간 감소)
+- 박스 정보는 점마다 복사하지 않고 boxes 배열 인덱스(없으면 -1)로 참조
+- 브라우저에서는 공통 런타임(static/chart_runtime.js)의 decodeSeries()로 ApexCharts 점 배열 복원
+- 긴 시리즈는 LTTB(Largest-Triangle-Three-Buckets)로 점 예산(budget)만큼 다운샘플
+  (최저 / 최고점과 박스 경계점은 항상 유지)
+- 다중 해상도: 원본 컬럼 + 개요용 인덱스(lod)를 함께 넣고, 확대하면 보이는 구간만 원본 점으로 전환
+"""
+
+import numpy as np
+
+
+def xy_columns(x, y, decimals=2):
+    """x(경과일) / y(비율) 배열 -> {"x": [...], "y": [...]} (y는 소수 decimals자리 반올림)"""
+    return {
+        "x": np.asarray(x, dtype=np.int64).tolist(),
+        "y": np.round(np.asarray(y, dtype=float), decimals).tolist(),
+    }
+
+
+def lttb_indices(x, y, budget):
+    """LTTB로 고른 점 인덱스 (첫 / 끝 점 포함 budget개, 점 수가 budget 이하이면 전체)"""
+    n = len(y)
+    if budget is None or n <= budget or budget < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # 첫 / 끝 점을 뺀 구간을 budget - 2개 버킷으로 나누고 버킷 평균은 한 번에 계산
+    edges = np.linspace(1, n - 1, budget - 1).astype(np.int64)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[: n - 1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y[: n - 1], edges[:-1]) / counts
+    # 버킷마다 삼각형의 세 번째 꼭짓점 = 다음 버킷 평균 (마지막 버킷은 끝 점)
+    next_x = np.append(avg_x[1:], x[-1])
+    next_y = np.append(avg_y[1:], y[-1])
+
+    selected = np.empty(budget, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for b in range(budget - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # 직전 선택점(a) - 버킷 후보 - 다음 버킷 평균이 만드는 삼각형 넓이 (x2)
+        area = np.abs(
+            (x[a] - next_x[b]) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (next_y[b] - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[b + 1] = a
+    return selected
+
+
+def downsample_indices(x, y, budget, keep=()):
+    """LTTB 인덱스 + 반드시 남길 점(최저 / 최고점, keep) 인덱스 (정렬, 중복 제거)"""
+    n = len(y)
+    if budget is None or n <= budget:
+        return np.arange(n)
+
+    y = np.asarray(y, dtype=float)
+    required = np.unique(
+        np.concatenate([[np.argmin(y), np.argmax(y)], np.asarray(keep, dtype=np.int64)])
+    )
+    picked = lttb_indices(x, y, max(budget - len(required), 3))
+    return np.union1d(picked, required)
+
+
+def boundary_indices(days, *boundary_days):
+    """경계 날짜들(박스 시작 / 극값 / 종료일 등) -> 정렬된 days에서의 위치 (days에 없는 날짜는 제외)"""
+    days = np.asarray(days)
+    targets = np.concatenate([np.asarray(d, dtype=np.int64) for d in boundary_days])
+    if not len(days) or not len(targets):
+        return np.array([], dtype=np.int64)
+    idx = np.minimum(np.searchsorted(days, targets), len(days) - 1)
+    return idx[days[idx] == targets]
+
+
+def take_columns(columns, index):
+    """컬럼형 페이로드에서 index 위치의 점만 추출"""
+    return {key: [values[i] for i in index] for key, values in columns.items()}
+
+
+def level_of_detail(columns, budget, keep=(), multi_resolution=True):
+    """
+    컬럼형 페이로드 다운샘플 (점 수가 budget 이하이면 그대로)
+    - multi_resolution: 원본 컬럼에 개요용 인덱스(lod)만 추가 (브라우저 decodeVisible로 전환)
+    - 아니면 다운샘플한 점만 남김
+    """
+    index = downsample_indices(columns["x"], columns["y"], budget, keep)
+    if len(index) >= len(columns["x"]):
+        return columns
+    if multi_resolution:
+        return {**columns, "lod": index.tolist()}
+    return take_columns(columns, index)
@@ -0,0 +1,101 @@
+"""
+차트 공통 정적 런타임 (JS / CSS) + 페이지 셸
+- 렌더링 코드(디코더 / 박스 사각형 / 툴팁 / 툴바)와 스타일은 static/chart_runtime.js / .css 한 벌
+- 출력 폴더 static/에 내용 해시를 붙인 이름(chart_runtime.<hash>.js)으로 한 번만 복사
+  (내용이 같으면 이름도 같아서 모든 사이클 페이지가 브라우저 / CDN 캐시를 공유, 고치면 새 이름)
+- 페이지 HTML은 미리 컴파일한 string.Template 셸에 제목 / 본문 / 차트 데이터(JSON)만 채움
+  (데이터는 페이지 안 <script type="application/json">에 두어 file://로 열어도 동작)
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from string import Template
+
+from chart_output import atomic_write
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+RUNTIME_FILES = ("chart_runtime.js", "chart_runtime.css")
+HASH_LENGTH = 8
+
+
+def _hashed_name(path):
+    """chart_runtime.js -> chart_runtime.<내용 해시>.js"""
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+    return f"{path.stem}.{digest}{path.suffix}"
+
+
+# {원본 파일명: 출력 폴더 기준 상대 경로}
+RUNTIME_ASSETS = {
+    name: f"static/{_hashed_name(STATIC_DIR / name)}" for name in RUNTIME_FILES
+}
+
+PAGE_TEMPLATE = Template(
+    """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+    <script src="https://cdn.jsdelivr.net/npm/apexcharts"></script>
+    <link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;500;600;700&family=Inter:wght@400;500;600;700;800&display=swap" rel="stylesheet">
+    <link href="$css" rel="stylesheet">
+    <script src="$js"></script>
+</head>
+<body class="$page_class">
+$body
+    <script type="application/json" id="chart-data">$data</script>
+    <script>$render(readChartData('chart-data'));</script>
+</body>
+</html>"""
+)
+
+BOX_PAGE_BODY = Template(
+    """    <div class="container">
+        <div class="chart-wrapper">
+            <div class="header">
+                <div>
+                    <h2>$heading</h2>
+                    <p>$subtitle</p>
+                </div>
+            </div>
+            <div id="chart"></div>
+            <div class="footer">$footer</div>
+        </div>
+    </div>"""
+)
+
+
+def publish_runtime(output_dir):
+    """런타임 JS / CSS를 출력 폴더 static/에 복사 (같은 해시 파일이 있으면 건너뜀) -> 새로 쓴 경로"""
+    written = []
+    for name, relative in RUNTIME_ASSETS.items():
+        path = Path(output_dir) / relative
+        if path.exists():
+            continue
+        atomic_write(path, (STATIC_DIR / name).read_text(encoding="utf-8"))
+        written.append(str(path))
+    if written:
+        print(f"💾 차트 런타임 저장: {', '.join(written)}")
+    return written
+
+
+def render_page(title, body, render, data, page_class=""):
+    """페이지 셸 채우기 (render: 런타임 초기화 함수 이름, data: JSON으로 넘길 차트 데이터)"""
+    # </script>가 데이터 안에 있어도 태그가 끝나지 않도록 이스케이프
+    data_json = json.dumps(data).replace("</", "<\\/")
+    return PAGE_TEMPLATE.substitute(
+        title=title,
+        css=RUNTIME_ASSETS["chart_runtime.css"],
+        js=RUNTIME_ASSETS["chart_runtime.js"],
+        page_class=page_class,
+        body=body,
+        data=data_json,
+        render=render,
+    )
+
+
+def render_box_page(title, heading, subtitle, footer, data):
+    """03 / 04 박스권 페이지 (renderBoxChart)"""
+    body = BOX_PAGE_BODY.substitute(heading=heading, subtitle=subtitle, footer=footer)
+    return render_page(title, body, "renderBoxChart", data, "box-page")
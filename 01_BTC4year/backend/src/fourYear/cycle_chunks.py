@@ -0,0 +1,199 @@
+"""
+사이클 시계열 정적 청크 (프론트엔드 캐시용)
+- 끝난 사이클(마지막 사이클 이전)은 사이클당 청크 하나, 파일명에 내용 해시 (cycle1_0.<hash>.json)
+  -> 내용이 같으면 이름도 같으므로 브라우저 / CDN이 무기한 캐시
+- 진행 중인 사이클은 CHUNK_DAYS일 단위로 나눠 다 채운 구간은 해시 청크,
+  나머지 며칠만 작은 tail 청크(cycle4_tail.json)로 매일 교체
+  (고점이 바뀌어 비율이 다시 계산되면 해시도 바뀌어 새 이름으로 저장)
+- cycle_manifest.json: 사이클별 청크 목록 (프론트엔드는 manifest와 tail만 매일 새로 받음)
+- 청크는 컬럼형 {"cycle_number", "days_since_peak", "timestamp", "close_rate", "low_rate", "high_rate"}
+- 출력은 선택 사항: CYCLE_CHUNK_DIR 환경 변수로 폴더를 지정했을 때만 01이 청크를 갱신
+  (기존 청크 + 01이 이번에 저장한 행을 합쳐 만들므로 사이클 데이터를 다시 조회하지 않음)
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+
+from chart_output import atomic_write, precompress, print_compression
+
+# ==================== 설정 ====================
+CHUNK_DIR = os.getenv("CYCLE_CHUNK_DIR")  # 없으면 청크 출력 안 함
+CHUNK_MANIFEST_NAME = "cycle_manifest.json"
+CHUNK_DAYS = 365  # 진행 중인 사이클의 고정 청크 크기 (일)
+# 청크 컬럼(bitcoin_cycle_data 컬럼명) -> CycleCube metric
+CHUNK_METRICS = {"close_rate": "rate", "low_rate": "low_rate", "high_rate": "high_rate"}
+HASH_LENGTH = 12
+# 이 모듈이 만든 청크 파일 (manifest에 없는 해시 청크는 정리)
+CHUNK_FILE_PATTERN = re.compile(r"^cycle\d+_(\d+\.[0-9a-f]+|tail)\.json$")
+
+
+def _column(values):
+    """float 배열 -> JSON 리스트 (NaN은 null)"""
+    return [None if math.isnan(v) else v for v in values.tolist()]
+
+
+def _serialize(payload):
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _chunk_payload(cycle_num, arrays, lo, hi):
+    """cycle_slice 결과의 [lo, hi) 구간 -> 컬럼형 청크"""
+    payload = {
+        "cycle_number": cycle_num,
+        "days_since_peak": arrays["days"][lo:hi].tolist(),
+        "timestamp": [str(ts) for ts in arrays["dates"][lo:hi]],
+    }
+    for column, metric in CHUNK_METRICS.items():
+        payload[column] = _column(arrays[metric][lo:hi])
+    return payload
+
+
+def build_chunks(cube, chunk_days=CHUNK_DAYS):
+    """
+    큐브 -> [(사이클 번호, manifest 항목, 직렬화된 bytes)]
+    - 끝난 사이클: 사이클 전체가 해시 청크 하나
+    - 마지막 사이클: chunk_days일 단위로 다 채운 구간은 해시 청크, 나머지는 tail
+    """
+    current = int(cube.cycles.max())
+    chunks = []
+    for cycle_num in cube.cycles.tolist():
+        arrays = cube.cycle_slice(cycle_num, CHUNK_METRICS.values())
+        days = arrays["days"]
+        if not len(days):
+            continue
+
+        if cycle_num < current:
+            bounds = [(0, len(days), False)]
+        else:
+            # 마지막 날이 속한 구간 시작일 이전까지는 고정, 그 뒤는 tail
+            tail_start = int(days[-1]) // chunk_days * chunk_days
+            edges = list(range(0, tail_start, chunk_days))
+            positions = [int(p) for p in days.searchsorted(edges + [tail_start])]
+            bounds = [
+                (lo, hi, False) for lo, hi in zip(positions[:-1], positions[1:]) if hi > lo
+            ]
+            bounds.append((positions[-1], len(days), True))
+
+        for lo, hi, is_tail in bounds:
+            data = _serialize(_chunk_payload(cycle_num, arrays, lo, hi))
+            digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+            entry = {
+                "min_day": int(days[lo]),
+                "max_day": int(days[hi - 1]),
+                "rows": hi - lo,
+            }
+            if is_tail:
+                # 이름이 고정이므로 version(해시)을 쿼리로 붙여 캐시 무효화
+                entry["file"] = f"cycle{cycle_num}_tail.json"
+                entry["version"] = digest
+            else:
+                entry["file"] = f"cycle{cycle_num}_{int(days[lo])}.{digest}.json"
+            chunks.append((cycle_num, entry, data))
+    return chunks
+
+
+def load_chunk_rows(output_dir=CHUNK_DIR):
+    """저장된 청크 -> Long format DataFrame (manifest가 없거나 읽을 수 없으면 None)"""
+    output_dir = Path(output_dir)
+    try:
+        manifest = json.loads((output_dir / CHUNK_MANIFEST_NAME).read_bytes())
+        chunks = [
+            json.loads((output_dir / entry["file"]).read_bytes())
+            for cycle in manifest["cycles"]
+            for entry in cycle["chunks"]
+        ]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    frames = [pd.DataFrame(chunk) for chunk in chunks]
+    if not frames:
+        return None
+    return pd.concat(frames, ignore_index=True)
+
+
+def merge_chunk_rows(existing, rows):
+    """
+    기존 청크 행 + 01이 이번에 저장한 행 (저장소와 같은 규칙으로 교체)
+    - rows에 있는 사이클은 rows의 첫 날부터 새 행으로 교체 (전체 분석 / Peak 변경은 0일부터 전부)
+    - rows의 마지막 사이클보다 뒤 사이클은 삭제 (전체 분석에서 사이클 경계가 바뀐 경우)
+    """
+    if rows.empty:
+        return existing
+    first_day = rows.groupby("cycle_number")["days_since_peak"].min()
+    cycle_first = existing["cycle_number"].map(first_day)
+    keep = (existing["cycle_number"] <= rows["cycle_number"].max()) & ~(
+        existing["days_since_peak"] >= cycle_first
+    )
+    merged = pd.concat([existing[keep], rows], ignore_index=True)
+    return merged.sort_values(["cycle_number", "days_since_peak"], ignore_index=True)
+
+
+def rows_summary(rows):
+    """사이클별 (사이클 번호, 행 개수, 마지막 경과일) - 저장소 요약(cycle_loader.get_cache_key)과 비교용"""
+    grouped = rows.groupby("cycle_number")["days_since_peak"].agg(["size", "max"])
+    return [
+        (int(cycle_num), int(count), int(max_day))
+        for cycle_num, count, max_day in grouped.itertuples()
+    ]
+
+
+def _write_if_changed(path, data):
+    """내용이 다를 때만 쓰기 -> 썼으면 True"""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    atomic_write(path, data)
+    return True
+
+
+def publish_cycle_chunks(cube, output_dir=CHUNK_DIR, chunk_days=CHUNK_DAYS):
+    """사이클 청크 + manifest 저장 (바뀐 파일만 쓰고, manifest에 없는 청크는 삭제) -> manifest"""
+    if cube is None or not len(cube.cycles):
+        print("[WARN] 청크로 저장할 사이클 데이터가 없습니다")
+        return None
+
+    output_dir = Path(output_dir)
+    chunks = build_chunks(cube, chunk_days)
+
+    cycles = {}
+    written = 0
+    for cycle_num, entry, data in chunks:
+        cycles.setdefault(cycle_num, []).append(entry)
+        written += _write_if_changed(output_dir / entry["file"], data)
+
+    manifest = {
+        "version": 1,
+        "chunk_days": chunk_days,
+        "columns": ["cycle_number", "days_since_peak", "timestamp", *CHUNK_METRICS],
+        "cycles": [
+            {"cycle_number": cycle_num, "chunks": entries}
+            for cycle_num, entries in cycles.items()
+        ],
+    }
+    _write_if_changed(
+        output_dir / CHUNK_MANIFEST_NAME,
+        json.dumps(manifest, indent=2).encode("utf-8"),
+    )
+
+    # 이전 실행의 해시 청크 중 manifest에서 빠진 파일 (압축 사본 포함) 정리
+    referenced = {entry["file"] for _, entry, _ in chunks}
+    removed = 0
+    for path in output_dir.iterdir():
+        name = re.sub(r"\.(gz|br)$", "", path.name)
+        if CHUNK_FILE_PATTERN.match(name) and name not in referenced:
+            path.unlink()
+            removed += path.name == name
+
+    tail = chunks[-1][1]
+    total_bytes = sum(len(data) for _, _, data in chunks)
+    print(
+        f"💾 사이클 청크 저장: {output_dir} (청크 {len(chunks)}개 {total_bytes:,} bytes, "
+        f"새로 씀 {written}개, 삭제 {removed}개, tail {tail['rows']}일)"
+    )
+    print_compression(precompress(output_dir))
+    return manifest
@@ -0,0 +1,116 @@
+"""
+사이클 데이터 큐브 (NumPy)
+- values: (metric, cycle, day) float 배열 - 데이터가 없는 칸은 NaN
+- mask: (cycle, day) bool 배열 - 해당 사이클에 그 날짜 데이터가 있으면 True
+- dates: (cycle, day) 날짜 문자열 배열 ("YYYY/MM/DD", 없으면 NaN)
+- to_wide(): 기존 Wide format DataFrame ({cycle}_rate, Days_Since_Peak ...)으로 변환
+"""
+
+import numpy as np
+import pandas as pd
+
+# (Long format 컬럼, Wide format 접미사) - 순서가 곧 metric 축 순서
+METRICS = [
+    ("close_price", "close"),
+    ("low_price", "low"),
+    ("high_price", "high"),
+    ("close_rate", "rate"),
+    ("low_rate", "low_rate"),
+    ("high_rate", "high_rate"),
+]
+METRIC_INDEX = {suffix: i for i, (_, suffix) in enumerate(METRICS)}
+
+
+class CycleCube:
+    """사이클 x 경과일 NumPy 큐브"""
+
+    def __init__(self, cycles, days, values, mask, dates):
+        self.cycles = np.asarray(cycles, dtype=np.int64)
+        self.days = np.asarray(days, dtype=np.int64)
+        self.values = values
+        self.mask = mask
+        self.dates = dates
+        self._cycle_pos = {int(c): i for i, c in enumerate(self.cycles)}
+
+    @classmethod
+    def from_long(cls, df):
+        """Long format(cycle_number, days_since_peak, ...) -> 큐브 (pivot 없이 한 번에 배치)"""
+        cycle_numbers = df["cycle_number"].to_numpy(dtype=np.int64)
+        day_numbers = df["days_since_peak"].to_numpy(dtype=np.int64)
+        cycles = np.unique(cycle_numbers)
+        days = np.unique(day_numbers)
+        ci = np.searchsorted(cycles, cycle_numbers)
+        di = np.searchsorted(days, day_numbers)
+
+        values = np.full((len(METRICS), len(cycles), len(days)), np.nan)
+        for m, (column, _) in enumerate(METRICS):
+            values[m, ci, di] = df[column].to_numpy(dtype=float)
+
+        mask = np.zeros((len(cycles), len(days)), dtype=bool)
+        mask[ci, di] = True
+
+        dates = np.full((len(cycles), len(days)), np.nan, dtype=object)
+        dates[ci, di] = df["timestamp"].to_numpy(dtype=object)
+
+        return cls(cycles, days, values, mask, dates)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.mask.nbytes + self.dates.nbytes
+
+    def has_cycle(self, cycle_num):
+        return int(cycle_num) in self._cycle_pos
+
+    def cycle_index(self, cycle_num):
+        return self._cycle_pos[int(cycle_num)]
+
+    def get(self, metric, cycle_num):
+        """사이클의 metric 배열 (days 축 전체, 없는 날은 NaN) - 복사 없는 view"""
+        return self.values[METRIC_INDEX[metric], self.cycle_index(cycle_num)]
+
+    def get_dates(self, cycle_num):
+        return self.dates[self.cycle_index(cycle_num)]
+
+    def valid(self, cycle_num):
+        return self.mask[self.cycle_index(cycle_num)]
+
+    def cycle_slice(self, cycle_num, metrics=None):
+        """사이클의 데이터가 있는 날만 모은 배열 dict (days, dates, metric별 값)"""
+        i = self.cycle_index(cycle_num)
+        valid = self.mask[i]
+        result = {"days": self.days[valid], "dates": self.dates[i, valid]}
+        for metric in metrics or METRIC_INDEX:
+            result[metric] = self.values[METRIC_INDEX[metric], i, valid]
+        return result
+
+    def select_days(self, min_days=None, max_days=None):
+        """days_since_peak 범위로 자른 큐브 (범위에 데이터가 없는 사이클은 제외)"""
+        lo = 0 if min_days is None else int(np.searchsorted(self.days, min_days, "left"))
+        hi = (
+            len(self.days)
+            if max_days is None
+            else int(np.searchsorted(self.days, max_days, "right"))
+        )
+        keep = self.mask[:, lo:hi].any(axis=1)
+        return CycleCube(
+            self.cycles[keep],
+            self.days[lo:hi],
+            self.values[:, keep, lo:hi],
+            self.mask[keep, lo:hi],
+            self.dates[keep, lo:hi],
+        )
+
+    def to_wide(self, min_days=None, max_days=None):
+        """기존 Wide format DataFrame으로 변환 (호환용)"""
+        cube = self.select_days(min_days, max_days)
+        # 어떤 사이클에도 데이터가 없는 날은 pivot 결과에 없으므로 제외
+        rows = cube.mask.any(axis=0)
+
+        columns = {"Days_Since_Peak": cube.days[rows]}
+        for c, cycle_num in enumerate(cube.cycles):
+            columns[f"{cycle_num}_timestamp"] = cube.dates[c, rows]
+        for m, (_, suffix) in enumerate(METRICS):
+            for c, cycle_num in enumerate(cube.cycles):
+                columns[f"{cycle_num}_{suffix}"] = cube.values[m, c, rows]
+
+        return pd.DataFrame(columns)
@@ -0,0 +1,86 @@
+"""
+사이클 데이터 공용 로더 (02 / 03 / 04 스크립트)
+- bitcoin_cycle_data 전체를 한 번 받아 CycleCube(NumPy)로 변환 후 디스크에 캐시
+- 캐시 유효성: 사이클별 (row_count, max_days_since_peak) - 요약 뷰 1회 조회로 확인
+- days_since_peak 범위(min_days / max_days) 필터는 캐시된 큐브에서 처리
+"""
+
+import os
+import pickle
+import time
+from pathlib import Path
+
+from cycle_cube import CycleCube
+from cycle_storage import get_storage
+
+# ==================== 설정 ====================
+CACHE_PATH = Path(__file__).resolve().parent / "cycle_data_cache.pkl"
+
+
+def get_cache_key(storage):
+    """캐시 무효화 키 (저장소 이름 + 사이클별 row_count / max_days_since_peak)"""
+    return [storage.name] + [
+        (int(row["cycle_number"]), int(row["row_count"]), int(row["max_days_since_peak"]))
+        for row in storage.get_cycle_summary()
+    ]
+
+
+def read_cache(key, cache_path=CACHE_PATH):
+    if not cache_path.exists():
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None
+    return cached.get("cube") if cached.get("key") == key else None
+
+
+def write_cache(key, cube, cache_path=CACHE_PATH):
+    tmp_path = cache_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump({"key": key, "cube": cube}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+
+def load_cycle_cube(storage=None, use_cache=True, cache_path=CACHE_PATH):
+    """사이클 데이터를 CycleCube로 로드 (캐시 우선)"""
+    start_time = time.time()
+    try:
+        storage = storage or get_storage()
+        key = get_cache_key(storage)
+
+        cube = read_cache(key, cache_path) if use_cache else None
+        if cube is not None:
+            source = "캐시"
+        else:
+            df = storage.fetch_cycle_rows()
+            if df.empty:
+                print("데이터베이스에서 사이클 데이터를 찾을 수 없습니다.")
+                return None
+
+            cube = CycleCube.from_long(df)
+            if use_cache:
+                write_cache(key, cube, cache_path)
+            source = storage.name
+
+        print(
+            f"{source}에서 사이클 {len(cube.cycles)}개 x {len(cube.days)}일 로드 "
+            f"({time.time() - start_time:.2f}초)"
+        )
+        return cube
+
+    except Exception as e:
+        print(f"데이터 로드 오류: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return None
+
+
+def load_cycle_data(min_days=None, max_days=None, storage=None, use_cache=True):
+    """사이클 데이터를 Wide format으로 로드 (기존 02/03/04 스크립트 호환)"""
+    cube = load_cycle_cube(storage, use_cache)
+    if cube is None:
+        return None
+    return cube.to_wide(min_days, max_days)
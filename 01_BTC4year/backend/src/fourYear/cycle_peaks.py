@@ -0,0 +1,133 @@
+"""
+사이클 Peak / Trough 자동 탐지
+- 종가 시계열을 한 번만 순회 (monotonic deque 기반 구간 최대값)
+- 각 지점이 [t - 최소간격, t + 확인기간] 구간의 최고 종가이면 Peak 후보
+- 이전 Peak와 최소간격 이상 떨어진 후보만 Peak로 인정
+- 알려진 Peak 날짜(pinned)를 주면 해당 날짜가 최소간격 이내의 자동 탐지 결과를 대체
+- 진행 중인 마지막 사이클은 확인기간 없이 이전 Peak + 3년 이후 최고 종가 (open_cycle_peak)
+  -> 01 증분 업데이트(find_new_peak)와 같은 규칙이라 전체 분석 / 증분 결과가 같음
+"""
+
+from collections import deque
+
+import numpy as np
+
+ONE_DAY_MS = 86400000
+THREE_YEARS_MS = int(3 * 365.25 * 24 * 60 * 60 * 1000)
+ONE_YEAR_MS = int(365.25 * 24 * 60 * 60 * 1000)
+
+
+def open_cycle_peak(closes, start=0):
+    """진행 중인 사이클의 Peak: start 이후 최고 종가의 첫 위치 (같은 종가면 앞쪽 유지)"""
+    closes = np.asarray(closes, dtype=float)
+    return start + int(np.argmax(closes[start:]))
+
+
+def find_peak_indices(
+    timestamps,
+    closes,
+    min_spacing_ms=THREE_YEARS_MS,
+    pinned=(),
+    confirm_ms=ONE_YEAR_MS,
+):
+    """
+    구간 최대값 + 최소 간격 규칙으로 Peak 인덱스 탐지 (O(n))
+
+    - 후보 구간: [max(t - spacing, 이전 Peak + spacing), t + confirm]
+    - 진행 중인 마지막 사이클은 확인기간 없이 "이전 Peak + spacing 이후 최고 종가"
+      (Peak 후 1년이 지나 더 높은 종가가 나와도 Peak를 옮김 - open_cycle_peak)
+    - pinned 인덱스는 항상 Peak로 채택하고, spacing 이내의 자동 탐지 결과를 대체
+    - 첫 pinned 이전의 자동 탐지 결과는 제외
+    """
+    n = len(closes)
+    pinned = set(pinned)
+    first_pinned = min(pinned) if pinned else 0
+    peaks = []
+    window = deque()  # 종가 내림차순 인덱스 (앞쪽이 구간 최대값)
+    right = 0
+
+    for center in range(n):
+        # 오른쪽 경계: timestamp <= t + confirm 까지 추가
+        while right < n and timestamps[right] <= timestamps[center] + confirm_ms:
+            while window and closes[window[-1]] <= closes[right]:
+                window.pop()
+            window.append(right)
+            right += 1
+
+        if center in pinned:
+            while peaks and timestamps[center] - timestamps[peaks[-1]] < min_spacing_ms:
+                peaks.pop()
+            peaks.append(center)
+            continue
+
+        # 왼쪽 경계: 이전 Peak + spacing 이전과 t - spacing 이전은 제거
+        left_ts = timestamps[center] - min_spacing_ms
+        if peaks:
+            left_ts = max(left_ts, timestamps[peaks[-1]] + min_spacing_ms)
+        while window and timestamps[window[0]] < left_ts:
+            window.popleft()
+
+        if center < first_pinned or not window:
+            continue
+        if closes[center] < closes[window[0]]:
+            continue
+        if peaks and timestamps[center] - timestamps[peaks[-1]] < min_spacing_ms:
+            continue
+        peaks.append(center)
+
+    # 마지막 자동 탐지 Peak 이후로는 다음 Peak가 없으므로 그 뒤 최고 종가로 이동
+    if peaks and peaks[-1] not in pinned:
+        peaks[-1] = open_cycle_peak(closes, peaks[-1])
+
+    return peaks
+
+
+def detect_cycles(
+    timestamps,
+    closes,
+    pinned_timestamps=None,
+    min_spacing_ms=THREE_YEARS_MS,
+    confirm_ms=ONE_YEAR_MS,
+    first_cycle_number=1,
+):
+    """
+    사이클 경계 탐지 (사이클 번호는 first_cycle_number부터)
+
+    Returns:
+        list[dict]: 사이클별 cycle_number, peak_ts, peak_close, trough_ts,
+                    trough_close, end_ts(다음 Peak 전날, 진행 중이면 None)
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    closes = np.asarray(closes, dtype=float)
+    if len(closes) == 0:
+        return []
+
+    pinned = []
+    for ts in pinned_timestamps or []:
+        idx = int(np.searchsorted(timestamps, ts))
+        if idx < len(timestamps) and timestamps[idx] == ts:
+            pinned.append(idx)
+
+    peaks = find_peak_indices(
+        timestamps.tolist(), closes.tolist(), min_spacing_ms, pinned, confirm_ms
+    )
+
+    cycles = []
+    for i, peak_idx in enumerate(peaks):
+        next_idx = peaks[i + 1] if i + 1 < len(peaks) else len(closes)
+        trough_idx = peak_idx + int(np.argmin(closes[peak_idx:next_idx]))
+        cycles.append(
+            {
+                "cycle_number": first_cycle_number + i,
+                "peak_ts": int(timestamps[peak_idx]),
+                "peak_close": float(closes[peak_idx]),
+                "trough_ts": int(timestamps[trough_idx]),
+                "trough_close": float(closes[trough_idx]),
+                "end_ts": (
+                    int(timestamps[next_idx]) - ONE_DAY_MS
+                    if next_idx < len(closes)
+                    else None
+                ),
+            }
+        )
+    return cycles
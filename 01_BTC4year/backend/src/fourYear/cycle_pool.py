@@ -0,0 +1,64 @@
+"""
+사이클 단위 병렬 실행 (03 / 04 박스 스크립트)
+- 사이클은 서로 독립이므로 사이클별 작업(필터 -> 박스 탐지 -> HTML 렌더링)을 프로세스 풀에서 실행
+- 사이클 데이터는 부모에서 한 번만 로드하고, 워커 초기화(initializer) 때 워커당 한 번만 전달
+- 결과와 워커 출력(print)은 완료 순서와 관계없이 입력(사이클) 순서대로 반환 / 출력
+- 저장소 업로드 / 상태 파일 저장은 부모에서 순서대로 처리 (워커는 계산과 파일 렌더링만)
+- --jobs N: 워커 수 (기본: CPU 개수, 1이면 풀 없이 순차 실행)
+"""
+
+import argparse
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# 워커 프로세스 공유 데이터 (init_worker에서 설정)
+_shared = {}
+
+
+def parse_jobs(default=None, argv=None):
+    """명령행 --jobs 값 (없으면 default)"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default,
+        help="사이클 병렬 워커 수 (1이면 순차 실행, 기본: CPU 개수)",
+    )
+    return parser.parse_args(argv).jobs
+
+
+def init_worker(shared):
+    _shared.update(shared)
+
+
+def run_task(task, args):
+    """워커에서 사이클 하나 실행 -> (결과, 출력 로그)"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = task(_shared, *args)
+    return result, buffer.getvalue()
+
+
+def run_cycles(task, jobs, shared, workers=None):
+    """
+    사이클별 task(shared, *args)를 실행하여 jobs 순서대로 결과를 yield
+    - task는 모듈 최상위 함수여야 함 (워커로 pickle 전달)
+    - 워커 출력은 모아 두었다가 해당 결과를 yield하기 직전에 출력
+    """
+    jobs = list(jobs)
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        for args in jobs:
+            yield task(shared, *args)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(shared,)
+    ) as executor:
+        futures = [executor.submit(run_task, task, args) for args in jobs]
+        for future in futures:
+            result, log = future.result()
+            print(log, end="")
+            yield result
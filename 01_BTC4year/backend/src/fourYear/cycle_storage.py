@@ -0,0 +1,395 @@
+"""
+사이클 파이프라인 저장소 (Supabase / SQLite)
+- CYCLE_STORAGE 환경변수로 선택: "supabase"(기본) 또는 "sqlite"
+- supabase: ohlcv_1day는 로컬 미러를 거쳐 읽고, bitcoin_cycle_data는 Supabase에 저장
+- sqlite: binance_ohlcv_utc.py가 관리하는 ohlcv_1day 테이블에서 읽고,
+          bitcoin_cycle_data를 같은 DB 파일에 저장 (네트워크 없음)
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+from dotenv import load_dotenv
+
+from ohlcv_mirror import fetch_remote_ohlcv, load_ohlcv_from_mirror, sync_ohlcv_mirror
+
+# --- 환경 변수 로드 ---
+env_path = Path(__file__).resolve().parent.parent / ".env"
+load_dotenv(env_path)
+
+# ==================== 설정 ====================
+OHLCV_TABLE_NAME = "ohlcv_1day"
+CYCLE_TABLE_NAME = "bitcoin_cycle_data"
+CYCLE_SUMMARY_VIEW_NAME = "bitcoin_cycle_summary"  # supabase/migrations 참고
+BOX_TABLE_NAME = "bitcoin_box_ranges"  # supabase/migrations 참고
+
+DEFAULT_SQLITE_PATH = (
+    Path(__file__).resolve().parents[4] / "00_OHLCV" / "binance_ohlcv_BTCUSDT.db"
+)
+
+UPSERT_BATCH_SIZE = 500  # Supabase는 한 번에 너무 많은 데이터 삽입 시 문제 발생 가능
+
+FETCH_BATCH_SIZE = 1000  # Supabase 기본 1000개 제한
+
+CYCLE_COLUMNS = [
+    "cycle_number",
+    "cycle_name",
+    "days_since_peak",
+    "timestamp",
+    "close_price",
+    "low_price",
+    "high_price",
+    "close_rate",
+    "low_rate",
+    "high_rate",
+]
+
+BOX_COLUMNS = [
+    "cycle_number",
+    "side",
+    "param_set",
+    "box_id",
+    "start_day",
+    "start_timestamp",
+    "start_rate",
+    "extreme_day",
+    "extreme_timestamp",
+    "extreme_rate",
+    "end_day",
+    "end_timestamp",
+    "end_rate",
+    "move_percent",
+    "duration_days",
+    "box_broken",
+]
+
+
+class CycleStorage:
+    """저장소 공통 인터페이스"""
+
+    name = "base"
+
+    def fetch_ohlcv(self, from_timestamp_ms=None):
+        """OHLCV 조회 (timestamp(ms), close, low, high)"""
+        raise NotImplementedError
+
+    def get_cycle_summary(self, cycle_num=None):
+        """사이클별 row_count / first_timestamp / last_timestamp / max_days_since_peak"""
+        raise NotImplementedError
+
+    def get_cycle_peak_row(self, cycle_num):
+        """사이클의 days_since_peak = 0 행 (timestamp, close_price)"""
+        raise NotImplementedError
+
+    def delete_cycle_rows(self, cycle_num, from_date=None):
+        """사이클 데이터 삭제 (from_date 지정 시 해당 날짜 이후만)"""
+        raise NotImplementedError
+
+    def upsert_cycle_rows(self, records):
+        """사이클 데이터 저장 (cycle_number, days_since_peak 기준 덮어쓰기)"""
+        raise NotImplementedError
+
+    def fetch_cycle_rows(self):
+        """사이클 데이터 전체 조회 (Long format, days_since_peak / cycle_number 순)"""
+        raise NotImplementedError
+
+    def replace_box_rows(self, cycle_num, side, param_set, records):
+        """박스권 결과 교체 (cycle_number, side, param_set 단위로 삭제 후 저장)"""
+        raise NotImplementedError
+
+
+class SupabaseCycleStorage(CycleStorage):
+    name = "supabase"
+
+    def __init__(self, url=None, key=None, use_mirror=None):
+        from supabase import create_client
+
+        url = url or os.getenv("SUPABASE_URL")
+        key = key or os.getenv("SUPABASE_KEY")
+        if not url or not key:
+            raise ValueError("SUPABASE_URL과 SUPABASE_KEY 환경변수를 설정하세요")
+
+        self.client = create_client(url, key)
+        self.use_mirror = (
+            os.getenv("USE_OHLCV_MIRROR", "1") != "0"
+            if use_mirror is None
+            else use_mirror
+        )
+        self.mirror_synced = False  # 미러 동기화는 저장소(실행)당 한 번, 이후 조회는 미러에서
+
+    def fetch_ohlcv(self, from_timestamp_ms=None):
+        if not self.use_mirror:
+            return fetch_remote_ohlcv(self.client, from_timestamp_ms)
+
+        if not self.mirror_synced:
+            sync_ohlcv_mirror(self.client)
+            self.mirror_synced = True
+        return load_ohlcv_from_mirror(from_timestamp_ms)
+
+    def get_cycle_summary(self, cycle_num=None):
+        query = self.client.table(CYCLE_SUMMARY_VIEW_NAME).select(
+            "cycle_number, row_count, first_timestamp, last_timestamp, max_days_since_peak"
+        )
+        if cycle_num is not None:
+            query = query.eq("cycle_number", cycle_num)
+
+        response = query.order("cycle_number", desc=False).execute()
+        return response.data or []
+
+    def get_cycle_peak_row(self, cycle_num):
+        response = (
+            self.client.table(CYCLE_TABLE_NAME)
+            .select("timestamp, close_price")
+            .eq("cycle_number", cycle_num)
+            .eq("days_since_peak", 0)
+            .execute()
+        )
+        return response.data[0] if response.data else None
+
+    def delete_cycle_rows(self, cycle_num, from_date=None):
+        query = self.client.table(CYCLE_TABLE_NAME).delete().eq("cycle_number", cycle_num)
+        if from_date:
+            query = query.gte("timestamp", from_date)
+        query.execute()
+
+    def upsert_cycle_rows(self, records):
+        for i in range(0, len(records), UPSERT_BATCH_SIZE):
+            batch = records[i : i + UPSERT_BATCH_SIZE]
+            self.client.table(CYCLE_TABLE_NAME).upsert(batch).execute()
+        return len(records)
+
+    def fetch_cycle_rows(self):
+        columns = ", ".join(col for col in CYCLE_COLUMNS if col != "cycle_name")
+        all_data = []
+        offset = 0
+
+        while True:
+            response = (
+                self.client.table(CYCLE_TABLE_NAME)
+                .select(columns)
+                .order("days_since_peak", desc=False)
+                .order("cycle_number", desc=False)
+                .range(offset, offset + FETCH_BATCH_SIZE - 1)
+                .execute()
+            )
+
+            if not response.data:
+                break
+            all_data.extend(response.data)
+            if len(response.data) < FETCH_BATCH_SIZE:
+                break
+            offset += FETCH_BATCH_SIZE
+
+        return pd.DataFrame(all_data)
+
+    def replace_box_rows(self, cycle_num, side, param_set, records):
+        (
+            self.client.table(BOX_TABLE_NAME)
+            .delete()
+            .eq("cycle_number", cycle_num)
+            .eq("side", side)
+            .eq("param_set", param_set)
+            .execute()
+        )
+        for i in range(0, len(records), UPSERT_BATCH_SIZE):
+            batch = records[i : i + UPSERT_BATCH_SIZE]
+            self.client.table(BOX_TABLE_NAME).upsert(batch).execute()
+        return len(records)
+
+
+class SQLiteCycleStorage(CycleStorage):
+    name = "sqlite"
+
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path or os.getenv("OHLCV_SQLITE_PATH") or DEFAULT_SQLITE_PATH)
+        if not self.db_path.exists():
+            raise ValueError(f"SQLite DB 파일이 없습니다: {self.db_path}")
+
+        conn = self.connect()
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {CYCLE_TABLE_NAME} (
+                cycle_number INTEGER NOT NULL,
+                cycle_name TEXT,
+                days_since_peak INTEGER NOT NULL,
+                timestamp TEXT NOT NULL,
+                close_price REAL,
+                low_price REAL,
+                high_price REAL,
+                close_rate REAL,
+                low_rate REAL,
+                high_rate REAL,
+                PRIMARY KEY (cycle_number, days_since_peak)
+            )
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {BOX_TABLE_NAME} (
+                cycle_number INTEGER NOT NULL,
+                side TEXT NOT NULL,
+                param_set TEXT NOT NULL,
+                box_id INTEGER NOT NULL,
+                start_day INTEGER NOT NULL,
+                start_timestamp TEXT,
+                start_rate REAL,
+                extreme_day INTEGER NOT NULL,
+                extreme_timestamp TEXT,
+                extreme_rate REAL,
+                end_day INTEGER NOT NULL,
+                end_timestamp TEXT,
+                end_rate REAL,
+                move_percent REAL,
+                duration_days INTEGER,
+                box_broken INTEGER,
+                PRIMARY KEY (cycle_number, side, param_set, box_id)
+            )
+            """
+        )
+        conn.commit()
+        conn.close()
+
+    def connect(self):
+        return sqlite3.connect(self.db_path)
+
+    def fetch_ohlcv(self, from_timestamp_ms=None):
+        sql = f"SELECT timestamp, close, low, high FROM {OHLCV_TABLE_NAME}"
+        params = ()
+        if from_timestamp_ms:
+            sql += " WHERE timestamp >= ?"
+            params = (from_timestamp_ms,)
+
+        conn = self.connect()
+        try:
+            return pd.read_sql_query(sql + " ORDER BY timestamp", conn, params=params)
+        finally:
+            conn.close()
+
+    def get_cycle_summary(self, cycle_num=None):
+        sql = f"""
+            SELECT
+                s.cycle_number,
+                s.row_count,
+                (SELECT timestamp FROM {CYCLE_TABLE_NAME} f
+                 WHERE f.cycle_number = s.cycle_number
+                 ORDER BY f.days_since_peak ASC LIMIT 1) AS first_timestamp,
+                (SELECT timestamp FROM {CYCLE_TABLE_NAME} l
+                 WHERE l.cycle_number = s.cycle_number
+                 ORDER BY l.days_since_peak DESC LIMIT 1) AS last_timestamp,
+                s.max_days_since_peak
+            FROM (
+                SELECT cycle_number, COUNT(*) AS row_count,
+                       MAX(days_since_peak) AS max_days_since_peak
+                FROM {CYCLE_TABLE_NAME}
+                GROUP BY cycle_number
+            ) s
+        """
+        params = ()
+        if cycle_num is not None:
+            sql += " WHERE s.cycle_number = ?"
+            params = (cycle_num,)
+
+        conn = self.connect()
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(sql + " ORDER BY s.cycle_number", params).fetchall()
+            return [dict(row) for row in rows]
+        finally:
+            conn.close()
+
+    def get_cycle_peak_row(self, cycle_num):
+        conn = self.connect()
+        conn.row_factory = sqlite3.Row
+        try:
+            row = conn.execute(
+                f"SELECT timestamp, close_price FROM {CYCLE_TABLE_NAME} "
+                "WHERE cycle_number = ? AND days_since_peak = 0",
+                (cycle_num,),
+            ).fetchone()
+            return dict(row) if row else None
+        finally:
+            conn.close()
+
+    def delete_cycle_rows(self, cycle_num, from_date=None):
+        sql = f"DELETE FROM {CYCLE_TABLE_NAME} WHERE cycle_number = ?"
+        params = [cycle_num]
+        if from_date:
+            sql += " AND timestamp >= ?"
+            params.append(from_date)
+
+        conn = self.connect()
+        try:
+            conn.execute(sql, params)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def upsert_cycle_rows(self, records):
+        if not records:
+            return 0
+
+        placeholders = ", ".join("?" for _ in CYCLE_COLUMNS)
+        rows = [tuple(record.get(col) for col in CYCLE_COLUMNS) for record in records]
+
+        conn = self.connect()
+        try:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {CYCLE_TABLE_NAME} ({', '.join(CYCLE_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return len(records)
+
+    def fetch_cycle_rows(self):
+        columns = ", ".join(col for col in CYCLE_COLUMNS if col != "cycle_name")
+        conn = self.connect()
+        try:
+            return pd.read_sql_query(
+                f"SELECT {columns} FROM {CYCLE_TABLE_NAME} "
+                "ORDER BY days_since_peak, cycle_number",
+                conn,
+            )
+        finally:
+            conn.close()
+
+    def replace_box_rows(self, cycle_num, side, param_set, records):
+        placeholders = ", ".join("?" for _ in BOX_COLUMNS)
+        rows = [tuple(record.get(col) for col in BOX_COLUMNS) for record in records]
+
+        conn = self.connect()
+        try:
+            conn.execute(
+                f"DELETE FROM {BOX_TABLE_NAME} "
+                "WHERE cycle_number = ? AND side = ? AND param_set = ?",
+                (cycle_num, side, param_set),
+            )
+            conn.executemany(
+                f"INSERT INTO {BOX_TABLE_NAME} ({', '.join(BOX_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return len(records)
+
+
+STORAGE_BACKENDS = {
+    SupabaseCycleStorage.name: SupabaseCycleStorage,
+    SQLiteCycleStorage.name: SQLiteCycleStorage,
+}
+
+
+def get_storage(backend=None):
+    """설정(CYCLE_STORAGE)에 따라 저장소 생성"""
+    backend = (backend or os.getenv("CYCLE_STORAGE") or "supabase").lower()
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(
+            f"알 수 없는 CYCLE_STORAGE: {backend} ({', '.join(STORAGE_BACKENDS)})"
+        )
+    return STORAGE_BACKENDS[backend]()
@@ -0,0 +1,117 @@
+"""
+시간봉(4h / 1h) 사이클 배열
+- binance_ohlcv_utc.py가 관리하는 SQLite 시간봉 테이블(ohlcv_4hour / ohlcv_1hour)을 한 번 읽어
+  사이클별 Peak 종가 기준 비율(%)로 정규화
+- Peak 정보(날짜, 종가)는 일봉 사이클 큐브의 0일 행에서 가져오므로 일봉 비율과 같은 기준
+- days는 Peak 시작 시각부터의 소수 일 단위 경과일 (4시간봉 = 1/6일 간격)
+- 반환 형식은 CycleCube.cycle_slice와 같음 (days, dates, low_rate, high_rate)
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cycle_storage import DEFAULT_SQLITE_PATH
+
+ONE_DAY_MS = 86400000
+
+# 시간봉별 SQLite 테이블 / 하루 캔들 개수 (1d는 일봉 사이클 큐브 사용)
+TIMEFRAMES = {
+    "1d": {"table": None, "points_per_day": 1},
+    "4h": {"table": "ohlcv_4hour", "points_per_day": 6},
+    "1h": {"table": "ohlcv_1hour", "points_per_day": 24},
+}
+
+
+def date_to_ms(date_str):
+    return int(pd.Timestamp(date_str, tz="UTC").value // 1_000_000)
+
+
+def format_timestamps(timestamps):
+    """timestamp(ms) 배열 -> "YYYY/MM/DD HH:MM" (UTC) 문자열 배열 (pandas strftime보다 빠름)"""
+    text = np.datetime_as_string(timestamps.astype("datetime64[ms]"), unit="m")
+    return np.char.replace(np.char.replace(text, "-", "/"), "T", " ").astype(object)
+
+
+def get_cycle_peaks(cube):
+    """사이클별 Peak 시각 / 종가 / 다음 Peak 시각(진행 중이면 None)"""
+    day0 = int(np.searchsorted(cube.days, 0))
+    peaks = []
+    for cycle_num in cube.cycles:
+        if day0 >= len(cube.days) or cube.days[day0] != 0 or not cube.valid(cycle_num)[day0]:
+            print(f"[WARN] Cycle {cycle_num} Peak(0일) 행 없음 - 시간봉 분석 제외")
+            continue
+        peaks.append(
+            {
+                "cycle_number": int(cycle_num),
+                "peak_ts": date_to_ms(cube.get_dates(cycle_num)[day0]),
+                "peak_close": float(cube.get("close", cycle_num)[day0]),
+            }
+        )
+    for peak, next_peak in zip(peaks, peaks[1:] + [None]):
+        peak["end_ts"] = next_peak["peak_ts"] if next_peak else None
+    return peaks
+
+
+def connect_store(db_path=None):
+    """binance_ohlcv_utc SQLite DB 연결 (SQLiteCycleStorage와 같은 경로 규칙)"""
+    db_path = Path(db_path or os.getenv("OHLCV_SQLITE_PATH") or DEFAULT_SQLITE_PATH)
+    if not db_path.exists():
+        raise ValueError(f"SQLite DB 파일이 없습니다: {db_path}")
+    return sqlite3.connect(db_path)
+
+
+def query_candles(conn, timeframe, start_ts=None, end_ts=None):
+    """시간봉 [start_ts, end_ts) 조회 -> (timestamp(ms), low, high) 배열 (timestamp 순)"""
+    sql = f"SELECT timestamp, low, high FROM {TIMEFRAMES[timeframe]['table']}"
+    conditions = []
+    params = []
+    if start_ts is not None:
+        conditions.append("timestamp >= ?")
+        params.append(int(start_ts))
+    if end_ts is not None:
+        conditions.append("timestamp < ?")
+        params.append(int(end_ts))
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    rows = conn.execute(sql + " ORDER BY timestamp", params).fetchall()
+
+    data = np.array(rows, dtype=float).reshape(-1, 3)
+    return data[:, 0].astype(np.int64), data[:, 1], data[:, 2]
+
+
+def load_intraday_ohlcv(timeframe, db_path=None):
+    """SQLite 시간봉 테이블 전체 -> (timestamp(ms), low, high) 배열"""
+    conn = connect_store(db_path)
+    try:
+        return query_candles(conn, timeframe)
+    finally:
+        conn.close()
+
+
+def build_intraday_cycles(cube, timeframe, db_path=None):
+    """시간봉 캔들을 사이클별 배열로 ({cycle_number: {days, dates, low_rate, high_rate}})"""
+    timestamps, low, high = load_intraday_ohlcv(timeframe, db_path)
+
+    cycles = {}
+    for peak in get_cycle_peaks(cube):
+        lo = int(np.searchsorted(timestamps, peak["peak_ts"], "left"))
+        hi = (
+            len(timestamps)
+            if peak["end_ts"] is None
+            else int(np.searchsorted(timestamps, peak["end_ts"], "left"))
+        )
+        if hi <= lo:
+            continue
+
+        ts = timestamps[lo:hi]
+        cycles[peak["cycle_number"]] = {
+            "days": (ts - peak["peak_ts"]) / ONE_DAY_MS,
+            "dates": format_timestamps(ts),
+            "low_rate": low[lo:hi] / peak["peak_close"] * 100,
+            "high_rate": high[lo:hi] / peak["peak_close"] * 100,
+        }
+    return cycles
@@ -0,0 +1,239 @@
+"""
+ohlcv_1day 로컬 미러 (SQLite)
+- Supabase ohlcv_1day 테이블에서 이미 받은 캔들을 스크립트 옆 SQLite 파일에 보관
+- high-water mark(마지막 timestamp) 이후 데이터만 증분 다운로드
+- 주기적으로 구간별 checksum을 원격과 비교하여 불일치 구간만 다시 받음
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# ==================== 설정 ====================
+OHLCV_TABLE_NAME = "ohlcv_1day"
+CHECKSUM_RPC_NAME = "ohlcv_1day_checksums"  # supabase/migrations 참고
+MIRROR_DB_PATH = Path(__file__).resolve().parent / "ohlcv_1day_mirror.db"
+
+ONE_DAY_MS = 86400000
+BATCH_SIZE = 1000  # Supabase 기본 1000개 제한
+TAIL_REFRESH_DAYS = 7  # 진행 중인 캔들 갱신을 위해 mark 이전 N일은 다시 받음
+RECONCILE_INTERVAL_DAYS = 7  # checksum 비교 주기 (일)
+RECONCILE_BUCKET_DAYS = 90  # checksum 비교 구간 크기 (일)
+
+
+def normalize_timestamp(ts):
+    return ts * 1000 if ts < 10000000000 else ts
+
+
+def get_mirror_connection(db_path=MIRROR_DB_PATH):
+    """미러 DB 연결 (테이블이 없으면 생성)"""
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {OHLCV_TABLE_NAME} (
+            timestamp INTEGER PRIMARY KEY,
+            close REAL NOT NULL,
+            low REAL NOT NULL,
+            high REAL NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS mirror_meta (key TEXT PRIMARY KEY, value TEXT)"
+    )
+    conn.commit()
+    return conn
+
+
+def get_meta(conn, key):
+    row = conn.execute("SELECT value FROM mirror_meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def set_meta(conn, key, value):
+    conn.execute(
+        "INSERT OR REPLACE INTO mirror_meta (key, value) VALUES (?, ?)",
+        (key, str(value)),
+    )
+    conn.commit()
+
+
+def get_high_water_mark(conn):
+    """미러에 저장된 마지막 timestamp (ms)"""
+    return conn.execute(f"SELECT MAX(timestamp) FROM {OHLCV_TABLE_NAME}").fetchone()[0]
+
+
+def fetch_remote_ohlcv(supabase, from_timestamp_ms=None, to_timestamp_ms=None):
+    """Supabase에서 OHLCV 데이터 조회 (페이지네이션, [from, to) 구간)"""
+    query = supabase.table(OHLCV_TABLE_NAME).select("timestamp, close, low, high")
+
+    if from_timestamp_ms is not None:
+        query = query.gte("timestamp", from_timestamp_ms)
+    if to_timestamp_ms is not None:
+        query = query.lt("timestamp", to_timestamp_ms)
+
+    all_data = []
+    offset = 0
+
+    while True:
+        response = (
+            query.order("timestamp", desc=False)
+            .range(offset, offset + BATCH_SIZE - 1)
+            .execute()
+        )
+
+        if not response.data:
+            break
+
+        all_data.extend(response.data)
+
+        if len(response.data) < BATCH_SIZE:
+            break
+
+        offset += BATCH_SIZE
+
+    if not all_data:
+        return pd.DataFrame()
+
+    df = pd.DataFrame(all_data)
+    df["timestamp"] = df["timestamp"].apply(normalize_timestamp)
+    return df
+
+
+def save_to_mirror(conn, df):
+    """조회한 캔들을 미러에 저장 (동일 timestamp는 덮어쓰기)"""
+    if df is None or df.empty:
+        return 0
+
+    rows = list(
+        zip(
+            df["timestamp"].astype("int64").tolist(),
+            df["close"].astype(float).tolist(),
+            df["low"].astype(float).tolist(),
+            df["high"].astype(float).tolist(),
+        )
+    )
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {OHLCV_TABLE_NAME} (timestamp, close, low, high) VALUES (?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    return len(rows)
+
+
+def checksum_cents(values):
+    """
+    가격 -> 센트 정수 (원격 ohlcv_1day_checksums와 같은 정의)
+    - 미러에 저장되는 정밀도(float64)에서 floor(x * 100 + 0.5)
+    - 원격도 numeric이 아닌 double precision으로 바꾼 뒤 같은 식으로 계산
+      (numeric은 1.005 -> 101, float64는 100.49999... -> 100이라 반 센트 값에서 어긋남)
+    """
+    return np.floor(np.asarray(values, dtype=np.float64) * 100 + 0.5).astype(np.int64)
+
+
+def compute_checksums(df, bucket_ms):
+    """구간별 (행 개수, checksum) 계산 - 원격 ohlcv_1day_checksums와 같은 정의"""
+    if df.empty:
+        return {}
+
+    cents = checksum_cents(df["close"]) + checksum_cents(df["low"]) + checksum_cents(df["high"])
+    buckets = df["timestamp"].to_numpy(dtype=np.int64) // bucket_ms
+
+    grouped = (
+        pd.DataFrame({"bucket": buckets, "cents": cents})
+        .groupby("bucket")["cents"]
+        .agg(["count", "sum"])
+    )
+    return {
+        int(bucket): (int(row["count"]), int(row["sum"]))
+        for bucket, row in grouped.iterrows()
+    }
+
+
+def fetch_remote_checksums(supabase, bucket_ms):
+    response = supabase.rpc(CHECKSUM_RPC_NAME, {"bucket_ms": bucket_ms}).execute()
+    return {
+        int(row["bucket"]): (int(row["row_count"]), int(row["checksum"]))
+        for row in (response.data or [])
+    }
+
+
+def reconcile_mirror(supabase, conn):
+    """원격과 checksum이 다른 구간만 다시 받아 교체"""
+    bucket_ms = RECONCILE_BUCKET_DAYS * ONE_DAY_MS
+    local = compute_checksums(load_ohlcv_from_mirror(conn=conn), bucket_ms)
+    remote = fetch_remote_checksums(supabase, bucket_ms)
+
+    mismatched = sorted(
+        bucket
+        for bucket in set(local) | set(remote)
+        if local.get(bucket) != remote.get(bucket)
+    )
+
+    for bucket in mismatched:
+        start_ms = bucket * bucket_ms
+        end_ms = start_ms + bucket_ms
+        # 초 단위로 저장된 과거 행도 함께 조회
+        df = pd.concat(
+            [
+                fetch_remote_ohlcv(supabase, start_ms, end_ms),
+                fetch_remote_ohlcv(supabase, start_ms // 1000, end_ms // 1000),
+            ]
+        )
+        conn.execute(
+            f"DELETE FROM {OHLCV_TABLE_NAME} WHERE timestamp >= ? AND timestamp < ?",
+            (start_ms, end_ms),
+        )
+        save_to_mirror(conn, df)
+
+    set_meta(conn, "last_reconciled_at", int(time.time() * 1000))
+    print(f"미러 checksum 비교: {len(remote)}개 구간 중 {len(mismatched)}개 재동기화")
+    return len(mismatched)
+
+
+def sync_ohlcv_mirror(supabase, force_reconcile=False, db_path=MIRROR_DB_PATH):
+    """미러 증분 동기화 (high-water mark 이후만 다운로드)"""
+    conn = get_mirror_connection(db_path)
+    try:
+        mark = get_high_water_mark(conn)
+
+        if mark is None:
+            df = fetch_remote_ohlcv(supabase)
+            print(f"미러 생성: {save_to_mirror(conn, df)}개 캔들 다운로드")
+            set_meta(conn, "last_reconciled_at", int(time.time() * 1000))
+            return len(df)
+
+        df = fetch_remote_ohlcv(supabase, mark - TAIL_REFRESH_DAYS * ONE_DAY_MS)
+        saved = save_to_mirror(conn, df)
+        print(f"미러 증분 동기화: {saved}개 캔들 (mark 이후)")
+
+        last_reconciled = int(get_meta(conn, "last_reconciled_at") or 0)
+        now_ms = int(time.time() * 1000)
+        if force_reconcile or now_ms - last_reconciled >= (
+            RECONCILE_INTERVAL_DAYS * ONE_DAY_MS
+        ):
+            reconcile_mirror(supabase, conn)
+
+        return saved
+    finally:
+        conn.close()
+
+
+def load_ohlcv_from_mirror(from_timestamp_ms=None, db_path=MIRROR_DB_PATH, conn=None):
+    """미러에서 OHLCV 데이터 로드 (네트워크 없음)"""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_mirror_connection(db_path)
+    try:
+        sql = f"SELECT timestamp, close, low, high FROM {OHLCV_TABLE_NAME}"
+        params = ()
+        if from_timestamp_ms:
+            sql += " WHERE timestamp >= ?"
+            params = (from_timestamp_ms,)
+        return pd.read_sql_query(sql + " ORDER BY timestamp", conn, params=params)
+    finally:
+        if own_conn:
+            conn.close()
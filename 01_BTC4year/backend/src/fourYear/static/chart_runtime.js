@@ -0,0 +1,480 @@
+// 4년 사이클 차트 공통 런타임 (02 사이클 비교 / 03 bear / 04 bull 박스 페이지)
+// 페이지에는 데이터(JSON)만 있고, 렌더링 코드는 이 파일 하나를 모든 페이지가 캐시 공유
+
+// 페이지에 넣은 <script type="application/json"> 데이터 읽기
+function readChartData(id) {
+    return JSON.parse(document.getElementById(id).textContent);
+}
+
+// 컬럼형 시리즈 {x: [...], y: [...]} -> ApexCharts 점 배열 [{x, y, i}, ...]
+// (index를 주면 그 위치의 점만, i는 원본 컬럼 위치)
+function decodeSeries(columns, index) {
+    var n = index ? index.length : columns.x.length;
+    var points = new Array(n);
+    for (var k = 0; k < n; k++) {
+        var i = index ? index[k] : k;
+        points[k] = { x: columns.x[i], y: columns.y[i], i: i };
+    }
+    return points;
+}
+
+// 다중 해상도: columns.lod(다운샘플 인덱스)가 있으면 전체 보기는 lod 점,
+// 확대 구간의 원본 점 수가 lod 이하이면 구간 안은 원본 + 구간 밖은 lod 점
+function decodeVisible(columns, xMin, xMax) {
+    var lod = columns.lod;
+    if (!lod) return decodeSeries(columns);
+    var x = columns.x;
+    var visible = 0;
+    if (xMin != null && xMax != null) {
+        for (var i = 0; i < x.length; i++) {
+            if (x[i] >= xMin && x[i] <= xMax) visible++;
+        }
+    }
+    if (!visible || visible > lod.length) return decodeSeries(columns, lod);
+
+    var index = [];
+    for (var j = 0, k = 0; j < x.length; j++) {
+        var inLod = lod[k] === j;
+        if (inLod) k++;
+        if (inLod || (x[j] >= xMin && x[j] <= xMax)) index.push(j);
+    }
+    return decodeSeries(columns, index);
+}
+
+// ==================== 박스권 차트 (03 bear / 04 bull) ====================
+
+// 하락장 반등 박스: 저점(Start) -> 고점(Peak)
+function bearAnnotations(boxes) {
+    var pointAnnotations = [];
+    var highColor = '#F87171';
+    var lowColor = '#34D399';
+
+    boxes.forEach(function(box, idx) {
+        // 전고점 찾기 (이전 박스의 고점, L1이면 100% 기준)
+        var prevHigh = idx > 0 ? boxes[idx - 1].Peak_Rate : 100;
+        var dropFromPrevHigh = ((box.Start_Rate - prevHigh) / prevHigh * 100).toFixed(0);
+
+        // 저점 대비 상승률
+        var riseFromLow = ((box.Peak_Rate - box.Start_Rate) / box.Start_Rate * 100).toFixed(0);
+
+        // 저점 마커
+        pointAnnotations.push({
+            x: box.Start_Day,
+            y: box.Start_Rate,
+            marker: { size: 5, fillColor: lowColor, strokeColor: '#fff', strokeWidth: 1 },
+            label: {
+                borderColor: 'transparent',
+                style: { color: '#065F46', background: '#A7F3D0', fontSize: '9px', padding: { left: 4, right: 4, top: 1, bottom: 1 } },
+                text: 'L' + box.Box_ID + ' ' + box.Start_Rate + '% 전고점:' + dropFromPrevHigh + '%',
+                offsetY: 38,
+                position: 'bottom'
+            }
+        });
+
+        // 고점 마커
+        pointAnnotations.push({
+            x: box.Peak_Day,
+            y: box.Peak_Rate,
+            marker: { size: 5, fillColor: highColor, strokeColor: '#fff', strokeWidth: 1, shape: 'triangle' },
+            label: {
+                borderColor: 'transparent',
+                style: { color: '#991B1B', background: '#FECACA', fontSize: '9px', padding: { left: 4, right: 4, top: 1, bottom: 1 } },
+                text: 'H' + box.Box_ID + ' ' + box.Peak_Rate + '% 저점:+' + riseFromLow + '%',
+                offsetY: -8
+            }
+        });
+    });
+    return pointAnnotations;
+}
+
+function bearTooltip(data) {
+    var line = data.line;
+    var boxes = data.boxes;
+
+    return function({ series, seriesIndex, dataPointIndex, w }) {
+        var i = w.config.series[seriesIndex].data[dataPointIndex].i;
+        var day = line.x[i];
+        var rate = line.y[i];
+        var dateStr = line.timestamp[i];
+        var box = line.box[i] >= 0 ? boxes[line.box[i]] : null;
+        // 전고점 (현재 day 이전의 가장 가까운 박스 고점, 없으면 100%)
+        var prevHigh = line.prev[i] >= 0 ? boxes[line.prev[i]].Peak_Rate : 100;
+
+        var header = 'Cycle ' + data.cycle + ' : ' + dateStr + ' (' + rate.toFixed(2) + '%)';
+        var line2 = '';
+
+        if (box) {
+            // 박스 내부
+            var boxDay = day - box.Start_Day + 1;
+            var boxLow = box.Start_Rate;
+            var boxHigh = box.Peak_Rate;
+
+            if (Math.abs(rate - boxLow) <= Math.abs(rate - boxHigh)) {
+                var pctFromLow = ((rate - boxLow) / boxLow * 100).toFixed(0);
+                var sign = pctFromLow >= 0 ? '+' : '';
+                line2 = day + 'd 박스(' + boxDay + '/' + box.Duration_Days + 'd) 저점대비:' + sign + pctFromLow + '%';
+            } else {
+                var pctFromHigh = ((rate - boxHigh) / boxHigh * 100).toFixed(0);
+                var sign = pctFromHigh >= 0 ? '+' : '';
+                line2 = day + 'd 박스(' + boxDay + '/' + box.Duration_Days + 'd) 고점대비:' + sign + pctFromHigh + '%';
+            }
+        } else {
+            // 박스 외부
+            var pctFromPrevHigh = ((rate - prevHigh) / prevHigh * 100).toFixed(0);
+            var sign = pctFromPrevHigh >= 0 ? '+' : '';
+            line2 = day + 'd 전고점대비:' + sign + pctFromPrevHigh + '%';
+        }
+
+        return '<div class="apexcharts-tooltip-title" style="font-family:JetBrains Mono,monospace;font-size:12px;">● ' + header + '</div>' +
+            '<div class="apexcharts-tooltip-series-group apexcharts-active" style="display:flex;padding:6px 10px;">' +
+            '<div class="apexcharts-tooltip-text" style="font-family:JetBrains Mono,monospace;font-size:12px;">' +
+            '<span class="apexcharts-tooltip-text-y-value">' + line2 + '</span>' +
+            '</div></div>';
+    };
+}
+
+// 상승장 조정 박스: 고점(Start) -> 저점(Low)
+function bullAnnotations(boxes) {
+    var pointAnnotations = [];
+    var highColor = '#EF4444';  // 고점: 빨강
+    var lowColor = '#10B981';   // 저점: 초록
+
+    boxes.forEach(function(box, idx) {
+        // 전저점 찾기 (이전 박스의 저점, 없으면 현재 고점 기준)
+        var prevLow = idx > 0 ? boxes[idx - 1].Low_Rate : box.Start_Rate;
+        var riseFromPrevLow = ((box.Start_Rate - prevLow) / prevLow * 100).toFixed(0);
+
+        // 고점 대비 하락률
+        var dropFromHigh = (-(box.Start_Rate - box.Low_Rate) / box.Start_Rate * 100).toFixed(0);
+
+        // 고점 마커 (삼각형, 원 위에 라벨)
+        pointAnnotations.push({
+            x: box.Start_Day,
+            y: box.Start_Rate,
+            marker: { size: 5, fillColor: highColor, strokeColor: '#fff', strokeWidth: 1, shape: 'triangle' },
+            label: {
+                borderColor: highColor,
+                style: { color: '#fff', background: highColor, fontSize: '9px', padding: { left: 4, right: 4, top: 1, bottom: 1 } },
+                text: 'H' + box.Box_ID + ' ' + box.Start_Rate + '% 전저점:+' + riseFromPrevLow + '%',
+                offsetY: -8
+            }
+        });
+
+        // 저점 마커 (원, 원 아래에 라벨)
+        pointAnnotations.push({
+            x: box.Low_Day,
+            y: box.Low_Rate,
+            marker: { size: 5, fillColor: lowColor, strokeColor: '#fff', strokeWidth: 1 },
+            label: {
+                borderColor: lowColor,
+                style: { color: '#fff', background: lowColor, fontSize: '9px', padding: { left: 4, right: 4, top: 1, bottom: 1 } },
+                text: 'L' + box.Box_ID + ' ' + box.Low_Rate + '% 고점:' + dropFromHigh + '%',
+                offsetY: 38,
+                position: 'bottom'
+            }
+        });
+    });
+    return pointAnnotations;
+}
+
+function bullTooltip(data) {
+    var boxes = data.boxes;
+
+    // 마우스 위치에 따른 박스 정보 표시
+    function getBoxAtPosition(dayX) {
+        for (var k = 0; k < boxes.length; k++) {
+            if (dayX >= boxes[k].Start_Day && dayX <= boxes[k].End_Day) return boxes[k];
+        }
+        return null;
+    }
+
+    return function({ series, seriesIndex, dataPointIndex, w }) {
+        var point = w.config.series[seriesIndex].data[dataPointIndex];
+        var dayX = point.x;
+        var val = point.y.toFixed(2);
+        var box = getBoxAtPosition(dayX);
+
+        if (box) {
+            return '<div style="padding:12px; background:' + box.color + '; border-radius:6px; color:#000; font-weight:bold; border:2px solid #fff;">' +
+                'Box ' + box.Box_ID + '<br/>' +
+                '<span style="font-size:14px;">-' + box.Drop_Percent.toFixed(1) + '%</span><br/>' +
+                '<span style="font-size:11px;">Day ' + box.Start_Day + '-' + box.End_Day + ' (' + box.Duration_Days + 'd)</span><br/>' +
+                '<span style="font-size:10px;opacity:0.9;">High: ' + box.Start_Rate + '% → Low: ' + box.Low_Rate + '%</span>' +
+                '</div>';
+        }
+
+        return '<div style="padding:8px; background:rgba(59,130,246,0.9); border-radius:6px; color:#fff;">' +
+            '<span>Day ' + dayX + '</span><br/>' +
+            '<span style="font-size:12px;">Rate: ' + val + '%</span>' +
+            '</div>';
+    };
+}
+
+// side별 사각형 위 / 아래 비율 키, 마커, 툴팁
+var BOX_SIDES = {
+    bear: { top: 'Peak_Rate', bottom: 'Start_Rate', annotations: bearAnnotations, tooltip: bearTooltip },
+    bull: { top: 'Start_Rate', bottom: 'Low_Rate', annotations: bullAnnotations, tooltip: bullTooltip }
+};
+
+// 박스 사각형 그리기 (grid 뒤에 SVG rect 삽입)
+function drawBoxRects(chartContext, boxes, side) {
+    if (!chartContext) return;
+
+    var chartEl = chartContext.el;
+    var gridRect = chartEl.querySelector('.apexcharts-grid');
+    if (!gridRect) return;
+
+    // 기존 박스 rect 제거
+    chartEl.querySelectorAll('.box-rect-group').forEach(function(el) { el.remove(); });
+
+    var rectGroup = document.createElementNS('http://www.w3.org/2000/svg', 'g');
+    rectGroup.setAttribute('class', 'box-rect-group');
+
+    // 현재 축 범위 (확대 시 config에 반영됨)
+    var w = chartContext.w;
+    var xMin = w.config.xaxis.min !== undefined ? w.config.xaxis.min : w.globals.minX;
+    var xMax = w.config.xaxis.max !== undefined ? w.config.xaxis.max : w.globals.maxX;
+    var yMin = w.config.yaxis[0].min !== undefined ? w.config.yaxis[0].min : 0;
+    var yMax = w.config.yaxis[0].max !== undefined ? w.config.yaxis[0].max : 100;
+
+    // 실제 그리드 영역 계산 (SVG 요소에서 직접)
+    var gridBBox = gridRect.getBBox();
+
+    boxes.forEach(function(box) {
+        var x1 = gridBBox.x + ((box.Start_Day - xMin) / (xMax - xMin)) * gridBBox.width;
+        var x2 = gridBBox.x + ((box.End_Day - xMin) / (xMax - xMin)) * gridBBox.width;
+        // Y축 반전
+        var yTop = gridBBox.y + ((yMax - box[side.top]) / (yMax - yMin)) * gridBBox.height;
+        var yBottom = gridBBox.y + ((yMax - box[side.bottom]) / (yMax - yMin)) * gridBBox.height;
+
+        var rectWidth = Math.abs(x2 - x1);
+        var rectHeight = Math.abs(yBottom - yTop);
+        if (rectWidth > 0 && rectHeight > 0) {
+            var rect = document.createElementNS('http://www.w3.org/2000/svg', 'rect');
+            rect.setAttribute('x', Math.min(x1, x2));
+            rect.setAttribute('y', Math.min(yTop, yBottom));
+            rect.setAttribute('width', rectWidth);
+            rect.setAttribute('height', rectHeight);
+            rect.setAttribute('fill', box.color);
+            rect.setAttribute('fill-opacity', '0.15');
+            rect.setAttribute('stroke', box.color);
+            rect.setAttribute('stroke-width', '1.5');
+            rect.setAttribute('stroke-opacity', '0.8');
+            rectGroup.appendChild(rect);
+        }
+    });
+
+    gridRect.parentNode.insertBefore(rectGroup, gridRect);
+}
+
+// data: {side, cycle, line(컬럼형), boxes, xaxis: {min, max, tickAmount}, yaxis: {max}}
+function renderBoxChart(data) {
+    var side = BOX_SIDES[data.side];
+    var line = data.line;
+    var boxes = data.boxes;
+    var seriesName = 'Cycle ' + data.cycle;
+    var chartInstance = null;
+
+    function redraw(chartContext) {
+        drawBoxRects(chartContext, boxes, side);
+    }
+
+    // 확대 구간에 맞춰 해상도 전환 (전체 보기: 다운샘플, 확대: 보이는 구간 원본)
+    function refreshResolution(chartContext, xaxis) {
+        if (!line.lod) return;
+        var points = decodeVisible(line, xaxis && xaxis.min, xaxis && xaxis.max);
+        chartContext.updateSeries([{ name: seriesName, data: points }], false);
+    }
+
+    var options = {
+        chart: {
+            type: 'line',
+            height: '100%',
+            fontFamily: "'JetBrains Mono', monospace",
+            background: 'transparent',
+            toolbar: { show: true },
+            zoom: { enabled: true, type: 'xy' },
+            events: {
+                mounted: function(chartContext, config) {
+                    chartInstance = chartContext;
+                    setTimeout(function() { redraw(chartContext); }, 100);
+                },
+                updated: function(chartContext, config) {
+                    setTimeout(function() { redraw(chartContext); }, 50);
+                },
+                zoomed: function(chartContext, config) {
+                    setTimeout(function() { refreshResolution(chartContext, config.xaxis); }, 0);
+                    setTimeout(function() { redraw(chartContext); }, 50);
+                },
+                beforeResetZoom: function(chartContext, config) {
+                    setTimeout(function() { refreshResolution(chartContext); }, 0);
+                    setTimeout(function() { redraw(chartContext); }, 100);
+                    return config;
+                },
+                animationEnd: function(chartContext, config) {
+                    redraw(chartContext);
+                },
+                selection: function(chartContext, config) {
+                    setTimeout(function() { redraw(chartContext); }, 50);
+                }
+            }
+        },
+        series: [{ name: seriesName, data: decodeVisible(line) }],
+        colors: ['#3B82F6'],
+        stroke: { curve: 'smooth', width: 2 },
+        grid: { borderColor: 'rgba(255,255,255,0.08)', strokeDashArray: 4 },
+        xaxis: { type: 'numeric', min: data.xaxis.min, max: data.xaxis.max, tickAmount: data.xaxis.tickAmount, title: { text: 'Days Since Peak', style: { color: '#94A3B8' } }, labels: { style: { colors: '#94A3B8' } } },
+        yaxis: { min: 0, max: data.yaxis.max, tickAmount: 10, title: { text: 'Rate (% of Peak)', style: { color: '#94A3B8' } }, labels: { style: { colors: '#94A3B8' }, formatter: function(v) { return v + '%'; } } },
+        tooltip: { theme: 'dark', custom: side.tooltip(data) },
+        annotations: { points: side.annotations(boxes) },
+        legend: { show: false }
+    };
+
+    var chart = new ApexCharts(document.querySelector('#chart'), options);
+    chart.render();
+
+    setTimeout(function() {
+        // 홈 버튼 등 toolbar 버튼 클릭 시 박스 다시 그리기
+        var toolbar = document.querySelector('.apexcharts-toolbar');
+        if (toolbar) {
+            toolbar.addEventListener('click', function(e) {
+                setTimeout(function() { if (chartInstance) redraw(chartInstance); }, 300);
+            });
+        }
+
+        // MutationObserver로 차트 변경 감지
+        var observer = new MutationObserver(function(mutations) {
+            if (chartInstance) setTimeout(function() { redraw(chartInstance); }, 50);
+        });
+        observer.observe(document.querySelector('#chart'), { childList: true, subtree: true });
+    }, 500);
+    return chart;
+}
+
+// ==================== 사이클 비교 차트 (02) ====================
+
+// data: {series: [{name, columns, startDate, endDate, dayCount}], options}
+function renderCycleComparison(data) {
+    var series = data.series;
+    var options = data.options;
+    var seriesColumns = series.map(function(s) { return s.columns; });
+    series.forEach(function(s) {
+        s.data = decodeVisible(s.columns);
+        delete s.columns;
+    });
+
+    var chart = null;
+
+    // 확대 구간에 맞춰 해상도 전환 (전체 보기: 다운샘플, 확대: 보이는 구간 원본)
+    function refreshResolution(xMin, xMax) {
+        if (!seriesColumns.some(function(c) { return c.lod; })) return;
+        chart.updateSeries(series.map(function(s, idx) {
+            return { name: s.name, data: decodeVisible(seriesColumns[idx], xMin, xMax) };
+        }), false);
+    }
+
+    // JSON으로 넘길 수 없는 포매터
+    options.yaxis.labels.formatter = function(val) { return val.toFixed(0) + '%'; };
+    options.tooltip.x.formatter = function(val) { return 'Day ' + val; };
+    options.tooltip.y.formatter = function(val) { return val.toFixed(2) + '%'; };
+    options.chart.events = {
+        zoomed: function(chartContext, e) {
+            setTimeout(function() { refreshResolution(e.xaxis.min, e.xaxis.max); }, 0);
+        }
+    };
+
+    var colorNames = ['blue', 'green', 'red', 'orange', 'purple', 'pink', 'cyan', 'lime'];
+
+    // 스탯 카드 생성 (클릭하면 시리즈 토글) - 한 줄 컴팩트
+    var statsContainer = document.getElementById('stats-container');
+    series.forEach(function(s, idx) {
+        var minVal = Math.min.apply(null, s.data.map(function(d) { return d.y; }));
+        var colorClass = colorNames[idx % colorNames.length];
+        var labelText = 'C' + (idx + 1) + ':' + s.startDate;
+
+        var card = document.createElement('div');
+        card.className = 'stat-card ' + colorClass;
+        card.dataset.index = idx;
+        card.innerHTML = '<span class="stat-label ' + colorClass + '">' + labelText + '</span>' +
+                       '<span class="stat-value">' +
+                       '<span class="stat-min">' + minVal.toFixed(1) + '%</span>' +
+                       '<span class="stat-days">' + s.dayCount + 'd</span>' +
+                       '</span>';
+        card.onclick = function() {
+            this.classList.toggle('inactive');
+            chart.toggleSeries(series[idx].name);
+        };
+        statsContainer.appendChild(card);
+    });
+
+    var initialXMin = options.xaxis.min;
+    var initialXMax = options.xaxis.max;
+    var initialYMin = options.yaxis.min;
+    var initialYMax = options.yaxis.max;
+
+    function setAxisInputs(xMin, xMax, yMin, yMax) {
+        document.getElementById('xMin').value = xMin;
+        document.getElementById('xMax').value = xMax;
+        document.getElementById('yMin').value = yMin;
+        document.getElementById('yMax').value = yMax;
+    }
+    setAxisInputs(initialXMin, initialXMax, initialYMin, initialYMax);
+
+    chart = new ApexCharts(document.querySelector('#chart'), { ...options, series: series });
+    chart.render();
+
+    function setToolbarActive(activeId) {
+        document.querySelectorAll('.toolbar-btn').forEach(function(btn) {
+            if (btn.id === 'btn-zoomin' || btn.id === 'btn-zoomout' || btn.id === 'btn-reset') return;
+            btn.classList.remove('active');
+        });
+        document.getElementById(activeId).classList.add('active');
+    }
+
+    function applyAxisRange() {
+        var xMin = parseFloat(document.getElementById('xMin').value) || 0;
+        var xMax = parseFloat(document.getElementById('xMax').value) || initialXMax;
+        var yMin = parseFloat(document.getElementById('yMin').value) || 0;
+        var yMax = parseFloat(document.getElementById('yMax').value) || 100;
+        chart.updateOptions({ xaxis: { min: xMin, max: xMax }, yaxis: { min: yMin, max: yMax } });
+        refreshResolution(xMin, xMax);
+    }
+
+    function resetAxisRange() {
+        setAxisInputs(initialXMin, initialXMax, initialYMin, initialYMax);
+        chart.updateOptions({ xaxis: { min: initialXMin, max: initialXMax }, yaxis: { min: initialYMin, max: initialYMax } });
+        refreshResolution();
+    }
+
+    // 툴바 이벤트
+    document.getElementById('btn-zoomin').onclick = function() {
+        var range = options.xaxis.max - options.xaxis.min;
+        chart.zoomX(options.xaxis.min + range * 0.2, options.xaxis.max - range * 0.2);
+    };
+    document.getElementById('btn-zoomout').onclick = function() {
+        chart.zoomX(initialXMin, initialXMax);
+    };
+    document.getElementById('btn-pan').onclick = function() {
+        setToolbarActive('btn-pan');
+    };
+    document.getElementById('btn-zoom').onclick = function() {
+        setToolbarActive('btn-zoom');
+    };
+    // 설정 버튼 (축 컨트롤 토글)
+    document.getElementById('btn-settings').onclick = function() {
+        document.getElementById('axis-controls').classList.toggle('hidden');
+        document.getElementById('btn-settings').classList.toggle('active');
+    };
+    document.getElementById('btn-reset').onclick = function() {
+        chart.zoomX(initialXMin, initialXMax);
+        chart.updateOptions({ yaxis: { min: initialYMin, max: initialYMax } });
+        setAxisInputs(initialXMin, initialXMax, initialYMin, initialYMax);
+    };
+    document.getElementById('btn-apply').onclick = applyAxisRange;
+    document.getElementById('btn-axis-reset').onclick = resetAxisRange;
+
+    document.querySelectorAll('.axis-input').forEach(function(input) {
+        input.addEventListener('keypress', function(e) { if (e.key === 'Enter') applyAxisRange(); });
+    });
+    return chart;
+}
@@ -0,0 +1,30 @@
+"""fourYear 스크립트 모듈(box_engine, box_config ...)을 최상위 모듈로 import"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BASE_DIR))
+
+
+def load_script(name, filename):
+    """숫자로 시작하는 파일명의 스크립트를 경로로 로드"""
+    spec = importlib.util.spec_from_file_location(name, BASE_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def cycle_builder():
+    """01_4years_1day_supabase.py"""
+    return load_script("cycle_builder", "01_4years_1day_supabase.py")
+
+
+@pytest.fixture(scope="session")
+def bear_script():
+    """03_4years_1day_boxRanges_bear.py"""
+    return load_script("bear_script", "03_4years_1day_boxRanges_bear.py")
@@ -0,0 +1,49 @@
+"""box_config 임계값과 프론트엔드 BEAR_CONFIG / BULL_CONFIG / BOX_REFINE_TIMEFRAME이 같은지 (param_set 키 일치)"""
+
+import re
+from pathlib import Path
+
+from box_config import (
+    BEAR_MAX_DAYS,
+    BEAR_PARAMS,
+    BULL_MIN_DAYS,
+    BULL_PARAMS,
+    REFINE_TIMEFRAME,
+)
+from box_publish import params_key
+
+CHART_DATA_JS = Path(__file__).resolve().parents[4] / "frontend" / "utils" / "chartData.js"
+
+
+def read_js_config(name):
+    """chartData.js의 export const <name> = {...} -> {키: 숫자}"""
+    source = CHART_DATA_JS.read_text(encoding="utf-8")
+    body = re.search(rf"export const {name} = \{{(.*?)\}}", source, re.S).group(1)
+    return {key: float(value) for key, value in re.findall(r"(\w+):\s*([\d.]+)", body)}
+
+
+def test_bear_config_matches_frontend():
+    js = read_js_config("BEAR_CONFIG")
+    assert js == {key.upper(): float(value) for key, value in BEAR_PARAMS.items()}
+    assert js["MAX_DURATION_DAYS"] == BEAR_MAX_DAYS
+
+
+def test_bull_config_matches_frontend():
+    js = read_js_config("BULL_CONFIG")
+    assert js.pop("MIN_DAYS_FROM_PEAK") == BULL_MIN_DAYS
+    assert js.pop("LOOKBACK_DAYS") == BULL_PARAMS["lookback"]
+    expected = {key.upper(): float(value) for key, value in BULL_PARAMS.items()}
+    expected.pop("LOOKBACK")
+    assert js == expected
+
+
+def test_refine_timeframe_matches_frontend():
+    source = CHART_DATA_JS.read_text(encoding="utf-8")
+    value = re.search(r"export const BOX_REFINE_TIMEFRAME = (null|'[^']*')", source).group(1)
+    assert (None if value == "null" else value.strip("'")) == REFINE_TIMEFRAME
+
+
+def test_refined_boxes_use_own_params_key():
+    daily = params_key(BEAR_PARAMS)
+    assert params_key(BEAR_PARAMS, "1h") == f"{daily}|refine=1h"
+    assert params_key(BEAR_PARAMS, None) == daily
@@ -0,0 +1,53 @@
+"""box_engine이 기준 구현(iloc 기반 03 / 04)의 golden 결과를 그대로 재현하는지"""
+
+import pytest
+
+from box_engine import find_bear_boxes, find_bull_boxes
+from box_goldens import (
+    BASELINE,
+    baseline_params,
+    baseline_records,
+    golden_cases,
+    golden_records,
+    load_goldens,
+)
+from box_stream import data_digest
+
+FIND_BOXES = {"bear": find_bear_boxes, "bull": find_bull_boxes}
+CASES = [
+    (mode, name, arrays)
+    for mode in FIND_BOXES
+    for name, arrays in golden_cases(mode).items()
+]
+
+
+@pytest.mark.parametrize("mode", list(FIND_BOXES))
+def test_golden_cases_complete(mode):
+    assert set(load_goldens(mode)["cases"]) == set(golden_cases(mode))
+
+
+@pytest.mark.parametrize("mode, name, arrays", CASES, ids=[name for _, name, _ in CASES])
+def test_engine_matches_baseline(mode, name, arrays):
+    goldens = load_goldens(mode)
+    golden = goldens["cases"][name]
+    # 합성 입력이 golden을 만들 때와 같은지 먼저 확인
+    assert data_digest(*arrays) == golden["digest"]
+
+    boxes = FIND_BOXES[mode](*arrays, **goldens["params"])
+    assert golden_records(mode, *arrays, boxes) == golden["boxes"]
+
+
+@pytest.mark.parametrize("mode", list(FIND_BOXES))
+def test_real_closed_cycles_included(mode):
+    # 끝난 실제 사이클(goldens/cycle_closed.json)도 golden 케이스에 포함
+    assert any(name.startswith(f"real_{mode}_cycle") for name in golden_cases(mode))
+
+
+@pytest.mark.parametrize("mode", list(FIND_BOXES))
+def test_baseline_reproduces_goldens(mode):
+    # 저장소에 옮겨 둔 기준 구현이 커밋된 golden을 그대로 만드는지 (기준 구현이 바뀌지 않았는지)
+    goldens = load_goldens(mode)
+    module = BASELINE[mode]
+    assert baseline_params(mode, module) == goldens["params"]
+    for name, arrays in golden_cases(mode).items():
+        assert baseline_records(mode, module, *arrays) == goldens["cases"][name]["boxes"], name
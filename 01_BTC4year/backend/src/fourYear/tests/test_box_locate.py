@@ -0,0 +1,96 @@
+"""03 locate_boxes: searchsorted 조회가 기존 day별 박스 루프와 같은지"""
+
+import numpy as np
+import pytest
+
+from box_config import BEAR_PARAMS
+from box_engine import find_bear_boxes
+from box_goldens import synthetic_cycle
+from box_table import BoxRecord, BoxTable
+
+
+def scan_boxes(days, boxes):
+    """기존 visualize_boxes의 day별 루프 (현재 박스 위치, 전고점) - 비교 기준"""
+    result = []
+    for day in days:
+        current = -1
+        for pos, box in enumerate(boxes):
+            if box["Start_Day"] <= day <= box["End_Day"]:
+                current = pos
+                break
+
+        prev_high = 100
+        for box in boxes:
+            if box["Peak_Day"] < day:
+                prev_high = box["Peak_Rate"]
+            elif box["Peak_Day"] >= day:
+                break
+        result.append((current, prev_high))
+    return result
+
+
+def located(bear_script, days, boxes):
+    box_pos, prev_pos = bear_script.locate_boxes(days, boxes)
+    prev_highs = boxes.columns["extreme_rate"].tolist()
+    return [
+        (box, prev_highs[prev] if prev >= 0 else 100)
+        for box, prev in zip(box_pos.tolist(), prev_pos.tolist())
+    ]
+
+
+def hand_boxes(spans):
+    """(시작일, 고점일, 종료일) 목록 -> bear BoxTable"""
+    records = [
+        BoxRecord(
+            side="bear",
+            cycle=1,
+            box_id=box_id,
+            start_day=start,
+            start_timestamp=f"d{start}",
+            start_rate=50.0,
+            extreme_day=peak,
+            extreme_timestamp=f"d{peak}",
+            extreme_rate=60.0 + box_id,
+            end_day=end,
+            end_timestamp=f"d{end}",
+            end_rate=49.0,
+            move_percent=10.0,
+            duration_days=end - start,
+            box_broken=True,
+        )
+        for box_id, (start, peak, end) in enumerate(spans, 1)
+    ]
+    return BoxTable.from_records("bear", records)
+
+
+@pytest.mark.parametrize(
+    "spans",
+    [
+        [],
+        # 첫 박스 전 구간 / 종료 다음날 시작하는 박스 / 박스 사이 공백 / 마지막 박스 이후
+        [(3, 5, 8), (9, 10, 14), (20, 22, 25)],
+        # 하루짜리 박스, 시작일 = 고점일, 고점일 = 종료일
+        [(0, 0, 1), (2, 4, 4), (5, 6, 6), (30, 30, 30)],
+    ],
+)
+def test_hand_boxes_match_day_scan(bear_script, spans):
+    boxes = hand_boxes(spans)
+    days = np.arange(0, 40)
+    assert located(bear_script, days, boxes) == scan_boxes(days, boxes.to_json_list())
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_engine_boxes_match_day_scan(bear_script, seed):
+    days, low, high = synthetic_cycle(seed, 420)
+    raw_boxes = find_bear_boxes(days, low, high, **BEAR_PARAMS)
+    dates = [f"d{day:.0f}" for day in days]
+    boxes = BoxTable.from_engine("bear", 1, days, dates, low, high, raw_boxes)
+    assert len(boxes)
+
+    # 데이터가 빠진 날(공백)도 섞어서 조회
+    rng = np.random.default_rng(seed)
+    kept = np.sort(rng.choice(len(days), 300, replace=False))
+    for sample in (days.astype(np.int64), days.astype(np.int64)[kept]):
+        assert located(bear_script, sample, boxes) == scan_boxes(
+            sample.tolist(), boxes.to_json_list()
+        )
@@ -0,0 +1,62 @@
+"""BoxStream.sync: 최근 며칠이 매일 다시 쓰여도 확정 구간은 유지하고 전체 재계산과 같은 결과"""
+
+import numpy as np
+import pytest
+
+from box_engine import find_bear_boxes, find_bull_boxes
+from box_goldens import synthetic_cycle
+from box_stream import BoxStream
+
+FIND_BOXES = {"bear": find_bear_boxes, "bull": find_bull_boxes}
+REWRITE_DAYS = 7  # 01이 매일 다시 계산하는 최근 기간
+
+
+@pytest.mark.parametrize("mode", list(FIND_BOXES))
+def test_sync_with_rewritten_tail(mode):
+    days, low, high = synthetic_cycle(3, 600)
+    rng = np.random.default_rng(0)
+    stream = BoxStream(mode)
+    resets = []
+    reset = stream.reset
+    stream.reset = lambda: (resets.append(True), reset())
+
+    for end in range(100, len(days) + 1, 5):
+        # 마지막 7일은 다음 실행에서 다른 값으로 다시 쓰임 (마지막 실행은 실제 값)
+        noisy_low = low[:end].copy()
+        noisy_high = high[:end].copy()
+        if end < len(days):
+            noise = rng.uniform(0.97, 1.03, REWRITE_DAYS)
+            noisy_low[-REWRITE_DAYS:] *= noise
+            noisy_high[-REWRITE_DAYS:] *= noise
+        boxes = stream.sync(days[:end], noisy_low, noisy_high)
+        assert boxes == FIND_BOXES[mode](days[:end], noisy_low, noisy_high)
+
+    assert not resets
+    assert stream.settled > 0
+
+
+@pytest.mark.parametrize("mode", list(FIND_BOXES))
+def test_sync_recomputes_when_settled_prefix_changes(mode):
+    days, low, high = synthetic_cycle(5, 600)
+    stream = BoxStream(mode)
+    stream.sync(days, low, high)
+    assert stream.settled > 0
+
+    # 사이클 재계산(Peak 변경 등)으로 앞쪽 비율이 모두 바뀐 경우
+    low, high = low * 0.9, high * 0.9
+    assert stream.sync(days, low, high) == FIND_BOXES[mode](days, low, high)
+
+
+@pytest.mark.parametrize("mode", list(FIND_BOXES))
+def test_sync_intraday_matches_batch(mode):
+    # 4시간봉 (하루 6개): lookback / 최대 기간은 캔들 개수로 환산
+    params = {"points_per_day": 6}
+    _, low, high = synthetic_cycle(6, 4000, volatility=0.02)
+    days = np.arange(len(low)) / params["points_per_day"]
+    stream = BoxStream(mode, params)
+
+    for end in range(300, len(days) + 1, 37):
+        boxes = stream.sync(days[:end], low[:end], high[:end])
+        assert boxes == FIND_BOXES[mode](days[:end], low[:end], high[:end], **params)
+    assert boxes == FIND_BOXES[mode](days, low, high, **params)
+    assert stream.settled > 0
@@ -0,0 +1,71 @@
+"""box_table: 시간봉(소수 경과일) 박스가 경과일을 자르지 않고 보관 / 출력하는지"""
+
+import numpy as np
+import pytest
+
+from box_table import BoxTable
+
+# 4시간봉 2일치 (points_per_day = 6)
+DAYS = np.arange(12) / 6
+DATES = [f"2026/02/0{5 + i // 6} {4 * (i % 6):02d}:00" for i in range(12)]
+LOW = np.linspace(0.5, 0.6, 12)
+HIGH = LOW + 0.05
+
+
+def raw_box(start, peak, end, start_rate, peak_rate, broken):
+    """box_engine bear 결과 형식"""
+    return {
+        "start_idx": start,
+        "peak_idx": peak,
+        "end_idx": end,
+        "start_rate": start_rate,
+        "peak_rate": peak_rate,
+        "broken": broken,
+    }
+
+
+# 같은 날(0일차) 시작하는 박스 2개 + 날을 넘기는 박스 1개
+RAW_BOXES = [
+    raw_box(1, 2, 3, 0.5, 0.55, True),
+    raw_box(4, 5, 5, 0.52, 0.56, True),
+    raw_box(5, 7, 10, 0.54, 0.6, False),
+]
+
+
+def test_intraday_days_keep_fractions():
+    table = BoxTable.from_engine("bear", 4, DAYS, DATES, LOW, HIGH, RAW_BOXES)
+
+    assert table.columns["start_day"].dtype == np.float64
+    assert np.allclose(table.columns["start_day"], [1 / 6, 4 / 6, 5 / 6])
+    assert np.allclose(table.columns["extreme_day"], [2 / 6, 5 / 6, 7 / 6])
+    assert np.allclose(table.columns["end_day"], [3 / 6, 5 / 6, 10 / 6])
+    assert np.allclose(table.columns["duration_days"], [2 / 6, 1 / 6, 5 / 6])
+    # 같은 날 시작한 박스도 서로 다른 시작 경과일
+    assert len(set(table.columns["start_day"].tolist())) == 3
+
+    record = table[2]
+    assert record.start_day == 5 / 6 and record.end_day == 10 / 6
+
+    info = table.to_json_list()[1]
+    assert info["Start_Day"] == 4 / 6 and info["Peak_Day"] == 5 / 6
+    assert info["Duration_Days"] == pytest.approx(1 / 6)
+
+    rows = table.to_rows("bear_test")
+    durations = [row["duration_days"] for row in rows]
+    assert durations == table.columns["duration_days"].tolist()
+
+    # box_refine처럼 레코드에서 다시 만들어도 소수 유지
+    rebuilt = BoxTable.from_records("bear", list(table))
+    assert rebuilt.columns["end_day"].tolist() == table.columns["end_day"].tolist()
+
+
+def test_daily_days_stay_int():
+    days = np.arange(12, dtype=float)
+    table = BoxTable.from_engine("bear", 4, days, DATES, LOW, HIGH, RAW_BOXES)
+
+    assert table.columns["start_day"].dtype == np.int64
+    assert table.columns["duration_days"].dtype == np.int64
+    info = table.to_json_list()[2]
+    assert (info["Start_Day"], info["End_Day"], info["Duration_Days"]) == (5, 10, 5)
+    assert isinstance(info["Start_Day"], int)
+    assert BoxTable.empty("bull").columns["end_day"].dtype == np.int64
@@ -0,0 +1,28 @@
+"""chart_output: 압축 사본은 차트 파일만 만들고 manifest는 제외하는지"""
+
+import gzip
+
+from chart_output import MANIFEST_NAME, precompress, update_manifest
+
+
+def test_precompress_skips_manifest(tmp_path):
+    (tmp_path / "chart.html").write_text("<html>" + "x" * 500 + "</html>")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "cycle.json").write_text('{"x": [1, 2, 3]}')
+    update_manifest(tmp_path, {"chart.html": "abc"})
+    # 이전 실행에서 만들어진 manifest 압축 사본
+    (tmp_path / f"{MANIFEST_NAME}.gz").write_bytes(gzip.compress(b"{}"))
+
+    results = precompress(tmp_path)
+
+    compressed = sorted(path.rsplit("/", 1)[-1] for path, *_ in results)
+    assert compressed == ["chart.html", "cycle.json"]
+    assert (tmp_path / "chart.html.gz").exists()
+    assert not (tmp_path / f"{MANIFEST_NAME}.gz").exists()
+    assert not (tmp_path / f"{MANIFEST_NAME}.br").exists()
+    html = gzip.decompress((tmp_path / "chart.html.gz").read_bytes())
+    assert html.startswith(b"<html>")
+
+    # manifest만 다시 써도 압축 대상 없음
+    update_manifest(tmp_path, {"chart.html": "def"})
+    assert precompress(tmp_path) == []
@@ -0,0 +1,92 @@
+"""chart_payload: LTTB 다운샘플 점 예산 / 필수 점 유지 / lod 페이로드 형식"""
+
+import numpy as np
+import pytest
+
+from box_goldens import synthetic_cycle
+from chart_payload import (
+    boundary_indices,
+    level_of_detail,
+    lttb_indices,
+    xy_columns,
+)
+
+
+def reference_lttb(x, y, budget):
+    """버킷 / 평균을 점마다 직접 계산하는 LTTB (같은 버킷 경계) - 비교 기준"""
+    n = len(y)
+    edges = np.linspace(1, n - 1, budget - 1).astype(np.int64)
+    selected = [0]
+    for b in range(budget - 2):
+        lo, hi = edges[b], edges[b + 1]
+        if b + 2 < len(edges):
+            nxt = range(edges[b + 1], edges[b + 2])
+            next_x = sum(x[i] for i in nxt) / len(nxt)
+            next_y = sum(y[i] for i in nxt) / len(nxt)
+        else:
+            next_x, next_y = x[-1], y[-1]
+        a = selected[-1]
+        areas = [
+            abs((x[a] - next_x) * (y[i] - y[a]) - (x[a] - x[i]) * (next_y - y[a]))
+            for i in range(lo, hi)
+        ]
+        selected.append(lo + int(np.argmax(areas)))
+    return selected + [n - 1]
+
+
+def series(seed=3, n=1500):
+    days, low, _ = synthetic_cycle(seed, n)
+    return xy_columns(days, low)
+
+
+@pytest.mark.parametrize("budget", [3, 10, 200, 599])
+def test_lttb_matches_reference(budget):
+    columns = series()
+    picked = lttb_indices(columns["x"], columns["y"], budget)
+    assert len(picked) == budget
+    assert picked.tolist() == reference_lttb(columns["x"], columns["y"], budget)
+
+
+def test_lod_keeps_budget_extremes_and_boundaries():
+    columns = series()
+    columns["box"] = list(range(len(columns["x"])))
+    keep = boundary_indices(columns["x"], [17, 401], [250], [900, 5000])
+    assert sorted(keep.tolist()) == [17, 250, 401, 900]  # 데이터에 없는 날(5000) 제외
+
+    payload = level_of_detail(columns, 300, keep)
+    lod = payload["lod"]
+
+    assert len(lod) <= 300
+    # decodeVisible이 순서대로 병합하므로 정렬 / 중복 없음 / 범위 안
+    assert lod == sorted(set(lod))
+    assert lod[0] == 0 and lod[-1] == len(columns["x"]) - 1
+    y = np.asarray(columns["y"])
+    assert {int(np.argmin(y)), int(np.argmax(y)), *keep.tolist()} <= set(lod)
+    # 원본 컬럼은 그대로 (확대 시 원본 점 사용)
+    assert {key: payload[key] for key in columns} == columns
+
+
+def test_lod_without_multi_resolution_takes_points():
+    columns = series()
+    columns["box"] = list(range(len(columns["x"])))
+    keep = boundary_indices(columns["x"], [100, 700])
+    payload = level_of_detail(columns, 250, keep, multi_resolution=False)
+
+    assert "lod" not in payload
+    assert set(payload) == set(columns)
+    assert len(payload["x"]) == len(payload["y"]) == len(payload["box"]) <= 250
+    # 선택한 점의 모든 컬럼이 같은 원본 위치에서 나옴
+    assert [columns["x"][i] for i in payload["box"]] == payload["x"]
+    assert {100, 700} <= set(payload["x"])
+
+
+def test_boundary_indices_skip_missing_days():
+    days = [0, 1, 2, 5, 6, 9]
+    assert boundary_indices(days, [2, 3], [9], [-1, 10]).tolist() == [2, 5]
+    assert boundary_indices(days, []).tolist() == []
+
+
+def test_short_series_unchanged():
+    columns = series(n=120)
+    assert level_of_detail(columns, 600, [5]) is columns
+    assert level_of_detail(columns, None) is columns
@@ -0,0 +1,131 @@
+"""01 전체 분석: 사이클 번호는 KNOWN_PEAK_DATES 키 기준 (데이터가 첫 Peak 이후에 시작해도 밀리지 않음)"""
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cycle_peaks import ONE_DAY_MS
+from cycle_storage import SQLiteCycleStorage
+
+
+def ohlcv_frame(cycle_builder, first_date, last_date, peaks):
+    """일봉 OHLCV (기본 종가 50, peaks={날짜: 종가})"""
+    first_ts = cycle_builder.date_to_ms(first_date)
+    last_ts = cycle_builder.date_to_ms(last_date)
+    timestamps = np.arange(first_ts, last_ts + ONE_DAY_MS, ONE_DAY_MS, dtype=np.int64)
+    closes = np.full(len(timestamps), 50.0)
+    for date, close in peaks.items():
+        closes[timestamps == cycle_builder.date_to_ms(date)] = close
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "open": closes,
+            "high": closes * 1.01,
+            "low": closes * 0.99,
+            "close": closes,
+            "volume": 1.0,
+        }
+    )
+
+
+def make_storage(path, ohlcv):
+    conn = sqlite3.connect(path)
+    ohlcv.to_sql("ohlcv_1day", conn, index=False)
+    conn.close()
+    return SQLiteCycleStorage(path)
+
+
+# Binance 데이터처럼 2017/11/01부터 시작 (2013 Peak 없음)
+BINANCE_PEAKS = {"2017/12/15": 100.0, "2021/11/08": 200.0, "2025/10/06": 300.0}
+
+
+def test_cycle_numbers_follow_known_peaks(cycle_builder):
+    df = ohlcv_frame(cycle_builder, "2017/11/01", "2026/10/18", BINANCE_PEAKS)
+    peaks = cycle_builder.find_all_peaks(df)
+    assert [(cycle_num, cycle_builder.ms_to_date(ts)) for cycle_num, ts, _ in peaks] == [
+        (2, "2017/12/15"),
+        (3, "2021/11/08"),
+        (4, "2025/10/06"),
+    ]
+
+
+def test_full_analysis_keeps_cycles_before_data(cycle_builder, tmp_path):
+    df = ohlcv_frame(cycle_builder, "2017/11/01", "2026/10/18", BINANCE_PEAKS)
+    storage = make_storage(tmp_path / "ohlcv.db", df)
+    # 이전 데이터 소스로 만든 Cycle 1 행 (이 데이터로는 다시 만들 수 없으므로 유지)
+    storage.upsert_cycle_rows(
+        [
+            {
+                "cycle_number": 1,
+                "cycle_name": "2013 Cycle",
+                "days_since_peak": 0,
+                "timestamp": "2013/12/04",
+                "close_price": 1237.0,
+            }
+        ]
+    )
+
+    cycle_builder.run_full_analysis(storage)
+
+    summary = {row["cycle_number"]: row for row in storage.get_cycle_summary()}
+    assert sorted(summary) == [1, 2, 3, 4]
+    assert summary[1]["row_count"] == 1
+    assert summary[2]["first_timestamp"] == "2017/12/15"
+    assert summary[3]["first_timestamp"] == "2021/11/08"
+    assert summary[4]["first_timestamp"] == "2025/10/06"
+
+    conn = sqlite3.connect(tmp_path / "ohlcv.db")
+    names = dict(
+        conn.execute("SELECT DISTINCT cycle_number, cycle_name FROM bitcoin_cycle_data")
+    )
+    conn.close()
+    assert names == {1: "2013 Cycle", 2: "2017 Cycle", 3: "2021 Cycle", 4: "2025 Cycle"}
+
+
+def test_known_peaks_after_data_end_are_skipped(cycle_builder):
+    df = ohlcv_frame(cycle_builder, "2013/01/01", "2018/01/01", {"2013/12/04": 100.0})
+    peaks = cycle_builder.find_all_peaks(df)
+    assert [cycle_num for cycle_num, _, _ in peaks] == [1, 2]
+
+
+def test_missing_known_peak_inside_data_fails(cycle_builder):
+    df = ohlcv_frame(cycle_builder, "2017/11/01", "2026/10/18", BINANCE_PEAKS)
+    df = df[df["timestamp"] != cycle_builder.date_to_ms("2021/11/08")]
+    with pytest.raises(ValueError, match="Cycle 3"):
+        cycle_builder.find_all_peaks(df)
+
+
+def test_rescale_moves_skipped_days_to_previous_cycle(cycle_builder, tmp_path):
+    # Cycle 4 Peak(2025/10/06) 이후 더 높은 종가가 나오면 그 사이 날짜는 Cycle 3 끝으로 이동
+    df = ohlcv_frame(
+        cycle_builder, "2017/11/01", "2026/02/10", {**BINANCE_PEAKS, "2026/02/05": 400.0}
+    )
+    before = df[df["timestamp"] <= cycle_builder.date_to_ms("2026/01/31")]
+    storage = make_storage(tmp_path / "ohlcv.db", before)
+    cycle_builder.run_full_analysis(storage)
+
+    conn = sqlite3.connect(tmp_path / "ohlcv.db")
+    df[df["timestamp"] > before["timestamp"].max()].to_sql(
+        "ohlcv_1day", conn, index=False, if_exists="append"
+    )
+    conn.close()
+    last_ts, _ = cycle_builder.get_last_saved_info(storage)
+    cycle_builder.run_incremental_update(storage, last_ts)
+    incremental = storage.fetch_cycle_rows()
+
+    # 빠진 날짜 없이 첫 Peak 이후 모든 날짜가 한 사이클에 한 번씩
+    expected_dates = {
+        cycle_builder.ms_to_date(ts)
+        for ts in df["timestamp"]
+        if ts >= cycle_builder.date_to_ms("2017/12/15")
+    }
+    assert sorted(incremental["timestamp"]) == sorted(expected_dates)
+
+    peak_row = storage.get_cycle_peak_row(4)
+    assert peak_row["timestamp"] == "2026/02/05"
+
+    # 같은 데이터의 전체 분석 결과와 동일
+    cycle_builder.run_full_analysis(storage)
+    pd.testing.assert_frame_equal(incremental, storage.fetch_cycle_rows(), check_dtype=False)
@@ -0,0 +1,71 @@
+"""cycle_chunks: 기존 청크 + 01이 저장한 행으로 만든 청크가 전체 조회로 만든 청크와 같은지"""
+
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+
+from cycle_chunks import load_chunk_rows, merge_chunk_rows, publish_cycle_chunks, rows_summary
+from cycle_cube import CycleCube
+
+
+def cycle_rows(cycle_num, first_day, last_day, scale=1.0):
+    """01이 저장하는 Long format 행 (사이클 / 경과일 구간)"""
+    days = np.arange(first_day, last_day + 1)
+    close = 100 * scale * (1 + 0.01 * np.sin(days + cycle_num))
+    return pd.DataFrame(
+        {
+            "cycle_number": cycle_num,
+            "days_since_peak": days,
+            "timestamp": [f"{2010 + cycle_num}/day{day}" for day in days],
+            "close_price": close,
+            "low_price": close * 0.98,
+            "high_price": close * 1.02,
+            "close_rate": close,
+            "low_rate": close * 0.98,
+            "high_rate": close * 1.02,
+        }
+    )
+
+
+def publish(rows, output_dir):
+    with contextlib.redirect_stdout(io.StringIO()):
+        publish_cycle_chunks(CycleCube.from_long(rows), output_dir, chunk_days=100)
+
+
+def chunk_files(output_dir):
+    return {path.name: path.read_bytes() for path in output_dir.glob("*.json")}
+
+
+def test_merge_matches_full_publish(tmp_path):
+    before = pd.concat([cycle_rows(1, 0, 300), cycle_rows(2, 0, 250)], ignore_index=True)
+    publish(before, tmp_path / "chunks")
+
+    # 증분: 마지막 7일 다시 계산 + 새 날짜 3일 (값이 바뀐 날 포함)
+    saved = cycle_rows(2, 244, 253, scale=1.01)
+    expected = pd.concat([cycle_rows(1, 0, 300), cycle_rows(2, 0, 243), saved], ignore_index=True)
+
+    existing = load_chunk_rows(tmp_path / "chunks")
+    merged = merge_chunk_rows(existing, saved)
+    assert rows_summary(merged) == rows_summary(expected)
+
+    publish(merged, tmp_path / "chunks")
+    publish(expected, tmp_path / "full")
+    assert chunk_files(tmp_path / "chunks") == chunk_files(tmp_path / "full")
+
+
+def test_merge_replaces_rescaled_cycle_and_drops_later_cycles():
+    existing = pd.concat(
+        [cycle_rows(1, 0, 300), cycle_rows(2, 0, 250), cycle_rows(3, 0, 20)], ignore_index=True
+    )
+    # Peak 변경: 사이클 2 전체를 새 Peak 기준으로 다시 저장 (사이클 3은 더 이상 없음)
+    saved = cycle_rows(2, 0, 230, scale=0.9)
+    merged = merge_chunk_rows(existing, saved)
+
+    assert rows_summary(merged) == [(1, 301, 300), (2, 231, 230)]
+    assert np.allclose(merged[merged["cycle_number"] == 2]["close_rate"], saved["close_rate"])
+
+
+def test_load_without_manifest(tmp_path):
+    assert load_chunk_rows(tmp_path) is None
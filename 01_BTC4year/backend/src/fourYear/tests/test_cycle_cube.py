@@ -0,0 +1,122 @@
+"""cycle_cube: 큐브의 to_wide()가 기존 pivot 기반 Wide format과 같은지"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cycle_cube import CycleCube
+
+# 기존 cycle_loader.to_wide_format의 값 컬럼 (Long format -> Wide 접미사)
+VALUE_COLUMNS = {
+    "timestamp": "timestamp",
+    "close_price": "close",
+    "low_price": "low",
+    "high_price": "high",
+    "close_rate": "rate",
+    "low_rate": "low_rate",
+    "high_rate": "high_rate",
+}
+
+
+def long_rows():
+    """사이클 3개 (길이가 다르고, 사이클 2는 중간에 빠진 날 있음)"""
+    frames = []
+    for cycle_num, last_day, missing in ((1, 30, ()), (2, 24, (7, 8)), (3, 12, ())):
+        days = np.array([d for d in range(last_day + 1) if d not in missing])
+        close = 100 * cycle_num * (1 + 0.05 * np.sin(days))
+        rate = close / close[0] * 100
+        frames.append(
+            pd.DataFrame(
+                {
+                    "cycle_number": cycle_num,
+                    "days_since_peak": days,
+                    "timestamp": [f"{2010 + cycle_num}/d{day:03d}" for day in days],
+                    "close_price": close,
+                    "low_price": close * 0.97,
+                    "high_price": close * 1.03,
+                    "close_rate": rate,
+                    "low_rate": rate * 0.97,
+                    "high_rate": rate * 1.03,
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def reference_wide(df, min_days=None, max_days=None):
+    """기존 cycle_loader (to_wide_format + filter_days) - 비교 기준"""
+    result_df = df.pivot(
+        index="days_since_peak",
+        columns="cycle_number",
+        values=list(VALUE_COLUMNS),
+    )
+    result_df.columns = [
+        f"{cycle_num}_{VALUE_COLUMNS[col_type]}"
+        for col_type, cycle_num in result_df.columns
+    ]
+    result_df.reset_index(inplace=True)
+    result_df.rename(columns={"days_since_peak": "Days_Since_Peak"}, inplace=True)
+
+    mask = pd.Series(True, index=result_df.index)
+    if min_days is not None:
+        mask &= result_df["Days_Since_Peak"] >= min_days
+    if max_days is not None:
+        mask &= result_df["Days_Since_Peak"] <= max_days
+    return result_df[mask].dropna(axis=1, how="all").reset_index(drop=True)
+
+
+@pytest.mark.parametrize(
+    "min_days, max_days",
+    [
+        (None, None),
+        (None, 10),
+        (5, 20),
+        (7, 8),  # 사이클 2가 빠진 날만 조회
+        (13, None),  # 사이클 3 이후 구간 (사이클 3 컬럼 제외)
+    ],
+)
+def test_to_wide_matches_pivot(min_days, max_days):
+    df = long_rows()
+    wide = CycleCube.from_long(df).to_wide(min_days, max_days)
+    expected = reference_wide(df, min_days, max_days)
+
+    assert list(wide.columns) == list(expected.columns)
+    assert len(wide) == len(expected)
+    for column in expected.columns:
+        if column.endswith("_timestamp"):
+            got, want = (
+                frame[column].where(frame[column].notna(), None).tolist()
+                for frame in (wide, expected)
+            )
+            assert got == want
+        else:
+            assert np.allclose(
+                wide[column].to_numpy(dtype=float),
+                expected[column].to_numpy(dtype=float),
+                equal_nan=True,
+            ), column
+
+
+def test_to_wide_empty_range():
+    # 기존 pivot은 Days_Since_Peak 컬럼까지 사라졌지만 큐브는 컬럼을 유지 (둘 다 행 없음)
+    df = long_rows()
+    wide = CycleCube.from_long(df).to_wide(40)
+    assert wide.empty and reference_wide(df, 40).empty
+    assert list(wide.columns) == ["Days_Since_Peak"]
+
+
+def test_select_days_and_cycle_slice():
+    df = long_rows()
+    cube = CycleCube.from_long(df)
+
+    selected = cube.select_days(13, 24)
+    assert selected.cycles.tolist() == [1, 2]
+    assert selected.days.tolist() == list(range(13, 25))
+    assert not selected.has_cycle(3)
+
+    arrays = cube.cycle_slice(2, ["rate"])
+    cycle2 = df[df["cycle_number"] == 2]
+    assert arrays["days"].tolist() == cycle2["days_since_peak"].tolist()
+    assert arrays["dates"].tolist() == cycle2["timestamp"].tolist()
+    assert np.allclose(arrays["rate"], cycle2["close_rate"])
+    assert np.isnan(cube.get("rate", 2)[7]) and not cube.valid(2)[7]
@@ -0,0 +1,96 @@
+"""cycle_loader: 캐시된 큐브를 재사용하고, 사이클 행 수 / 마지막 경과일이 바뀌면 다시 조회하는지"""
+
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+
+from cycle_loader import load_cycle_cube, load_cycle_data
+
+
+def cycle_rows(cycle_num, days):
+    close = 100 + np.asarray(days, dtype=float)
+    return pd.DataFrame(
+        {
+            "cycle_number": cycle_num,
+            "days_since_peak": days,
+            "timestamp": [f"{2010 + cycle_num}/d{day:03d}" for day in days],
+            "close_price": close,
+            "low_price": close - 1,
+            "high_price": close + 1,
+            "close_rate": close / 100,
+            "low_rate": (close - 1) / 100,
+            "high_rate": (close + 1) / 100,
+        }
+    )
+
+
+class FakeStorage:
+    """요약 뷰 / 전체 조회만 흉내 (전체 조회 횟수 기록)"""
+
+    name = "fake"
+
+    def __init__(self, df):
+        self.df = df
+        self.fetches = 0
+
+    def get_cycle_summary(self):
+        days = self.df.groupby("cycle_number")["days_since_peak"]
+        summary = days.agg(["size", "max"])
+        return [
+            {"cycle_number": cycle, "row_count": count, "max_days_since_peak": max_day}
+            for cycle, (count, max_day) in summary.iterrows()
+        ]
+
+    def fetch_cycle_rows(self):
+        self.fetches += 1
+        return self.df.copy()
+
+
+def load(storage, cache_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return load_cycle_cube(storage, cache_path=cache_path)
+
+
+def test_cache_reused_until_summary_changes(tmp_path):
+    cache_path = tmp_path / "cycle_data_cache.pkl"
+    storage = FakeStorage(
+        pd.concat([cycle_rows(1, range(0, 20)), cycle_rows(2, range(0, 10))])
+    )
+
+    first = load(storage, cache_path)
+    cached = load(storage, cache_path)
+    assert storage.fetches == 1
+    assert cached.days.tolist() == first.days.tolist()
+    assert np.array_equal(cached.values, first.values, equal_nan=True)
+
+    # 행 수만 변경 (빠졌던 날 추가, 마지막 경과일은 그대로)
+    storage.df = pd.concat(
+        [cycle_rows(1, range(0, 20)), cycle_rows(2, [d for d in range(10) if d != 4])]
+    )
+    load(storage, cache_path)
+    storage.df = pd.concat([cycle_rows(1, range(0, 20)), cycle_rows(2, range(0, 10))])
+    cube = load(storage, cache_path)
+    assert storage.fetches == 3
+    assert cube.valid(2)[4]
+
+    # 행 수는 같고 마지막 경과일만 변경 (Peak 변경으로 경과일이 한 칸 밀림)
+    storage.df = pd.concat([cycle_rows(1, range(0, 20)), cycle_rows(2, range(1, 11))])
+    cube = load(storage, cache_path)
+    assert storage.fetches == 4
+    assert cube.cycle_slice(2)["days"].tolist() == list(range(1, 11))
+
+    load(storage, cache_path)
+    assert storage.fetches == 4
+
+
+def test_use_cache_false_skips_cache(tmp_path):
+    cache_path = tmp_path / "cycle_data_cache.pkl"
+    storage = FakeStorage(cycle_rows(1, range(0, 5)))
+    with contextlib.redirect_stdout(io.StringIO()):
+        load_cycle_cube(storage, use_cache=False, cache_path=cache_path)
+        wide = load_cycle_data(storage=storage, use_cache=False)
+    assert storage.fetches == 2
+    assert not cache_path.exists()
+    assert wide["1_rate"].tolist() == [1.0, 1.01, 1.02, 1.03, 1.04]
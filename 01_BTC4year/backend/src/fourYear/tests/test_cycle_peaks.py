@@ -0,0 +1,33 @@
+"""진행 중인 사이클 Peak 규칙: 전체 분석(detect_cycles)과 01 증분 업데이트(find_new_peak)가 같은지"""
+
+import numpy as np
+import pandas as pd
+
+from cycle_peaks import ONE_DAY_MS, THREE_YEARS_MS, detect_cycles
+
+
+def test_open_cycle_peak_moves_after_confirm_window(cycle_builder):
+    # Day 0 고점 이후 1년 넘게 지나(확인기간 밖) 더 높은 종가 - 3년 간격 안이므로 같은 사이클
+    closes = np.full(900, 50.0)
+    closes[0] = 100.0
+    closes[500] = 120.0
+    timestamps = np.arange(900, dtype=np.int64) * ONE_DAY_MS
+
+    cycles = detect_cycles(timestamps, closes, min_spacing_ms=THREE_YEARS_MS)
+    assert [cycle["peak_ts"] for cycle in cycles] == [500 * ONE_DAY_MS]
+
+    # 증분 업데이트: 기존 Peak(Day 0) 기준으로 찾은 새 Peak도 같은 날
+    df = pd.DataFrame({"timestamp": timestamps, "close": closes})
+    assert cycle_builder.find_new_peak(df, 0, 100.0) == (500 * ONE_DAY_MS, 120.0)
+
+
+def test_closed_cycle_keeps_confirmed_peak():
+    # 다음 Peak가 생긴 사이클은 확인기간 규칙 그대로 (마지막 사이클만 이동)
+    closes = np.full(1500, 50.0)
+    closes[0] = 100.0
+    closes[500] = 120.0
+    closes[1200] = 130.0
+    timestamps = np.arange(1500, dtype=np.int64) * ONE_DAY_MS
+
+    cycles = detect_cycles(timestamps, closes, min_spacing_ms=THREE_YEARS_MS)
+    assert [cycle["peak_ts"] // ONE_DAY_MS for cycle in cycles] == [0, 1200]
@@ -0,0 +1,67 @@
+"""ohlcv_mirror: 로컬 checksum이 원격 ohlcv_1day_checksums(double precision 반올림)와 같은지, 동기화는 저장소당 한 번"""
+
+import pandas as pd
+
+import cycle_storage
+from ohlcv_mirror import (
+    ONE_DAY_MS,
+    checksum_cents,
+    compute_checksums,
+    fetch_remote_checksums,
+)
+
+BUCKET_MS = 90 * ONE_DAY_MS
+
+# 원격 ohlcv_1day 행 (PostgREST 응답) - 반 센트 값 포함
+REMOTE_ROWS = [
+    {"timestamp": 0, "close": 1.005, "low": 0.995, "high": 1.015},
+    {"timestamp": ONE_DAY_MS, "close": 2.675, "low": 2.665, "high": 2.685},
+    {
+        "timestamp": 100 * ONE_DAY_MS,
+        "close": 12345.675,
+        "low": 12300.125,
+        "high": 12400.5,
+    },
+]
+# 같은 행에 대한 ohlcv_1day_checksums(bucket_ms) 응답
+# (numeric 그대로 반올림하던 이전 정의는 bucket 0이 1107 -> 매번 불일치)
+REMOTE_CHECKSUMS = [
+    {"bucket": 0, "row_count": 2, "checksum": 1105},
+    {"bucket": 1, "row_count": 1, "checksum": 3704631},
+]
+
+
+class FakeRpc:
+    """supabase.rpc(...).execute() 응답만 흉내"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def rpc(self, name, params):
+        assert name == "ohlcv_1day_checksums" and params == {"bucket_ms": BUCKET_MS}
+        return self
+
+    def execute(self):
+        return self
+
+
+def test_checksum_cents_rounds_float64():
+    assert checksum_cents([1.005, 0.995, 1.015, 12400.5]).tolist() == [100, 100, 101, 1240050]
+
+
+def test_local_checksums_match_remote_fixture():
+    local = compute_checksums(pd.DataFrame(REMOTE_ROWS), BUCKET_MS)
+    assert local == fetch_remote_checksums(FakeRpc(REMOTE_CHECKSUMS), BUCKET_MS)
+
+
+def test_mirror_synced_once_per_storage(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cycle_storage, "sync_ohlcv_mirror", lambda client: calls.append(client))
+    monkeypatch.setattr(
+        cycle_storage, "load_ohlcv_from_mirror", lambda from_ts=None: pd.DataFrame(REMOTE_ROWS)
+    )
+    storage = cycle_storage.SupabaseCycleStorage("http://localhost", "key", use_mirror=True)
+
+    storage.fetch_ohlcv()
+    storage.fetch_ohlcv(ONE_DAY_MS)
+    assert len(calls) == 1
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react'
 import {
   fetchCycleData,
+  fetchBoxRanges,
   groupByCycle,
   createCycleComparisonSeries,
   calculateBearBoxes,
@@ -65,7 +66,11 @@ export function useBearBoxData(cycleNumber = 4) {
     async function loadData() {
       try {
         setLoading(true)
-        const data = await fetchCycleData(BEAR_CONFIG.MAX_DURATION_DAYS)
+        // 해당 사이클 일봉 + 저장된 박스권 결과를 함께 조회
+        const [data, storedBoxes] = await Promise.all([
+          fetchCycleData(BEAR_CONFIG.MAX_DURATION_DAYS, null, cycleNumber),
+          fetchBoxRanges('bear', cycleNumber, BEAR_CONFIG),
+        ])
         
         if (!data || data.length === 0) {
           setError('데이터를 찾을 수 없습니다.')
@@ -80,7 +85,8 @@ export function useBearBoxData(cycleNumber = 4) {
           return
         }
 
-        const calculatedBoxes = calculateBearBoxes(cycleData, cycleNumber)
+        // 저장된 결과가 없을 때만 브라우저에서 계산
+        const calculatedBoxes = storedBoxes || calculateBearBoxes(cycleData, cycleNumber)
         const lineDataWithBoxes = createBearLineData(cycleData, calculatedBoxes)
 
         setBoxes(calculatedBoxes)
@@ -117,7 +123,11 @@ export function useBullBoxData(cycleNumber = 3) {
     async function loadData() {
       try {
         setLoading(true)
-        const data = await fetchCycleData(null, BULL_CONFIG.MIN_DAYS_FROM_PEAK)
+        // 해당 사이클 일봉 + 저장된 박스권 결과를 함께 조회
+        const [data, storedBoxes] = await Promise.all([
+          fetchCycleData(null, BULL_CONFIG.MIN_DAYS_FROM_PEAK, cycleNumber),
+          fetchBoxRanges('bull', cycleNumber, BULL_CONFIG),
+        ])
         
         if (!data || data.length === 0) {
           setError('데이터를 찾을 수 없습니다.')
@@ -132,7 +142,8 @@ export function useBullBoxData(cycleNumber = 3) {
           return
         }
 
-        const calculatedBoxes = calculateBullBoxes(cycleData, cycleNumber)
+        // 저장된 결과가 없을 때만 브라우저에서 계산
+        const calculatedBoxes = storedBoxes || calculateBullBoxes(cycleData, cycleNumber)
         const lineDataWithBoxes = createBullLineData(cycleData, calculatedBoxes)
         const maxDays = Math.max(...cycleData.map(d => d.day))
 
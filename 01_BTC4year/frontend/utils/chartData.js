@@ -2,6 +2,11 @@ import { supabase } from '../lib/supabase'
 
 // ==================== 설정 ====================
 export const CYCLE_TABLE_NAME = 'bitcoin_cycle_data'
+export const BOX_TABLE_NAME = 'bitcoin_box_ranges'
+
+// 정적 사이클 청크 위치 (backend cycle_chunks.py 출력 폴더, 없으면 Supabase 조회로 대체)
+export const CYCLE_DATA_URL = (import.meta.env.VITE_CYCLE_DATA_URL || 'cycle_data').replace(/\/$/, '')
+const CHUNK_MANIFEST_NAME = 'cycle_manifest.json'
 
 // Bear (하락장) 설정
 export const BEAR_CONFIG = {
@@ -21,6 +26,9 @@ export const BULL_CONFIG = {
   LOOKBACK_DAYS: 10,         // N일 범위에서 최고점일 때만 고점으로 인정
 }
 
+// 05 스크립트의 시간봉 보정 (backend box_config.py REFINE_TIMEFRAME과 같은 값, null이면 일봉 결과)
+export const BOX_REFINE_TIMEFRAME = null
+
 // 차트 색상
 export const COLORS = [
   '#3B82F6', '#10B981', '#EF4444', '#F59E0B',
@@ -31,14 +39,85 @@ export const COLOR_NAMES = ['blue', 'green', 'red', 'orange', 'purple', 'pink',
 
 // ==================== 데이터 로딩 ====================
 
+let manifestPromise = null
+const chunkPromises = {}
+
+async function fetchJson(url, init) {
+  const response = await fetch(url, init)
+  if (!response.ok) {
+    throw new Error(`${url}: HTTP ${response.status}`)
+  }
+  return response.json()
+}
+
 /**
- * Supabase에서 사이클 데이터 로드
+ * 컬럼형 청크 -> Supabase 조회와 같은 행 객체 배열
  */
-export async function fetchCycleData(maxDays = null, minDays = null) {
-  console.log('=== fetchCycleData 호출 ===')
-  console.log('파라미터 - maxDays:', maxDays, ', minDays:', minDays)
-  
-  let allData = []
+function chunkToRows(chunk) {
+  const rows = new Array(chunk.days_since_peak.length)
+  for (let i = 0; i < rows.length; i++) {
+    rows[i] = {
+      cycle_number: chunk.cycle_number,
+      days_since_peak: chunk.days_since_peak[i],
+      timestamp: chunk.timestamp[i],
+      close_rate: chunk.close_rate[i],
+      low_rate: chunk.low_rate[i],
+      high_rate: chunk.high_rate[i],
+    }
+  }
+  return rows
+}
+
+/**
+ * 청크 하나 로드 (같은 페이지의 여러 차트가 공유, 실패하면 다음 호출 때 재시도)
+ * 해시 이름 청크는 이름이 곧 버전이라 브라우저 캐시 그대로, tail은 version 쿼리로 갱신
+ */
+function loadChunk(entry) {
+  const url = `${CYCLE_DATA_URL}/${entry.file}` + (entry.version ? `?v=${entry.version}` : '')
+  if (!chunkPromises[url]) {
+    chunkPromises[url] = fetchJson(url)
+      .then(chunkToRows)
+      .catch(err => {
+        delete chunkPromises[url]
+        throw err
+      })
+  }
+  return chunkPromises[url]
+}
+
+/**
+ * 정적 청크에서 사이클 데이터 로드 (필요한 사이클 / 구간의 청크만 병렬 조회)
+ */
+async function fetchCycleChunks(maxDays, minDays, cycleNumber) {
+  if (!manifestPromise) {
+    // manifest는 매일 바뀌므로 항상 재검증
+    manifestPromise = fetchJson(`${CYCLE_DATA_URL}/${CHUNK_MANIFEST_NAME}`, { cache: 'no-cache' })
+      .catch(err => {
+        manifestPromise = null
+        throw err
+      })
+  }
+  const manifest = await manifestPromise
+
+  const entries = manifest.cycles
+    .filter(cycle => cycleNumber === null || cycle.cycle_number === cycleNumber)
+    .flatMap(cycle => cycle.chunks)
+    .filter(entry => (maxDays === null || entry.min_day <= maxDays) && (minDays === null || entry.max_day >= minDays))
+  const chunks = await Promise.all(entries.map(loadChunk))
+
+  const rows = chunks.flat().filter(row =>
+    (maxDays === null || row.days_since_peak <= maxDays) && (minDays === null || row.days_since_peak >= minDays)
+  )
+  // Supabase 조회와 같은 순서 (days_since_peak, cycle_number)
+  rows.sort((a, b) => a.days_since_peak - b.days_since_peak || a.cycle_number - b.cycle_number)
+  return rows
+}
+
+/**
+ * Supabase에서 사이클 데이터 조회 (1000행 단위 페이지)
+ */
+async function fetchCycleRows(maxDays, minDays, cycleNumber) {
+  const allData = []
   let offset = 0
   const batchSize = 1000
   
@@ -56,6 +135,9 @@ export async function fetchCycleData(maxDays = null, minDays = null) {
     if (minDays !== null) {
       query = query.gte('days_since_peak', minDays)
     }
+    if (cycleNumber !== null) {
+      query = query.eq('cycle_number', cycleNumber)
+    }
 
     const { data, error } = await query
 
@@ -68,7 +150,8 @@ export async function fetchCycleData(maxDays = null, minDays = null) {
       break
     }
 
-    allData = [...allData, ...data]
+    // 페이지마다 배열을 새로 만들지 않고 이어 붙임
+    allData.push(...data)
     
     if (data.length < batchSize) {
       break
@@ -77,6 +160,28 @@ export async function fetchCycleData(maxDays = null, minDays = null) {
     offset += batchSize
   }
 
+  return allData
+}
+
+/**
+ * 사이클 데이터 로드 (cycleNumber 지정 시 해당 사이클만)
+ * 정적 청크(캐시 가능)를 우선 사용하고, 청크가 없거나 실패하면 Supabase에서 조회
+ */
+export async function fetchCycleData(maxDays = null, minDays = null, cycleNumber = null) {
+  console.log('=== fetchCycleData 호출 ===')
+  console.log('파라미터 - maxDays:', maxDays, ', minDays:', minDays, ', cycleNumber:', cycleNumber)
+
+  let allData
+  try {
+    allData = await fetchCycleChunks(maxDays, minDays, cycleNumber)
+  } catch (err) {
+    console.warn('사이클 청크 로드 실패 (Supabase 조회로 대체):', err.message)
+    allData = await fetchCycleRows(maxDays, minDays, cycleNumber)
+    if (allData === null) {
+      return null
+    }
+  }
+
   console.log('응답 - 총 data 개수:', allData.length)
   console.log('응답 - days_since_peak 범위:', 
     allData.length ? `${Math.min(...allData.map(d => d.days_since_peak))} ~ ${Math.max(...allData.map(d => d.days_since_peak))}` : 'N/A'
@@ -85,6 +190,78 @@ export async function fetchCycleData(maxDays = null, minDays = null) {
   return allData
 }
 
+/**
+ * 박스권 파라미터 조합 키 (backend box_publish.py params_key와 같은 형식)
+ * refineTimeframe: 시간봉 보정 결과면 끝에 refine=<timeframe>
+ */
+export function boxParamsKey(side, config, refineTimeframe = null) {
+  const params = side === 'bear'
+    ? [
+        ['rise_threshold', config.RISE_THRESHOLD],
+        ['break_threshold', config.BREAK_THRESHOLD],
+        ['min_duration_days', config.MIN_DURATION_DAYS],
+        ['max_duration_days', config.MAX_DURATION_DAYS],
+        ['min_drop_from_prev_high', config.MIN_DROP_FROM_PREV_HIGH],
+      ]
+    : [
+        ['drop_threshold', config.DROP_THRESHOLD],
+        ['break_threshold', config.BREAK_THRESHOLD],
+        ['min_duration_days', config.MIN_DURATION_DAYS],
+        ['lookback', config.LOOKBACK_DAYS],
+      ]
+  const key = params.map(([key, value]) => `${key}=${value}`).join('|')
+  return refineTimeframe ? `${key}|refine=${refineTimeframe}` : key
+}
+
+/**
+ * 백엔드(03/04 스크립트)가 저장한 박스권 결과 로드
+ * 저장된 행이 없거나 오류면 null (브라우저 계산으로 대체)
+ */
+export async function fetchBoxRanges(
+  side,
+  cycleNumber,
+  config,
+  refineTimeframe = BOX_REFINE_TIMEFRAME,
+) {
+  const { data, error } = await supabase
+    .from(BOX_TABLE_NAME)
+    .select('*')
+    .eq('cycle_number', cycleNumber)
+    .eq('side', side)
+    .eq('param_set', boxParamsKey(side, config, refineTimeframe))
+    .order('box_id', { ascending: true })
+
+  if (error) {
+    console.warn('박스권 결과 로드 오류 (브라우저 계산으로 대체):', error.message)
+    return null
+  }
+  if (!data || data.length === 0) {
+    return null
+  }
+
+  // bear: 저점 -> 고점(Peak), bull: 고점 -> 저점(Low)
+  const extreme = side === 'bear' ? 'Peak' : 'Low'
+  const move = side === 'bear' ? 'Rise_Percent' : 'Drop_Percent'
+
+  return data.map(row => ({
+    Cycle: row.cycle_number,
+    Box_ID: row.box_id,
+    Start_Day: row.start_day,
+    Start_Timestamp: row.start_timestamp,
+    Start_Rate: row.start_rate,
+    [`${extreme}_Day`]: row.extreme_day,
+    [`${extreme}_Timestamp`]: row.extreme_timestamp,
+    [`${extreme}_Rate`]: row.extreme_rate,
+    End_Day: row.end_day,
+    End_Timestamp: row.end_timestamp,
+    End_Rate: row.end_rate,
+    [move]: row.move_percent,
+    Duration_Days: row.duration_days,
+    Box_Broken: row.box_broken,
+    color: COLORS[(row.box_id - 1) % COLORS.length],
+  }))
+}
+
 /**
  * 데이터를 사이클별로 그룹화
  */
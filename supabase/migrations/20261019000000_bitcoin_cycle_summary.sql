@@ -0,0 +1,17 @@
+-- 사이클별 요약 뷰 (행 개수 / 첫·마지막 timestamp / days_since_peak 범위)
+-- print_summary 등 상태 출력에서 사이클당 3회씩 보내던 요청을 1회 조회로 대체한다.
+create or replace view public.bitcoin_cycle_summary
+with (security_invoker = true) as
+select
+    cycle_number,
+    max(cycle_name) as cycle_name,
+    count(*) as row_count,
+    min(days_since_peak) as min_days_since_peak,
+    max(days_since_peak) as max_days_since_peak,
+    (array_agg("timestamp" order by days_since_peak asc))[1] as first_timestamp,
+    (array_agg("timestamp" order by days_since_peak desc))[1] as last_timestamp
+from public.bitcoin_cycle_data
+group by cycle_number;
+
+comment on view public.bitcoin_cycle_summary is
+    'bitcoin_cycle_data 사이클별 집계 (row_count, first/last timestamp, days_since_peak 범위)';
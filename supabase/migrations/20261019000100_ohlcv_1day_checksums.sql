@@ -0,0 +1,30 @@
+-- ohlcv_1day 구간별 checksum (로컬 미러 정합성 비교용)
+-- bucket = timestamp(ms) / bucket_ms, checksum = 센트 단위로 반올림한 close/low/high 합계
+-- 01_BTC4year/backend/src/fourYear/ohlcv_mirror.py 의 compute_checksums 와 같은 정의를 유지할 것
+create or replace function public.ohlcv_1day_checksums(bucket_ms bigint)
+returns table (bucket bigint, row_count bigint, checksum bigint)
+language sql
+stable
+as $$
+    select
+        t.ts_ms / bucket_ms as bucket,
+        count(*) as row_count,
+        sum(
+            floor(t.close * 100 + 0.5)
+            + floor(t.low * 100 + 0.5)
+            + floor(t.high * 100 + 0.5)
+        )::bigint as checksum
+    from (
+        select
+            case
+                when "timestamp" < 10000000000 then "timestamp" * 1000
+                else "timestamp"
+            end as ts_ms,
+            close,
+            low,
+            high
+        from public.ohlcv_1day
+    ) t
+    group by 1
+    order by 1;
+$$;
@@ -0,0 +1,38 @@
+-- 박스권 탐지 결과 (03 / 04 스크립트의 box_engine 결과를 저장)
+-- 프론트엔드는 일봉 전체 대신 이 테이블의 박스 행만 조회한다.
+-- side: 'bear'(하락장 반등 박스) / 'bull'(상승장 조정 박스)
+-- param_set: 탐지 임계값 키 (01_BTC4year/backend/src/fourYear/box_publish.py 의 params_key,
+--            frontend/utils/chartData.js 의 boxParamsKey 와 같은 형식)
+-- extreme_*: bear는 박스 고점(Peak), bull은 박스 저점(Low)
+create table if not exists public.bitcoin_box_ranges (
+    cycle_number integer not null,
+    side text not null check (side in ('bear', 'bull')),
+    param_set text not null,
+    box_id integer not null,
+    start_day integer not null,
+    start_timestamp text,
+    start_rate double precision,
+    extreme_day integer not null,
+    extreme_timestamp text,
+    extreme_rate double precision,
+    end_day integer not null,
+    end_timestamp text,
+    end_rate double precision,
+    move_percent double precision,
+    duration_days integer,
+    box_broken boolean,
+    updated_at timestamptz not null default now(),
+    primary key (cycle_number, side, param_set, box_id)
+);
+
+alter table public.bitcoin_box_ranges enable row level security;
+
+-- 읽기는 공개 (프론트엔드 anon key), 쓰기는 service role key(GitHub Secrets)로만
+drop policy if exists "bitcoin_box_ranges public read" on public.bitcoin_box_ranges;
+create policy "bitcoin_box_ranges public read"
+    on public.bitcoin_box_ranges
+    for select
+    using (true);
+
+comment on table public.bitcoin_box_ranges is
+    '사이클별 하락장/상승장 박스권 탐지 결과 (cycle_number, side, param_set, box_id)';
@@ -0,0 +1,31 @@
+-- ohlcv_1day_checksums: 센트 반올림을 double precision에서 계산
+-- numeric 컬럼을 그대로 반올림하면 반 센트 값(1.005 등)이 미러(float64)의 결과와 달라
+-- 매주 같은 구간을 다시 받게 되므로, 미러와 같은 정밀도로 바꾼 뒤 같은 식으로 반올림
+-- 01_BTC4year/backend/src/fourYear/ohlcv_mirror.py 의 checksum_cents 와 같은 정의를 유지할 것
+create or replace function public.ohlcv_1day_checksums(bucket_ms bigint)
+returns table (bucket bigint, row_count bigint, checksum bigint)
+language sql
+stable
+as $$
+    select
+        t.ts_ms / bucket_ms as bucket,
+        count(*) as row_count,
+        sum(
+            floor(t.close::double precision * 100 + 0.5)
+            + floor(t.low::double precision * 100 + 0.5)
+            + floor(t.high::double precision * 100 + 0.5)
+        )::bigint as checksum
+    from (
+        select
+            case
+                when "timestamp" < 10000000000 then "timestamp" * 1000
+                else "timestamp"
+            end as ts_ms,
+            close,
+            low,
+            high
+        from public.ohlcv_1day
+    ) t
+    group by 1
+    order by 1;
+$$;
@@ -0,0 +1,8 @@
+-- 시간봉(05 TIMEFRAME="4h"/"1h", points_per_day > 1) 박스는 경과일이 소수
+-- integer 컬럼이면 소수 경과일이 거부 / 절삭되므로 double precision으로 변경
+-- (일봉 값 16 -> 16 그대로, 기존 행 영향 없음)
+alter table public.bitcoin_box_ranges
+    alter column start_day type double precision,
+    alter column extreme_day type double precision,
+    alter column end_day type double precision,
+    alter column duration_days type double precision;